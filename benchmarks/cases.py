@@ -117,6 +117,16 @@ class Scenario:
             "Parallel: outer-grid distribution, shared flag (current default for exact mode).",
             {"work_distribution": "outer_grid", "flag_policy": "shared", **_R},
         ),
+        Scenario(
+            "parallel_outer_grid_probe",
+            "Parallel: outer-grid distribution, shared flag, coarse probe rows first.",
+            {
+                "work_distribution": "outer_grid",
+                "flag_policy": "shared",
+                "probe_stride": 4,
+                **_R,
+            },
+        ),
     ]
 }
 
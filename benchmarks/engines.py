@@ -83,6 +83,7 @@ def _run_pyaugmecon(
         "pareto_points": result.count,
         "models_solved": result.models_solved,
         "models_infeasible": result.models_infeasible,
+        "probe_solves": result.probe_solves,
     }
     return run, _signature(result.points, result.payoff_table)
 
@@ -0,0 +1,84 @@
+"""Hypervolume benchmark.
+
+python -m benchmarks.hypervolume
+python -m benchmarks.hypervolume --points 100,1000 --objectives 2,3,4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Iterable
+
+import numpy as np
+from pymoo.indicators.hv import HV
+
+from pyaugmecon.hypervolume import HypervolumeTracker, hypervolume
+
+
+def make_front(n: int, n_obj: int, seed: int = 0) -> np.ndarray:
+    """Mutually non-dominated points on the unit sphere (minimization)."""
+    points = np.random.default_rng(seed).random((n, n_obj))
+    return points / np.linalg.norm(points, axis=1, keepdims=True)
+
+
+def _best_time(fn, repeats: int) -> tuple[float, float]:
+    """Last value of `fn()` and its best time over `repeats` runs."""
+    best = float("inf")
+    value = 0.0
+    for _ in range(repeats):
+        started = time.perf_counter()
+        value = fn()
+        best = min(best, time.perf_counter() - started)
+    return value, best
+
+
+def _parse_ints(raw: str) -> list[int]:
+    return [int(v) for v in raw.split(",") if v.strip()]
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--points", default="100,500,1000")
+    p.add_argument("--objectives", default="2,3,4,5")
+    p.add_argument("--chunk", type=int, default=100, help="Tracker batch size.")
+    p.add_argument("--repeats", type=int, default=3)
+    args = p.parse_args(list(argv) if argv is not None else None)
+
+    header = (
+        f"{'n':>6} {'m':>2} {'hypervolume':>12} "
+        f"{'pymoo s':>9} {'exact s':>9} {'tracker s':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for n_obj in _parse_ints(args.objectives):
+        for n in _parse_ints(args.points):
+            points = make_front(n, n_obj)
+            ref = np.full(n_obj, 1.1)
+            indicator = HV(ref_point=ref)
+            expected, pymoo_s = _best_time(
+                lambda: float(indicator(points)),  # noqa: B023
+                args.repeats,
+            )
+            value, exact_s = _best_time(
+                lambda: hypervolume(points, ref),  # noqa: B023
+                args.repeats,
+            )
+            tracker = HypervolumeTracker(ref)
+            started = time.perf_counter()
+            for start in range(0, n, args.chunk):
+                tracker.add(points[start : start + args.chunk])
+            tracker_s = time.perf_counter() - started
+            if not np.isclose(value, expected) or not np.isclose(
+                tracker.value, expected
+            ):
+                raise AssertionError(f"Hypervolume differs for n={n} m={n_obj}")
+            print(
+                f"{n:>6} {n_obj:>2} {value:>12.6f} "
+                f"{pymoo_s:>9.4f} {exact_s:>9.4f} {tracker_s:>10.4f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""Non-dominated filtering benchmark.
+
+python -m benchmarks.pareto
+python -m benchmarks.pareto --points 1000,10000 --objectives 2,3,4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable, Iterable
+from functools import partial
+
+import numpy as np
+
+from pyaugmecon.pareto import ParetoArchive, nondominated_mask
+
+
+def reference_mask(points: np.ndarray) -> np.ndarray:
+    """The quadratic filter `undominated_mask` used before `pyaugmecon.pareto`."""
+    keep = np.ones(points.shape[0], dtype=bool)
+    for i, point in enumerate(points):
+        if keep[i]:
+            keep[keep] = np.any(points[keep] > point, axis=1)
+            keep[i] = True
+    return keep
+
+
+def make_points(kind: str, n: int, n_obj: int, seed: int = 0) -> np.ndarray:
+    """`front`: mostly non-dominated points on a simplex, rounded like grid
+    output (so with duplicates). `cloud`: uniform points, few non-dominated.
+    """
+    rng = np.random.default_rng(seed)
+    points = rng.random((n, n_obj))
+    if kind == "front":
+        points = np.round(points / points.sum(axis=1, keepdims=True), 3)
+    return points
+
+
+def _time[T](
+    fn: Callable[[np.ndarray], T], points: np.ndarray, repeats: int
+) -> tuple[T, float]:
+    """Last output of `fn(points)` and its best time over `repeats` runs."""
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        out = fn(points)
+        best = min(best, time.perf_counter() - started)
+    return out, best
+
+
+def _archive_front(points: np.ndarray, chunk: int) -> np.ndarray:
+    archive = ParetoArchive(points.shape[1])
+    for start in range(0, len(points), chunk):
+        archive.insert(points[start : start + chunk])
+    return archive.points
+
+
+def _parse_ints(raw: str) -> list[int]:
+    return [int(v) for v in raw.split(",") if v.strip()]
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--points", default="1000,10000,50000")
+    p.add_argument("--objectives", default="2,3,4,5")
+    p.add_argument("--kinds", default="front,cloud")
+    p.add_argument("--chunk", type=int, default=1000, help="Archive batch size.")
+    p.add_argument("--repeats", type=int, default=3)
+    p.add_argument(
+        "--reference-limit",
+        type=int,
+        default=20000,
+        help="Skip the quadratic baseline above this many points.",
+    )
+    args = p.parse_args(list(argv) if argv is not None else None)
+
+    header = (
+        f"{'kind':<6} {'n':>7} {'m':>2} {'kept':>7} "
+        f"{'reference s':>12} {'mask s':>9} {'archive s':>10} {'speedup':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for kind in args.kinds.split(","):
+        for n_obj in _parse_ints(args.objectives):
+            for n in _parse_ints(args.points):
+                points = make_points(kind, n, n_obj)
+                keep, mask_s = _time(nondominated_mask, points, args.repeats)
+                front, archive_s = _time(
+                    partial(_archive_front, chunk=args.chunk), points, args.repeats
+                )
+                if len(front) != keep.sum():
+                    raise AssertionError(f"Archive differs for {kind} n={n} m={n_obj}")
+                reference = "-"
+                speedup = "-"
+                if n <= args.reference_limit:
+                    expected, ref_s = _time(reference_mask, points, 1)
+                    if not np.array_equal(expected, keep):
+                        raise AssertionError(f"Masks differ for {kind} n={n} m={n_obj}")
+                    reference = f"{ref_s:.3f}"
+                    speedup = f"{ref_s / mask_s:.1f}x"
+                print(
+                    f"{kind:<6} {n:>7} {n_obj:>2} {int(keep.sum()):>7} "
+                    f"{reference:>12} {mask_s:>9.3f} {archive_s:>10.3f} {speedup:>8}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
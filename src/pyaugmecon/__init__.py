@@ -10,11 +10,13 @@
 )
 from .results import PyAugmeconResult as PyAugmeconResult, Solution as Solution
 from .solver.core import PyAugmecon as PyAugmecon
+from .solver.pool import WorkerPool as WorkerPool
 
 __all__ = [
     "PyAugmecon",
     "PyAugmeconConfig",
     "PyAugmeconResult",
     "Solution",
+    "WorkerPool",
     "__version__",
 ]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from multiprocessing import cpu_count
+from multiprocessing import cpu_count, get_all_start_methods
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
@@ -12,6 +12,10 @@
 WorkDistribution = Literal["auto", "dynamic", "fixed", "outer_grid"]
 FlagPolicy = Literal["auto", "local", "shared"]
 NadirStrategy = Literal["safe", "payoff"]
+VariableStorage = Literal["dict", "columnar"]
+VariableCapture = Literal["all", "nondominated"]
+StartMethod = Literal["spawn", "forkserver", "fork"]
+ArtifactFormat = Literal["csv", "parquet", "npz", "arrow"]
 
 
 class PyAugmeconConfig(BaseModel):
@@ -30,11 +34,22 @@ class PyAugmeconConfig(BaseModel):
 
     workers: int = Field(default_factory=cpu_count, ge=1)
     work_distribution: WorkDistribution = "auto"
+    work_stealing: bool = False
+    chunk_target_seconds: float | None = Field(default=None, gt=0)
+    probe_stride: int | None = Field(default=None, ge=2)
     flag_policy: FlagPolicy = "auto"
     process_timeout: float | None = Field(default=None, gt=0)
+    checkpoint_interval: float | None = Field(default=None, gt=0)
+    start_method: StartMethod = "spawn"
+    parallel_setup: bool = False
+    setup_cache: bool = False
 
     solve_warmstart: bool = True
     store_decision_variables: bool = False
+    variable_storage: VariableStorage = "dict"
+    variable_capture: VariableCapture = "all"
+    solution_cache_size: int = Field(default=0, ge=0)
+    result_buffer_size: int = Field(default=0, ge=0)
 
     early_exit: bool = True
     bypass: bool = True
@@ -47,6 +62,8 @@ class PyAugmeconConfig(BaseModel):
     artifact_folder: str = "logs"
     artifact_name: str | None = None
     write_csv: bool = True
+    artifact_formats: list[ArtifactFormat] = Field(default_factory=lambda: ["csv"])
+    async_artifacts: bool = False
     process_logging: bool = False
     progress_bar: bool = True
     log_to_console: bool = True
@@ -90,6 +107,15 @@ def _validate_artifact_name(cls, value: str | None) -> str | None:
             raise ValueError("`artifact_name` must not be blank when provided.")
         return value
 
+    @field_validator("start_method")
+    @classmethod
+    def _validate_start_method(cls, value: str) -> str:
+        if value not in get_all_start_methods():
+            raise ValueError(
+                f"`start_method='{value}'` is not available on this platform."
+            )
+        return value
+
     @field_validator("solver_options")
     @classmethod
     def _drop_none_solver_options(cls, value: dict[str, Any]) -> dict[str, Any]:
@@ -108,6 +134,15 @@ def _apply_defaults(self) -> PyAugmeconConfig:
         if not self.name:
             self.name = f"{self.solver_name}-{self.mode}"
 
+        # `artifact_formats` decides what is written; `write_csv=False` only
+        # drops `"csv"` from it, and afterwards mirrors whether CSV is in it.
+        self.artifact_formats = [
+            name
+            for name in dict.fromkeys(self.artifact_formats)
+            if name != "csv" or self.write_csv
+        ]
+        self.write_csv = "csv" in self.artifact_formats
+
         if self.mode == "sampled" and self.sample_points is None:
             raise ValueError("`sample_points` is required in sampled mode.")
         if self.mode == "exact" and self.sample_points is not None:
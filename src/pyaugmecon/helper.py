@@ -1,19 +1,41 @@
 """Utility helpers shared across the PyAugmecon runtime."""
 
-from multiprocessing import Value
+import multiprocessing
+import time
+from multiprocessing.context import BaseContext
 
 from tqdm.auto import tqdm
 
+# Imported once in the forkserver so forked workers start with them loaded.
+_FORKSERVER_PRELOAD = ["numpy", "pyomo.environ", "pyaugmecon.solver.worker"]
+
+
+def worker_context(start_method: str) -> BaseContext:
+    """Multiprocessing context for worker processes.
+
+    Shared objects (queues, arrays, `Counter`s) must come from the same
+    context as the processes that use them; a lock created under `fork`
+    cannot be handed to a `spawn` child.
+    """
+    ctx = multiprocessing.get_context(start_method)
+    if start_method == "forkserver":
+        ctx.set_forkserver_preload(_FORKSERVER_PRELOAD)  # ty: ignore[unresolved-attribute]
+    return ctx
+
 
 class Counter:
     """A small process-safe integer counter backed by shared memory.
 
     Uses ``multiprocessing.Value`` which provides its own internal lock,
-    so no separate ``Lock`` is needed.
+    so no separate ``Lock`` is needed. Pass the workers' `ctx` so the lock
+    matches their start method, and `typecode="q"` for totals that can pass
+    2**31.
     """
 
-    def __init__(self, init_val: int = 0):
-        self._val = Value("i", init_val)
+    def __init__(
+        self, init_val: int = 0, ctx: BaseContext | None = None, typecode: str = "i"
+    ):
+        self._val = (ctx or multiprocessing).Value(typecode, init_val)
 
     def add(self, amount: int = 1) -> None:
         """Atomically add `amount`. No-op when `amount == 0`."""
@@ -26,6 +48,27 @@ def value(self) -> int:
         return self._val.value
 
 
+class FirstMark:
+    """Process-safe earliest `time.time_ns()` stamp across processes.
+
+    Wall-clock nanoseconds so stamps taken in different worker processes
+    compare directly. `0` means nothing has been marked yet.
+    """
+
+    def __init__(self, ctx: BaseContext | None = None):
+        self._val = (ctx or multiprocessing).Value("q", 0)
+
+    def mark(self, at_ns: int | None = None) -> None:
+        """Record `at_ns` (default: now) if it is the earliest stamp so far."""
+        at_ns = time.time_ns() if at_ns is None else at_ns
+        with self._val.get_lock():
+            if not self._val.value or at_ns < self._val.value:
+                self._val.value = at_ns
+
+    def value(self) -> int:
+        return self._val.value
+
+
 class ProgressBar:
     """Wrap tqdm around a shared Counter for cross-process progress tracking.
 
@@ -0,0 +1,203 @@
+"""Exact hypervolume of a point set (minimization, like pymoo's `HV`).
+
+The hypervolume is the volume of the union of the boxes `[p, ref]` over all
+points `p`. Points that are not strictly better than `ref` in every
+objective add nothing. The method depends on the dimension:
+
+* 2 objectives: sweep along the first objective.
+* 3 objectives: sweep along the third objective. It keeps the 2-D front of
+  the points seen so far and updates that front's area per point.
+* 4+ objectives: WFG (While et al., 2012). Points are sorted worst-first in
+  the last objective. Each point's exclusive contribution then factors into
+  its height in that objective times a (d-1)-dimensional exclusive volume,
+  so the recursion bottoms out in the 3-D sweep.
+
+`HypervolumeTracker` keeps a running value as points arrive, adding one
+exclusive contribution at a time.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+
+import numpy as np
+
+from pyaugmecon.pareto import ParetoArchive, nondominated_mask
+
+
+def _minimal(points: np.ndarray) -> np.ndarray:
+    """The non-dominated rows of `points` under minimization."""
+    return points[nondominated_mask(-points)]
+
+
+def _hv_2d(points: np.ndarray, ref: np.ndarray) -> float:
+    # Along increasing x, the minimal points have decreasing y.
+    front = _minimal(points)
+    front = front[np.argsort(front[:, 0], kind="stable")]
+    upper = np.concatenate(([ref[1]], front[:-1, 1]))
+    return float(np.sum((ref[0] - front[:, 0]) * (upper - front[:, 1])))
+
+
+class _Staircase:
+    """2-D minimal front with its dominated area inside `ref`, updated per point."""
+
+    __slots__ = ("area", "ref_x", "ref_y", "xs", "ys")
+
+    def __init__(self, ref_x: float, ref_y: float) -> None:
+        self.ref_x = ref_x
+        self.ref_y = ref_y
+        # x strictly ascending, y strictly descending.
+        self.xs: list[float] = []
+        self.ys: list[float] = []
+        self.area = 0.0
+
+    def insert(self, x: float, y: float) -> float:
+        """Add `(x, y)`; return the area it adds."""
+        xs, ys = self.xs, self.ys
+        left = bisect_right(xs, x)
+        # The step at or just left of x has the lowest y among x' <= x.
+        if left and ys[left - 1] <= y:
+            return 0.0
+        # Steps from `left` on with y' >= y are now covered.
+        right = left
+        while right < len(xs) and ys[right] >= y:
+            right += 1
+        # Integrate the old height above y over [x, next remaining step).
+        gained = 0.0
+        height = ys[left - 1] if left else self.ref_y
+        position = x
+        for i in range(left, right):
+            gained += (xs[i] - position) * (height - y)
+            position, height = xs[i], ys[i]
+        end = xs[right] if right < len(xs) else self.ref_x
+        gained += (end - position) * (height - y)
+        # A step at exactly x is covered too.
+        start = left - 1 if left and xs[left - 1] == x else left
+        xs[start:right] = [x]
+        ys[start:right] = [y]
+        self.area += gained
+        return gained
+
+
+def _hv_3d(points: np.ndarray, ref: np.ndarray) -> float:
+    ordered = points[np.argsort(points[:, 2], kind="stable")]
+    stair = _Staircase(float(ref[0]), float(ref[1]))
+    volume = 0.0
+    rows = ordered.tolist()
+    for i, (x, y, z) in enumerate(rows):
+        stair.insert(x, y)
+        top = rows[i + 1][2] if i + 1 < len(rows) else float(ref[2])
+        volume += stair.area * (top - z)
+    return volume
+
+
+def _box(point: np.ndarray, ref: np.ndarray) -> float:
+    return float(np.prod(ref - point))
+
+
+def _wfg(front: np.ndarray, ref: np.ndarray) -> float:
+    """Hypervolume of minimal points that all lie strictly inside `ref`."""
+    n_obj = front.shape[1]
+    if len(front) == 0:
+        return 0.0
+    if len(front) == 1:
+        return _box(front[0], ref)
+    if n_obj == 1:
+        return float(ref[0] - front[:, 0].min())
+    if n_obj == 2:
+        return _hv_2d(front, ref)
+    if n_obj == 3:
+        return _hv_3d(front, ref)
+
+    # Worst-first in the last objective: every later point is at least as
+    # good there, so clipping it to an earlier point keeps that point's
+    # last coordinate and the exclusive volume factors by its height.
+    ordered = front[np.argsort(-front[:, -1], kind="stable")]
+    head_ref = ref[:-1]
+    volume = 0.0
+    for k, point in enumerate(ordered):
+        head = point[:-1]
+        exclusive = _box(head, head_ref)
+        if k + 1 < len(ordered):
+            clipped = _minimal(np.maximum(ordered[k + 1 :, :-1], head))
+            exclusive -= _wfg(clipped, head_ref)
+        volume += (ref[-1] - point[-1]) * exclusive
+    return volume
+
+
+def _inside(points: np.ndarray, ref: np.ndarray) -> np.ndarray:
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2 or points.shape[1] != len(ref):
+        raise ValueError(
+            f"`points` must have shape (n, {len(ref)}) to match the reference point."
+        )
+    return points[np.all(points < ref, axis=1)]
+
+
+def hypervolume(points: np.ndarray, ref: np.ndarray) -> float:
+    """Volume dominated by `points` and bounded by `ref` (minimization)."""
+    ref = np.asarray(ref, dtype=float)
+    points = _inside(points, ref)
+    if len(points) == 0:
+        return 0.0
+    return _wfg(_minimal(points), ref)
+
+
+def hypervolume_contribution(
+    point: np.ndarray, points: np.ndarray, ref: np.ndarray
+) -> float:
+    """Volume `point` adds to the hypervolume of `points`."""
+    ref = np.asarray(ref, dtype=float)
+    point = np.asarray(point, dtype=float)
+    if not np.all(point < ref):
+        return 0.0
+    others = _inside(points, ref)
+    exclusive = _box(point, ref)
+    if len(others):
+        exclusive -= _wfg(_minimal(np.maximum(others, point)), ref)
+    return max(0.0, exclusive)
+
+
+class HypervolumeTracker:
+    """Running hypervolume of the points added so far.
+
+    Each new point adds its exclusive contribution against the current
+    front, so `value` always equals `hypervolume` of everything added. With
+    2 objectives the front is a staircase that updates its area in place.
+    """
+
+    __slots__ = ("_front", "_stair", "ref", "value")
+
+    def __init__(self, ref: np.ndarray) -> None:
+        self.ref = np.asarray(ref, dtype=float)
+        # Minimal points, stored negated for the maximizing `ParetoArchive`.
+        self._front = ParetoArchive(len(self.ref))
+        self._stair = (
+            _Staircase(float(self.ref[0]), float(self.ref[1]))
+            if len(self.ref) == 2
+            else None
+        )
+        self.value = 0.0
+
+    @property
+    def front(self) -> np.ndarray:
+        if self._stair is not None:
+            return np.column_stack((self._stair.xs, self._stair.ys))
+        return -self._front.points
+
+    def add(self, points: np.ndarray) -> float:
+        """Add `points`; return how much the hypervolume grew."""
+        inside = _inside(points, self.ref)
+        if self._stair is not None:
+            gained = sum(self._stair.insert(x, y) for x, y in inside.tolist())
+            self.value += gained
+            return gained
+        gained = 0.0
+        for point in inside:
+            front = self.front
+            if np.any(np.all(front <= point, axis=1)):
+                continue
+            gained += hypervolume_contribution(point, front, self.ref)
+            self._front.insert(-point[None, :])
+        self.value += gained
+        return gained
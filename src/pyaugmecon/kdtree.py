@@ -0,0 +1,71 @@
+"""Static KD-tree for nearest-point queries on a Pareto front."""
+
+from __future__ import annotations
+
+import numpy as np
+
+_LEAF_SIZE = 16
+
+
+class KDTree:
+    """Nearest-neighbour index over the rows of `points` (Euclidean).
+
+    Built once by median splits on the widest dimension; leaves of up to
+    `leaf_size` rows are scanned with NumPy.
+    """
+
+    __slots__ = ("_nodes", "_order", "leaf_size", "points")
+
+    def __init__(self, points: np.ndarray, leaf_size: int = _LEAF_SIZE) -> None:
+        self.points = np.asarray(points, dtype=float)
+        if self.points.ndim != 2:
+            raise ValueError("`points` must be a 2-D array of shape (n, n_obj).")
+        self.leaf_size = leaf_size
+        self._order = np.arange(len(self.points))
+        # (start, stop, dim, split, left, right); dim == -1 marks a leaf.
+        self._nodes: list[tuple[int, int, int, float, int, int]] = []
+        if len(self.points):
+            self._build(0, len(self.points))
+
+    def _build(self, start: int, stop: int) -> int:
+        node = len(self._nodes)
+        rows = self.points[self._order[start:stop]]
+        if stop - start <= self.leaf_size:
+            self._nodes.append((start, stop, -1, 0.0, -1, -1))
+            return node
+        dim = int(np.argmax(rows.max(axis=0) - rows.min(axis=0)))
+        mid = (stop - start) // 2
+        part = np.argpartition(rows[:, dim], mid)
+        self._order[start:stop] = self._order[start:stop][part]
+        split = float(self.points[self._order[start + mid], dim])
+        self._nodes.append((start, stop, dim, split, -1, -1))
+        left = self._build(start, start + mid)
+        right = self._build(start + mid, stop)
+        self._nodes[node] = (start, stop, dim, split, left, right)
+        return node
+
+    def query(self, point: np.ndarray) -> tuple[float, int]:
+        """`(distance, row)` of the row nearest to `point`."""
+        if not self._nodes:
+            raise ValueError("Cannot query an empty KDTree.")
+        target = np.asarray(point, dtype=float)
+        best_dist, best_row = np.inf, -1
+        stack = [(0, 0.0)]
+        while stack:
+            node, bound = stack.pop()
+            if bound >= best_dist:
+                continue
+            start, stop, dim, split, left, right = self._nodes[node]
+            if dim < 0:
+                rows = self._order[start:stop]
+                dists = np.sqrt(np.sum((self.points[rows] - target) ** 2, axis=1))
+                i = int(np.argmin(dists))
+                if dists[i] < best_dist:
+                    best_dist, best_row = float(dists[i]), int(rows[i])
+                continue
+            gap = float(target[dim]) - split
+            near, far = (left, right) if gap < 0 else (right, left)
+            # Visit the near side first (pushed last).
+            stack.append((far, abs(gap)))
+            stack.append((near, bound))
+        return best_dist, best_row
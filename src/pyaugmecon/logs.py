@@ -94,7 +94,17 @@ def log_run_header(config: PyAugmeconConfig, version: str, artifact_dir: str) ->
 def log_run_summary(result: PyAugmeconResult) -> None:
     """Log the runtime and solver counts at solve end."""
     log.info(f"Done in {result.runtime_seconds:.2f}s")
-    log_row("Pareto", [("solutions", str(result.count))])
+    if result.first_solve_seconds is not None:
+        log_row("Startup", [("first solve", f"{result.first_solve_seconds:.2f}s")])
+    if result.setup_cache_hit is not None:
+        log_row("Setup", [("cache", "hit" if result.setup_cache_hit else "miss")])
+    log_row(
+        "Pareto",
+        [
+            ("solutions", str(result.count)),
+            ("finalize", f"{result.finalize_seconds:.2f}s"),
+        ],
+    )
     log_row(
         "Solver",
         [
@@ -103,3 +113,5 @@ def log_run_summary(result: PyAugmeconResult) -> None:
             ("skipped", str(result.skipped_points)),
         ],
     )
+    if result.probe_solves is not None:
+        log_row("Probe", [("solves", str(result.probe_solves))])
@@ -0,0 +1,157 @@
+"""Non-dominated filtering of objective points (maximization).
+
+A point is dropped when another point is at least as good in every
+objective. Of several identical points, the first is kept. Every method
+sorts the points lexicographically in descending order first. After that,
+a point can only be dominated by points before it:
+
+* 2 objectives: sweep, keeping the best second objective seen so far.
+* 3 objectives: sweep over a staircase of the (second, third) objectives
+  of the points kept so far.
+* 4+ objectives: divide and conquer (Kung et al.). Filter each half, then
+  drop points of the second half that a kept point of the first half covers.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+import numpy as np
+
+# Below this many points, the divide-and-conquer method filters directly.
+_BASE_CASE = 64
+# Pairwise comparisons per vectorized block when merging halves.
+_BLOCK_CELLS = 1 << 20
+
+
+def _descending_order(points: np.ndarray) -> np.ndarray:
+    """Row order by objectives descending, first objective most significant.
+
+    Ties keep input order, so the first of several equal rows comes first.
+    """
+    index = np.arange(points.shape[0])
+    return np.lexsort(
+        (index, *(-points[:, d] for d in reversed(range(points.shape[1]))))
+    )
+
+
+def _sweep_2d(ordered: np.ndarray) -> np.ndarray:
+    best = np.maximum.accumulate(ordered[:, 1])
+    keep = np.empty(len(ordered), dtype=bool)
+    keep[0] = True
+    keep[1:] = ordered[1:, 1] > best[:-1]
+    return keep
+
+
+def _sweep_3d(ordered: np.ndarray) -> np.ndarray:
+    keep = np.zeros(len(ordered), dtype=bool)
+    # Staircase of kept (y, z): y ascending, z strictly descending.
+    ys: list[float] = []
+    zs: list[float] = []
+    for i, (y, z) in enumerate(ordered[:, 1:].tolist()):
+        pos = bisect_left(ys, y)
+        # The first step with y' >= y has the largest z' among them.
+        if pos < len(ys) and zs[pos] >= z:
+            continue
+        keep[i] = True
+        # Steps with y' <= y and z' <= z are now covered by (y, z): the ones
+        # left of `pos` with z' <= z, and a step at `pos` with y' == y.
+        start, stop = pos, pos
+        while start > 0 and zs[start - 1] <= z:
+            start -= 1
+        if stop < len(ys) and ys[stop] == y:
+            stop += 1
+        ys[start:stop] = [y]
+        zs[start:stop] = [z]
+    return keep
+
+
+def _covered(front: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Which rows of `points` some row of `front` is at least as good as.
+
+    Callers pass `front` rows sorted before `points`, so the first objective
+    never needs checking.
+    """
+    covered = np.zeros(len(points), dtype=bool)
+    step = max(1, _BLOCK_CELLS // max(1, len(front)))
+    for start in range(0, len(points), step):
+        block = points[start : start + step]
+        hit = front[:, 1, None] >= block[None, :, 1]
+        for d in range(2, points.shape[1]):
+            hit &= front[:, d, None] >= block[None, :, d]
+        covered[start : start + step] = hit.any(axis=0)
+    return covered
+
+
+def _filter_sequential(ordered: np.ndarray) -> np.ndarray:
+    keep = np.ones(len(ordered), dtype=bool)
+    for i in range(len(ordered)):
+        if keep[i]:
+            later = keep[i + 1 :]
+            later &= ~np.all(ordered[i] >= ordered[i + 1 :], axis=1)
+    return keep
+
+
+def _divide_and_conquer(ordered: np.ndarray) -> np.ndarray:
+    if len(ordered) <= _BASE_CASE:
+        return _filter_sequential(ordered)
+    mid = len(ordered) // 2
+    top = _divide_and_conquer(ordered[:mid])
+    bottom = _divide_and_conquer(ordered[mid:])
+    candidates = np.flatnonzero(bottom)
+    bottom[candidates[_covered(ordered[:mid][top], ordered[mid:][candidates])]] = False
+    return np.concatenate((top, bottom))
+
+
+def nondominated_mask(points: np.ndarray) -> np.ndarray:
+    """Boolean mask of the non-dominated rows of `points` (maximization)."""
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2:
+        raise ValueError("`points` must be a 2-D array of shape (n, n_obj).")
+    n, n_obj = points.shape
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    if n_obj == 1:
+        keep[int(np.argmax(points[:, 0]))] = True
+        return keep
+
+    order = _descending_order(points)
+    ordered = points[order]
+    if n_obj == 2:
+        kept = _sweep_2d(ordered)
+    elif n_obj == 3:
+        kept = _sweep_3d(ordered)
+    else:
+        kept = _divide_and_conquer(ordered)
+    keep[order] = kept
+    return keep
+
+
+class ParetoArchive:
+    """Running non-dominated set, fed one batch of points at a time.
+
+    Points already in the archive win ties with equal new points, so after
+    any sequence of `insert` calls the archive holds what `nondominated_mask`
+    keeps from all inserted points in order.
+    """
+
+    __slots__ = ("_points",)
+
+    def __init__(self, n_obj: int) -> None:
+        self._points = np.empty((0, n_obj))
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    @property
+    def points(self) -> np.ndarray:
+        return self._points
+
+    def insert(self, points: np.ndarray) -> np.ndarray:
+        """Add `points`; return which of them entered the archive."""
+        points = np.asarray(points, dtype=float).reshape(-1, self._points.shape[1])
+        combined = np.vstack((self._points, points))
+        keep = nondominated_mask(combined)
+        self._points = combined[keep]
+        return keep[len(combined) - len(points) :]
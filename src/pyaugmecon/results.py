@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import functools
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
 
 import numpy as np
 from pymoo.indicators.hv import HV
 
+from pyaugmecon.kdtree import KDTree
+from pyaugmecon.pareto import ParetoArchive, nondominated_mask
+
 type Point = tuple[float, ...]
 type VariableValues = dict[object, float]
 type DecisionVariables = dict[str, VariableValues]
+# `(component name, index)` for each column of a columnar variable matrix.
+type VariableColumns = tuple[tuple[str, object], ...]
 
 
 @dataclass(frozen=True, slots=True)
@@ -20,14 +30,199 @@ class Solution:
     variables: DecisionVariables | None = None
 
 
-type WorkerChunk = list[Solution]
+@dataclass(frozen=True, slots=True)
+class ColumnarChunk:
+    """Worker output with decision variables stored as one float64 row each.
+
+    Row `i` of `values` belongs to `solutions[i]`, whose `variables` is None.
+    Column order is fixed per run (see `variable_columns`), so only the
+    numbers travel between processes.
+    """
+
+    solutions: list[Solution]
+    values: np.ndarray
+
+
+# Workers without decision-variable capture may ship bare points instead:
+# a `(k, n_obj)` float64 array read from a `PointRing`.
+type WorkerChunk = list[Solution] | ColumnarChunk | np.ndarray
+
+
+def variable_columns(variables: Iterable[Any]) -> VariableColumns:
+    """Column layout for columnar capture over Pyomo `Var` components.
+
+    Workers and the parent derive it from copies of the same model, so both
+    sides agree on the order without shipping names with every chunk.
+    """
+    return tuple((var.name, index) for var in variables for index in var)
+
+
+def row_variables(columns: VariableColumns, row: np.ndarray) -> DecisionVariables:
+    """Nested `{name: {index: value}}` view of one columnar variable row."""
+    variables: DecisionVariables = {}
+    for (name, index), value in zip(columns, row.tolist(), strict=True):
+        variables.setdefault(name, {})[index] = value
+    return variables
+
+
+def _variable_label(name: str, index: object) -> str:
+    """Column label for one variable, the way Pyomo names its data (`x[1,2]`)."""
+    if index is None:
+        return name
+    if isinstance(index, tuple):
+        return f"{name}[{','.join(map(str, index))}]"
+    return f"{name}[{index}]"
+
+
+def objective_table(points: np.ndarray) -> dict[str, np.ndarray]:
+    """One `objective_<k>` column (1-based) per column of `points`."""
+    return {f"objective_{k + 1}": points[:, k] for k in range(points.shape[1])}
+
+
+def variable_table(
+    columns: VariableColumns, values: np.ndarray
+) -> dict[str, np.ndarray]:
+    """One column of `values` per variable, labelled like Pyomo (`x[1,2]`)."""
+    return {
+        _variable_label(name, index): values[:, col]
+        for col, (name, index) in enumerate(columns)
+    }
+
+
+def import_pyarrow(caller: str) -> Any:
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+    except ImportError as exc:
+        raise RuntimeError(
+            f"`{caller}` requires the `pyarrow` package. "
+            "Install it with `pip install pyarrow`."
+        ) from exc
+    return pa
+
+
+def round_points(points: np.ndarray | Iterable[float], decimals: int) -> np.ndarray:
+    """Points rounded to `decimals`, the key used to merge near-duplicates.
+
+    Workers, streams and the final result all round through here, so they
+    agree on which points are equal.
+    """
+    return np.round(np.asarray(points, dtype=float), decimals)
+
+
+def stack_chunks(
+    chunks: Iterable[WorkerChunk], n_obj: int, column_count: int | None = None
+) -> tuple[np.ndarray, list[DecisionVariables | None], np.ndarray | None]:
+    """Concatenate worker chunks into one `(n, n_obj)` point array.
+
+    Also returns each row's `variables` (dict capture) and, with
+    `column_count`, the `(n, column_count)` columnar variable rows, NaN for
+    rows that arrived without one.
+    """
+    point_blocks: list[np.ndarray] = []
+    value_blocks: list[np.ndarray] = []
+    records: list[DecisionVariables | None] = []
+    for chunk in chunks:
+        values = None
+        if isinstance(chunk, np.ndarray):
+            block = chunk.reshape(-1, n_obj)
+            records.extend([None] * len(block))
+        else:
+            solutions = chunk.solutions if isinstance(chunk, ColumnarChunk) else chunk
+            block = np.array([s.point for s in solutions], dtype=float)
+            block = block.reshape(-1, n_obj)
+            records.extend(s.variables for s in solutions)
+            if isinstance(chunk, ColumnarChunk):
+                values = chunk.values[: len(block)]
+        point_blocks.append(block)
+        if column_count is not None:
+            if values is None:
+                values = np.full((len(block), column_count), np.nan)
+            value_blocks.append(values)
+
+    points = np.concatenate(point_blocks) if point_blocks else np.empty((0, n_obj))
+    matrix = None
+    if column_count is not None:
+        matrix = (
+            np.concatenate(value_blocks)
+            if value_blocks
+            else np.empty((0, column_count))
+        )
+    return points, records, matrix
+
+
+class SolutionStream:
+    """Turn worker chunks into new solutions while a sweep is running.
+
+    Points are rounded and de-duplicated like `from_worker_chunks` and come
+    out in the user's min/max frame, with columnar rows expanded to
+    `variables`. With `nondominated`, a point is only passed on if no point
+    seen so far (this batch included) dominates it; one passed on earlier
+    can still be dominated by a later point, so only the final result's
+    front is exact.
+    """
+
+    def __init__(
+        self,
+        *,
+        sign: tuple[int, ...],
+        round_decimals: int,
+        variable_columns: VariableColumns | None = None,
+        nondominated: bool = False,
+    ):
+        self.sign = np.array(sign, dtype=float)
+        self.round_decimals = round_decimals
+        self.variable_columns = variable_columns
+        self._seen: set[Point] = set()
+        # Undominated keys so far (maximization frame), for `nondominated`.
+        self._front = ParetoArchive(len(sign)) if nondominated else None
+
+    def push(self, chunks: Iterable[WorkerChunk]) -> list[Solution]:
+        """New solutions in `chunks`, in arrival order."""
+        columns = self.variable_columns
+        points, records, values = stack_chunks(
+            chunks, len(self.sign), None if columns is None else len(columns)
+        )
+        keys, new = self._new_rows(points)
+        fresh: list[Solution] = []
+        for row, point in zip(
+            new.tolist(), (keys[new] * self.sign).tolist(), strict=True
+        ):
+            variables = records[row]
+            if values is not None and columns is not None:
+                variables = row_variables(columns, values[row])
+            fresh.append(Solution(tuple(point), variables))
+        return fresh
+
+    def push_points(self, chunks: Iterable[WorkerChunk]) -> np.ndarray:
+        """Like `push`, but only the new points, as a `(k, n_obj)` array."""
+        keys, new = self._new_rows(stack_chunks(chunks, len(self.sign))[0])
+        return keys[new] * self.sign
+
+    def _new_rows(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Rounded `points` and the rows of them to pass on."""
+        keys = round_points(points, self.round_decimals)
+        rows: list[int] = []
+        for row, key in enumerate(map(tuple, keys.tolist())):
+            if key not in self._seen:
+                self._seen.add(key)
+                rows.append(row)
+        new = np.array(rows, dtype=np.intp)
+        if self._front is not None and len(new):
+            new = new[self._front.insert(keys[new])]
+        return keys, new
 
 
 @dataclass(slots=True)
 class PyAugmeconResult:
-    """Final solve result."""
+    """Final solve result.
 
-    solutions: tuple[Solution, ...]
+    Stored by column: row `i` of `points_array` is one Pareto point, and the
+    variables of that point are row `i` of `variable_values` (columnar
+    capture) or `variable_records[i]` (dict capture). `solutions` and
+    `points` are tuple views built from these on first access.
+    """
+
+    points_array: np.ndarray
     payoff_table: np.ndarray
     runtime_seconds: float
     models_solved: int
@@ -36,25 +231,68 @@ class PyAugmeconResult:
     grid_point_count: int
     decision_variables_stored: bool
     total_points: int
+    cache_hits: int = 0
+    cache_misses: int = 0
+    first_solve_seconds: float | None = None
+    setup_cache_hit: bool | None = None
+    finalize_seconds: float = 0.0
+    probe_solves: int | None = None
+    variable_columns: VariableColumns | None = field(default=None, repr=False)
+    variable_values: np.ndarray | None = field(default=None, repr=False)
+    variable_records: tuple[DecisionVariables | None, ...] | None = field(
+        default=None, repr=False
+    )
     _hypervolume: float | None = field(default=None, init=False, repr=False)
+    # Views and lookup structures, built on first use.
+    _points: tuple[Point, ...] | None = field(default=None, init=False, repr=False)
+    _solutions: tuple[Solution, ...] | None = field(
+        default=None, init=False, repr=False
+    )
+    _index: dict[Point, int] | None = field(default=None, init=False, repr=False)
+    _tree: KDTree | None = field(default=None, init=False, repr=False)
 
     @staticmethod
     def undominated_mask(points: np.ndarray) -> np.ndarray:
-        """Boolean mask of non-dominated rows (maximization)."""
-        keep = np.ones(points.shape[0], dtype=bool)
-        for i, point in enumerate(points):
-            if keep[i]:
-                keep[keep] = np.any(points[keep] > point, axis=1)
-                keep[i] = True
-        return keep
+        """Boolean mask of non-dominated rows (maximization).
+
+        See `pyaugmecon.pareto.nondominated_mask`.
+        """
+        return nondominated_mask(points)
 
     @property
     def points(self) -> tuple[Point, ...]:
-        return tuple(s.point for s in self.solutions)
+        if self._points is None:
+            self._points = tuple(map(tuple, self.points_array.tolist()))
+        return self._points
+
+    @property
+    def solutions(self) -> tuple[Solution, ...]:
+        """`Solution` records over `points_array` (compatibility view).
+
+        Columnar variables are expanded to `Solution.variables` here, so the
+        view reads the same for both `variable_storage` settings.
+        """
+        if self._solutions is None:
+            self._solutions = tuple(
+                Solution(point, self._variables_at(idx))
+                for idx, point in enumerate(self.points)
+            )
+        return self._solutions
+
+    def _variables_at(self, idx: int) -> DecisionVariables | None:
+        """Variables of row `idx`, or None if that row arrived without any."""
+        if self.variable_values is not None and self.variable_columns is not None:
+            row = self.variable_values[idx]
+            if np.isnan(row).all():
+                return None
+            return row_variables(self.variable_columns, row)
+        if self.variable_records is not None:
+            return self.variable_records[idx]
+        return None
 
     @property
     def count(self) -> int:
-        return len(self.solutions)
+        return len(self.points_array)
 
     @property
     def skipped_points(self) -> int:
@@ -63,20 +301,41 @@ def skipped_points(self) -> int:
     def hypervolume(self) -> float:
         """Hypervolume of the Pareto front. Cached after first call."""
         if self._hypervolume is None:
-            if not self.solutions:
+            if not self.count:
                 self._hypervolume = 0.0
             else:
                 indicator = HV(ref_point=np.diag(self.payoff_table))
-                self._hypervolume = float(indicator(np.array(self.points, dtype=float)))
+                self._hypervolume = float(indicator(self.points_array))
         return self._hypervolume
 
+    def _solution_index(self, point: Point) -> int:
+        if self._index is None:
+            # Points are already rounded, so equal keys hash alike.
+            self._index = {point: idx for idx, point in enumerate(self.points)}
+        idx = self._index.get(tuple(float(v) for v in point))
+        if idx is None:
+            raise ValueError(f"Solution not found: {point}")
+        return idx
+
+    def nearest(self, point: Point, *, tol: float | None = None) -> Solution:
+        """The solution closest to `point` (Euclidean distance).
+
+        With `tol`, raise `ValueError` if it is farther away than that.
+        """
+        if not self.count:
+            raise ValueError("The result has no solutions.")
+        if self._tree is None:
+            self._tree = KDTree(self.points_array)
+        distance, idx = self._tree.query(np.asarray(point, dtype=float))
+        if tol is not None and distance > tol:
+            raise ValueError(
+                f"No solution within {tol} of {point} (nearest is {distance:.6g} away)."
+            )
+        return self.solutions[idx]
+
     def solution_for(self, point: Point) -> Solution:
         """Look up a solution by its point (as seen in `points`)."""
-        key = tuple(float(v) for v in point)
-        for solution in self.solutions:
-            if solution.point == key:
-                return solution
-        raise ValueError(f"Solution not found: {point}")
+        return self.solutions[self._solution_index(point)]
 
     def variables_for(self, point: Point) -> DecisionVariables:
         """Decision variables for a Pareto point.
@@ -88,10 +347,91 @@ def variables_for(self, point: Point) -> DecisionVariables:
                 "Decision-variable extraction is disabled. "
                 "Set `store_decision_variables=True` to enable it."
             )
-        solution = self.solution_for(point)
-        if solution.variables is None:
+        # Columnar capture rebuilds the nested view for this point only.
+        variables = self._variables_at(self._solution_index(point))
+        if variables is None:
             raise RuntimeError("No decision variables are stored for this solution.")
-        return solution.variables
+        return variables
+
+    def variables_frame(self) -> Any:
+        """All decision variables as a pandas `DataFrame`.
+
+        One row per solution, in `solutions` order (aligned with
+        `points_array`); one column per `(component name, index)`, with NaN
+        where a solution has no value. Requires `pandas` and
+        `store_decision_variables=True`.
+        """
+        if not self.decision_variables_stored:
+            raise RuntimeError(
+                "Decision-variable extraction is disabled. "
+                "Set `store_decision_variables=True` to enable it."
+            )
+        try:
+            import pandas as pd  # noqa: PLC0415
+        except ImportError as exc:
+            raise RuntimeError(
+                "`variables_frame()` requires the `pandas` package. "
+                "Install it with `pip install pandas`."
+            ) from exc
+
+        columns, values = self.variable_matrix()
+        if not columns:
+            return pd.DataFrame(index=range(self.count))
+        return pd.DataFrame(values, columns=pd.MultiIndex.from_tuples(columns))
+
+    def variable_matrix(self) -> tuple[VariableColumns, np.ndarray]:
+        """Column layout and `(count, columns)` values of the stored variables."""
+        if self.variable_values is not None and self.variable_columns is not None:
+            return self.variable_columns, self.variable_values
+        records = self.variable_records or ()
+        slots: dict[tuple[str, object], int] = {}
+        for variables in records:
+            for name, values in (variables or {}).items():
+                for index in values:
+                    slots.setdefault((name, index), len(slots))
+        matrix = np.full((self.count, len(slots)), np.nan, order="F")
+        for row, variables in enumerate(records):
+            for name, values in (variables or {}).items():
+                for index, value in values.items():
+                    matrix[row, slots[name, index]] = value
+        return tuple(slots), matrix
+
+    def _export_columns(self) -> dict[str, np.ndarray]:
+        """`objective_table` columns, then `variable_table` columns if stored."""
+        columns = objective_table(self.points_array)
+        if self.decision_variables_stored:
+            columns |= variable_table(*self.variable_matrix())
+        return columns
+
+    def to_npz(self, path: str | Path) -> None:
+        """Write `points`, `payoff_table` and, if stored, the variable matrix
+        (`variable_values`, labelled by `variable_labels`) to an `.npz` file.
+        """
+        arrays = {"points": self.points_array, "payoff_table": self.payoff_table}
+        if self.decision_variables_stored:
+            labels, values = self.variable_matrix()
+            arrays["variable_values"] = values
+            arrays["variable_labels"] = np.array(list(variable_table(labels, values)))
+        np.savez(path, **arrays)
+
+    def to_arrow(self) -> Any:
+        """One row per solution as a `pyarrow.Table` (see `to_npz` for columns).
+
+        Columns are Fortran-ordered in memory, so each one is handed to Arrow
+        without a copy. Requires `pyarrow`.
+        """
+        pa = import_pyarrow("to_arrow()")
+        columns = self._export_columns()
+        return pa.Table.from_arrays(
+            [pa.array(values) for values in columns.values()], names=list(columns)
+        )
+
+    def to_parquet(self, path: str | Path) -> None:
+        """Write `to_arrow()` to a Parquet file. Requires `pyarrow`."""
+        import_pyarrow("to_parquet()")
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        pq.write_table(self.to_arrow(), path)
 
     @classmethod
     def from_worker_chunks(
@@ -107,44 +447,56 @@ def from_worker_chunks(
         grid_point_count: int,
         decision_variables_stored: bool,
         round_decimals: int,
+        variable_columns: VariableColumns | None = None,
+        cache_hits: int = 0,
+        cache_misses: int = 0,
+        first_solve_seconds: float | None = None,
+        setup_cache_hit: bool | None = None,
+        probe_solves: int | None = None,
     ) -> PyAugmeconResult:
         """Build a result from worker output.
 
-        Round to dedupe near-duplicates, drop dominated points, then flip
-        signs back to the user's original min/max frame.
+        Works on the stacked points: round to dedupe near-duplicates, drop
+        dominated points, then flip signs back to the user's original min/max
+        frame. Variables follow their point and end up aligned with
+        `points_array`. The time spent here is reported as `finalize_seconds`.
         """
-        # Round each point and keep one solution per rounded key (first wins).
-        unique: dict[Point, Solution] = {}
-        for chunk in worker_chunks:
-            for sol in chunk:
-                key = tuple(round(float(v), round_decimals) for v in sol.point)
-                unique.setdefault(key, Solution(key, sol.variables))
-
-        # Drop dominated solutions, then flip signs back to the user's
-        # original min/max frame and sort.
+        started = time.perf_counter()
         sign_arr = np.array(sign, dtype=float)
-        if unique:
-            kept_mask = PyAugmeconResult.undominated_mask(
-                np.array(list(unique), dtype=float)
-            )
-            solutions = tuple(
-                sorted(
-                    (
-                        Solution(tuple(np.array(s.point) * sign_arr), s.variables)
-                        for s, keep in zip(unique.values(), kept_mask, strict=False)
-                        if keep
-                    ),
-                    key=lambda s: s.point,
-                )
-            )
-        else:
-            solutions = ()
+        points, records, values = stack_chunks(
+            worker_chunks,
+            len(sign_arr),
+            None if variable_columns is None else len(variable_columns),
+        )
+
+        # Keep the first row of each rounded key, in arrival order.
+        keys = round_points(points, round_decimals)
+        _, first = np.unique(keys, axis=0, return_index=True)
+        first.sort()
+
+        # Drop dominated points, flip signs back to the user's original
+        # min/max frame, and sort ascending (first objective most significant).
+        kept = first[nondominated_mask(keys[first])]
+        front = keys[kept] * sign_arr
+        order = np.lexsort(front.T[::-1])
+        kept = kept[order]
+        # Column-major, so each objective (and variable) column is contiguous.
+        front = np.asfortranarray(front[order])
+        front.flags.writeable = False
+
+        variable_values = None
+        variable_records = None
+        if values is not None:
+            variable_values = np.asfortranarray(values[kept])
+            variable_values.flags.writeable = False
+        elif decision_variables_stored:
+            variable_records = tuple(records[row] for row in kept.tolist())
 
         payoff = np.asarray(payoff_table, dtype=float) * sign_arr
         payoff.flags.writeable = False
 
         return cls(
-            solutions=solutions,
+            points_array=front,
             payoff_table=payoff,
             runtime_seconds=runtime_seconds,
             models_solved=models_solved,
@@ -152,5 +504,45 @@ def from_worker_chunks(
             visited_points=visited_points,
             grid_point_count=grid_point_count,
             decision_variables_stored=decision_variables_stored,
-            total_points=len(unique),
+            total_points=len(first),
+            cache_hits=cache_hits,
+            cache_misses=cache_misses,
+            first_solve_seconds=first_solve_seconds,
+            setup_cache_hit=setup_cache_hit,
+            probe_solves=probe_solves,
+            variable_columns=variable_columns,
+            variable_values=variable_values,
+            variable_records=variable_records,
+            finalize_seconds=time.perf_counter() - started,
         )
+
+
+_dataclass_init = PyAugmeconResult.__init__
+
+
+@functools.wraps(_dataclass_init)
+def _init_from_solutions(
+    self: PyAugmeconResult,
+    *args: Any,
+    solutions: Iterable[Solution] | None = None,
+    **kwargs: Any,
+) -> None:
+    """Accept the pre-columnar `solutions=` keyword.
+
+    The records are stacked into `points_array` (and `variable_records` when
+    any of them carries variables), so direct constructors written against
+    the old signature keep working.
+    """
+    if solutions is not None:
+        if args or "points_array" in kwargs:
+            raise TypeError("Pass either `solutions` or `points_array`, not both.")
+        records = tuple(solutions)
+        width = len(kwargs.get("payoff_table", ()))
+        points = np.array([s.point for s in records], dtype=float)
+        kwargs["points_array"] = np.asfortranarray(points.reshape(len(records), width))
+        if "variable_records" not in kwargs and any(s.variables for s in records):
+            kwargs["variable_records"] = tuple(s.variables for s in records)
+    _dataclass_init(self, *args, **kwargs)
+
+
+PyAugmeconResult.__init__ = _init_from_solutions  # ty: ignore
@@ -8,14 +8,16 @@
 from typing import Any
 
 import pyomo.environ as pyo
+from pyomo.repn import generate_standard_repn
 
 from pyaugmecon.config import PyAugmeconConfig
 
 # Backend preference order: direct/appsi first, persistent last.
-# AUGMECON's inner loop only mutates one Param value per solve, so the
-# overhead of persistent-backend Python-side change tracking (`solver.update()`)
-# tends to dominate the cost of rebuilding via direct backends. Users who
-# measure otherwise can pass the persistent name explicitly via `solver_name`.
+# Persistent backends skip the per-solve rebuild: after `set_instance` they
+# only push the new epsilon right-hand sides through the native API (see
+# `_prepare_persistent_backend`). They stay last because they need a
+# vendor-specific binding and fail for models a direct backend can handle.
+# Users who measure them faster can pass the persistent name via `solver_name`.
 SOLVER_FALLBACKS = {
     "highs": ("appsi_highs",),
     "gurobi": ("gurobi_direct", "appsi_gurobi", "gurobi_persistent", "gurobi"),
@@ -25,6 +27,12 @@
     "scip": ("scip",),
 }
 
+# Opt-in engine that drives `highspy` directly for the grid sweep (see
+# `highs_native.py`). Pyomo has no plugin by this name, so setup solves
+# (payoff table, nadirs) resolve through the HiGHS family instead.
+HIGHS_NATIVE_ENGINE = "highspy_native"
+_SETUP_FAMILY_BY_ENGINE = {HIGHS_NATIVE_ENGINE: "highs"}
+
 # Some Python packages provide a solver runtime without necessarily exposing the
 # command-line executable names that Pyomo's selected backend plugins expect.
 # This maps the common mismatch so errors can guide users to a working backend.
@@ -54,8 +62,8 @@
 
 # Per-backend behavior, kept as flat lookups:
 #
-# * `_PERSISTENT_BACKENDS`: bound via `set_instance` and refreshed via `update()`
-#   before each solve.
+# * `_PERSISTENT_BACKENDS`: bound once via `set_instance`; later solves only
+#   rewrite the epsilon-constraint right-hand sides (`_PERSISTENT_RHS_SETTERS`).
 # * `_GUROBI_MANAGE_ENV_BACKENDS`: accept `manage_env=True` at factory construction
 #   (Gurobi only). The bare "gurobi" shim only honors it under the
 #   direct/python solver_io paths; that case is handled in `_solver_factory_kwargs`.
@@ -191,10 +199,12 @@ def select_solver(
 
     Families such as `highs` and `gurobi` map to multiple Pyomo plugins. This
     function tries the configured fallbacks in priority order and returns the
-    first backend that can be constructed and marked available.
+    first backend that can be constructed and marked available. Native sweep
+    engines resolve to the Pyomo family used for their setup solves.
     """
     requested = str(config.solver_name)
-    candidates = SOLVER_FALLBACKS.get(requested, (requested,))
+    family = _SETUP_FAMILY_BY_ENGINE.get(requested, requested)
+    candidates = SOLVER_FALLBACKS.get(family, (family,))
     attempts: list[str] = []
     failures: list[str] = []
 
@@ -226,7 +236,7 @@ def select_solver(
 
     detail = "; ".join(failures) if failures else "no candidate backends attempted"
     package_hint = ""
-    hint = _PACKAGE_HINTS.get(requested)
+    hint = _PACKAGE_HINTS.get(family)
     if hint:
         package_hint = f" {hint}"
     raise RuntimeError(
@@ -236,26 +246,110 @@ def select_solver(
     )
 
 
+def _set_rhs_gurobi(solver: SolverLike, con: Any, rhs: float) -> None:
+    # Pyomo's `set_linear_constraint_attr` refuses "RHS"; gurobipy applies
+    # the pending change at the next `optimize`.
+    solver._pyomo_con_to_solver_con_map[con].RHS = rhs
+
+
+def _set_rhs_cplex(solver: SolverLike, con: Any, rhs: float) -> None:
+    name = solver._pyomo_con_to_solver_con_map[con]
+    solver._solver_model.linear_constraints.set_rhs(name, rhs)
+
+
+def _set_rhs_xpress(solver: SolverLike, con: Any, rhs: float) -> None:
+    handle = solver._pyomo_con_to_solver_con_map[con]
+    solver._solver_model.chgrhs([handle], [rhs])
+
+
+# Native right-hand-side writers for persistent backends. Pyomo's persistent
+# interfaces compile mutable Params into constants at `set_instance`, so an
+# epsilon change must reach the solver model directly, through the native
+# constraint handle Pyomo recorded.
+_PERSISTENT_RHS_SETTERS = {
+    "gurobi_persistent": _set_rhs_gurobi,
+    "cplex_persistent": _set_rhs_cplex,
+    "xpress_persistent": _set_rhs_xpress,
+}
+
+
+def _epsilon_rows(model: pyo.ConcreteModel) -> tuple[tuple[Any, Any, float], ...]:
+    """`(constraint, epsilon param, body constant)` per epsilon constraint.
+
+    Solvers move the body constant to the right-hand side, so the native RHS
+    is `eps - constant`. Empty before `Model.convert_prob` (setup solves).
+    """
+    constraint_list = model.component("_pyaugmecon_constraint_list")
+    if constraint_list is None:
+        return ()
+    epsilon_param = model._pyaugmecon_eps
+    return tuple(
+        (
+            constraint_list[pos + 1],  # ty: ignore[not-subscriptable]
+            epsilon_param[component_idx],  # ty: ignore[not-subscriptable]
+            float(generate_standard_repn(constraint_list[pos + 1].body).constant),  # ty: ignore[not-subscriptable]
+        )
+        for pos, component_idx in enumerate(model._pyaugmecon_os)  # ty: ignore[not-iterable]
+    )
+
+
+def _model_signature(model: pyo.ConcreteModel) -> tuple[object, ...]:
+    """Model state besides epsilon values that a bound solver must follow.
+
+    Covers what AUGMECON itself changes between solves: the active objective
+    and its sense, and the payoff-table equalities. Variable bounds and
+    fixings are not watched; the grid loop never changes them.
+    """
+    objectives = tuple(
+        (id(objective), objective.sense)
+        for objective in model.component_data_objects(pyo.Objective, active=True)
+    )
+    payoff = model.component("_pyaugmecon_payoff_constraint_list")
+    return objectives, 0 if payoff is None else len(payoff)  # ty: ignore[invalid-argument-type]
+
+
+def _bind_persistent(model: pyo.ConcreteModel, solver: SolverLike) -> None:
+    # `set_instance` compiles the current model, epsilon values included.
+    solver.set_instance(model)
+    solver._pyaugmecon_attached_model = model
+    solver._pyaugmecon_signature = _model_signature(model)
+    solver._pyaugmecon_epsilon_rows = _epsilon_rows(model)
+
+
 def _prepare_persistent_backend(
     model: pyo.ConcreteModel,
     solver: SolverLike,
     backend_name: str,
 ) -> None:
-    """For persistent backends, bind the model via set_instance/update.
-
-    Every Pyomo persistent backend (gurobi/cplex/xpress) exposes both methods,
-    so we call them directly. AUGMECON solves the same model thousands of times,
-    so the `_attached_model_id` cache avoids re-binding on every solve.
+    """For persistent backends, bind the model once and refresh epsilon RHS.
+
+    AUGMECON solves the same model thousands of times and only the epsilon
+    Params change between grid points, so the `_attached_model` cache binds
+    once via `set_instance` and every later solve writes just those rows'
+    right-hand sides through the native API instead of re-scanning the model.
+    The cache holds the model itself, not its `id()`: a solver kept warm by a
+    `WorkerPool` may see a later run's model at a recycled address.
+
+    Anything else falls back to binding again: a changed `_model_signature`,
+    or a native handle that is missing (the CPLEX and XPRESS setters read
+    Pyomo internals). Pyomo's persistent `update()` does not re-read mutable
+    Params, so it cannot serve as the fallback.
     """
     if backend_name not in _PERSISTENT_BACKENDS:
         return
 
-    model_id = id(model)
-    if getattr(solver, "_pyaugmecon_attached_model_id", None) != model_id:
-        solver.set_instance(model)
-        solver._pyaugmecon_attached_model_id = model_id
+    if getattr(
+        solver, "_pyaugmecon_attached_model", None
+    ) is not model or solver._pyaugmecon_signature != _model_signature(model):
+        _bind_persistent(model, solver)
+        return
 
-    solver.update()
+    set_rhs = _PERSISTENT_RHS_SETTERS[backend_name]
+    try:
+        for con, epsilon, constant in solver._pyaugmecon_epsilon_rows:
+            set_rhs(solver, con, float(epsilon.value) - constant)
+    except (AttributeError, KeyError):
+        _bind_persistent(model, solver)
 
 
 # Mapping from raw Pyomo termination conditions to our stable `SolveOutcome`.
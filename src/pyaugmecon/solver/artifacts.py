@@ -0,0 +1,349 @@
+"""Background writer for a run's artifact tables.
+
+Each table is a mapping of column names to 1-D arrays and goes out in every
+configured format: `csv`, `parquet`, `npz` or `arrow` (Arrow IPC file). CSV
+tables keep the headerless layout of earlier releases, except
+`variables.csv`, whose header holds the variable labels.
+
+Files written under the artifact directory:
+
+* `epsilon_grid.*`: epsilon levels per constrained objective (internal
+  maximization frame). One CSV row per objective; other formats use
+  `objective` (1-based) and `epsilon` columns.
+* `payoff_table.*`: the lexicographic payoff table.
+* `found_points.*`: every distinct point in arrival order, appended while
+  the sweep runs. Includes points that later turn out dominated.
+* `solutions.*`: the final Pareto front.
+* `variables.*`: decision variables aligned with `solutions`, when stored.
+"""
+
+from __future__ import annotations
+
+import csv
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from queue import SimpleQueue
+from typing import Any, ClassVar
+
+import numpy as np
+from loguru import logger as log
+
+from pyaugmecon.results import (
+    PyAugmeconResult,
+    SolutionStream,
+    WorkerChunk,
+    import_pyarrow,
+    objective_table,
+    variable_table,
+)
+
+type Table = dict[str, np.ndarray]
+
+
+class _TableStream(ABC):
+    """A table with columns `names`, opened for appending."""
+
+    def __init__(self, names: Sequence[str]) -> None:
+        self.names = list(names)
+
+    @abstractmethod
+    def append(self, table: Table) -> None: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+class _TableFormat(ABC):
+    """How whole tables and appended tables are written in one format."""
+
+    suffix: ClassVar[str]
+
+    @abstractmethod
+    def write(self, path: Path, table: Table) -> None: ...
+
+    def write_labelled(self, path: Path, table: Table) -> None:
+        """Write a table whose column names matter to readers."""
+        self.write(path, table)
+
+    @abstractmethod
+    def open_stream(self, path: Path, names: Sequence[str]) -> _TableStream: ...
+
+    def write_grid(self, path: Path, grid: dict[int, np.ndarray]) -> None:
+        """Epsilon levels per objective in long form: `objective`, `epsilon`."""
+        levels = [np.asarray(row, dtype=float) for row in grid.values()]
+        self.write(
+            path,
+            {
+                "objective": np.repeat(list(grid), [len(row) for row in levels]),
+                "epsilon": np.concatenate(levels) if levels else np.empty(0),
+            },
+        )
+
+
+def _rows(table: Table) -> Iterable[tuple[Any, ...]]:
+    return zip(*(column.tolist() for column in table.values()), strict=True)
+
+
+class _CsvStream(_TableStream):
+    def __init__(self, path: Path, names: Sequence[str]) -> None:
+        super().__init__(names)
+        self._handle = path.open("w", newline="")
+        self._writer = csv.writer(self._handle)
+
+    def append(self, table: Table) -> None:
+        self._writer.writerows(_rows(table))
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class _CsvFormat(_TableFormat):
+    suffix = ".csv"
+
+    def write(self, path: Path, table: Table) -> None:
+        with path.open("w", newline="") as handle:
+            csv.writer(handle).writerows(_rows(table))
+
+    def write_labelled(self, path: Path, table: Table) -> None:
+        with path.open("w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(table)
+            writer.writerows(_rows(table))
+
+    def open_stream(self, path: Path, names: Sequence[str]) -> _TableStream:
+        return _CsvStream(path, names)
+
+    def write_grid(self, path: Path, grid: dict[int, np.ndarray]) -> None:
+        # One row of levels per objective, as in earlier releases.
+        with path.open("w", newline="") as handle:
+            csv.writer(handle).writerows(
+                np.asarray(row).tolist() for row in grid.values()
+            )
+
+
+class _NpzStream(_TableStream):
+    """NPZ files cannot grow, so appended tables are written on close."""
+
+    def __init__(self, path: Path, names: Sequence[str]) -> None:
+        super().__init__(names)
+        self._path = path
+        self._parts: dict[str, list[np.ndarray]] = {name: [] for name in names}
+
+    def append(self, table: Table) -> None:
+        for name, column in table.items():
+            self._parts[name].append(column)
+
+    def close(self) -> None:
+        np.savez(
+            self._path,
+            **{
+                name: np.concatenate(parts) if parts else np.empty(0)
+                for name, parts in self._parts.items()
+            },
+        )
+
+
+class _NpzFormat(_TableFormat):
+    suffix = ".npz"
+
+    def write(self, path: Path, table: Table) -> None:
+        np.savez(path, **table)
+
+    def open_stream(self, path: Path, names: Sequence[str]) -> _TableStream:
+        return _NpzStream(path, names)
+
+
+class _ArrowStream(_TableStream):
+    """Appends record batches through a pyarrow writer opened on first use."""
+
+    def __init__(
+        self, pa: Any, open_writer: Callable[[Any], Any], names: Sequence[str]
+    ) -> None:
+        super().__init__(names)
+        self._pa = pa
+        self._open_writer = open_writer
+        self._writer: Any = None
+
+    def append(self, table: Table) -> None:
+        arrow = _arrow_table(self._pa, table)
+        if self._writer is None:
+            self._writer = self._open_writer(arrow.schema)
+        self._writer.write_table(arrow)
+
+    def close(self) -> None:
+        if self._writer is None:
+            # Nothing arrived: still leave a readable, empty file.
+            self.append({name: np.empty(0) for name in self.names})
+        self._writer.close()
+
+
+def _arrow_table(pa: Any, table: Table) -> Any:
+    # Contiguous float64 columns are wrapped without a copy.
+    return pa.Table.from_arrays(
+        [pa.array(column) for column in table.values()], names=list(table)
+    )
+
+
+class _ParquetFormat(_TableFormat):
+    suffix = ".parquet"
+
+    def __init__(self) -> None:
+        self._pa = import_pyarrow("artifact_formats=['parquet']")
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        self._pq = pq
+
+    def write(self, path: Path, table: Table) -> None:
+        self._pq.write_table(_arrow_table(self._pa, table), path)
+
+    def open_stream(self, path: Path, names: Sequence[str]) -> _TableStream:
+        return _ArrowStream(
+            self._pa, lambda schema: self._pq.ParquetWriter(path, schema), names
+        )
+
+
+class _ArrowFormat(_TableFormat):
+    suffix = ".arrow"
+
+    def __init__(self) -> None:
+        self._pa = import_pyarrow("artifact_formats=['arrow']")
+
+    def write(self, path: Path, table: Table) -> None:
+        arrow = _arrow_table(self._pa, table)
+        with self._pa.ipc.new_file(str(path), arrow.schema) as writer:
+            writer.write_table(arrow)
+
+    def open_stream(self, path: Path, names: Sequence[str]) -> _TableStream:
+        return _ArrowStream(
+            self._pa, lambda schema: self._pa.ipc.new_file(str(path), schema), names
+        )
+
+
+_FORMATS: dict[str, type[_TableFormat]] = {
+    "csv": _CsvFormat,
+    "parquet": _ParquetFormat,
+    "npz": _NpzFormat,
+    "arrow": _ArrowFormat,
+}
+
+
+class ArtifactWriter:
+    """Write one run's artifact tables under `folder` on a background thread.
+
+    Methods only queue work; jobs run in call order. `finish` ends the queue
+    without waiting; `close` also waits for it to empty and, with `check`,
+    re-raises the first write error. After an error the remaining jobs are
+    skipped. The thread is not a daemon, so queued writes complete before the
+    interpreter exits.
+    """
+
+    def __init__(
+        self,
+        folder: Path,
+        formats: Sequence[str],
+        *,
+        sign: tuple[int, ...],
+        round_decimals: int,
+    ) -> None:
+        # Build formats here so a missing optional package fails the run early.
+        self.formats = [_FORMATS[name]() for name in formats]
+        self.folder = folder
+        self._found = SolutionStream(sign=sign, round_decimals=round_decimals)
+        self._found_names = list(objective_table(np.empty((0, len(sign)))))
+        self._found_streams: list[_TableStream] | None = None
+        self._jobs: SimpleQueue[Callable[[], None] | None] = SimpleQueue()
+        self._error: BaseException | None = None
+        self._closed = False
+        folder.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._work, name="pyaugmecon-artifacts")
+        self._thread.start()
+
+    def _work(self) -> None:
+        while (job := self._jobs.get()) is not None:
+            self._run(job)
+        # Always close the appended files, even after an error.
+        for found in self._found_streams or ():
+            self._run(found.close, after_error=True)
+
+    def _run(self, job: Callable[[], None], *, after_error: bool = False) -> None:
+        if self._error is not None and not after_error:
+            return
+        try:
+            job()
+        except Exception as exc:
+            # Re-raised by `close` on the caller's thread.
+            self._error = self._error or exc
+
+    def _path(self, name: str, fmt: _TableFormat) -> Path:
+        return self.folder / f"{name}{fmt.suffix}"
+
+    def _write(self, name: str, table: Table, *, labelled: bool = False) -> None:
+        def job() -> None:
+            for fmt in self.formats:
+                path = self._path(name, fmt)
+                if labelled:
+                    fmt.write_labelled(path, table)
+                else:
+                    fmt.write(path, table)
+
+        self._jobs.put(job)
+
+    def write_grid(self, grid: dict[int, np.ndarray]) -> None:
+        """Queue the epsilon levels of each constrained objective (1-based)."""
+
+        def job() -> None:
+            for fmt in self.formats:
+                fmt.write_grid(self._path("epsilon_grid", fmt), grid)
+
+        self._jobs.put(job)
+
+    def write_payoff(self, payoff: np.ndarray) -> None:
+        self._write("payoff_table", objective_table(np.asarray(payoff, dtype=float)))
+
+    def _open_found(self) -> None:
+        if self._found_streams is None:
+            self._found_streams = [
+                fmt.open_stream(self._path("found_points", fmt), self._found_names)
+                for fmt in self.formats
+            ]
+
+    def stream(self, chunks: list[WorkerChunk]) -> None:
+        """Queue worker chunks; their new points go to `found_points.*`."""
+
+        def job() -> None:
+            self._open_found()
+            points = self._found.push_points(chunks)
+            if len(points):
+                table = objective_table(np.asfortranarray(points))
+                for found in self._found_streams or ():
+                    found.append(table)
+
+        self._jobs.put(job)
+
+    def write_result(self, result: PyAugmeconResult) -> None:
+        """Queue the final front and, if stored, its decision variables."""
+        # A run without any points still gets an (empty) `found_points`.
+        self._jobs.put(self._open_found)
+        self._write("solutions", objective_table(result.points_array))
+        if result.decision_variables_stored:
+            self._write(
+                "variables", variable_table(*result.variable_matrix()), labelled=True
+            )
+
+    def finish(self) -> None:
+        """Queue nothing further; queued writes go on in the background."""
+        if not self._closed:
+            self._closed = True
+            self._jobs.put(None)
+
+    def close(self, *, check: bool = True) -> None:
+        """Finish queued writes; with `check`, raise the first write error."""
+        self.finish()
+        self._thread.join()
+        if self._error is not None:
+            if check:
+                error, self._error = self._error, None
+                raise error
+            log.warning(f"Writing artifacts failed: {self._error!r}")
@@ -0,0 +1,185 @@
+"""Append-only checkpoints of a grid sweep, read back by `PyAugmecon.resume`."""
+
+from __future__ import annotations
+
+import os
+import pickle
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from pyaugmecon.results import WorkerChunk
+from pyaugmecon.solver.setup_cache import SetupEntry
+
+CHECKPOINT_FOLDER = "checkpoint"
+_STATE_FILE = "state.pkl"
+_LOG_FILE = "log.pkl"
+_SNAPSHOT_FILE = "snapshot.npz"
+_COUNT_NAMES = ("models_solved", "infeasibilities", "cache_hits", "cache_misses")
+
+
+@dataclass(frozen=True, slots=True)
+class CompletedRange:
+    """A finished job range and the counts its worker spent on it.
+
+    `counts` follows `_COUNT_NAMES`. A resumed run adds only these, so solves
+    in ranges that were cut off are counted once, when they are redone.
+    """
+
+    work: range
+    counts: tuple[int, int, int, int]
+
+
+# Items workers send on `result_q` while checkpointing: solution chunks, then
+# a `CompletedRange` once every chunk of that range is on the queue.
+type ResultItem = WorkerChunk | CompletedRange
+
+
+@dataclass(frozen=True, slots=True)
+class RunState:
+    """What a resumed run needs to rebuild the same epsilon grid."""
+
+    config: dict[str, Any]
+    model_blob: bytes
+    setup: SetupEntry
+    grid_sizes_inner: tuple[int, ...]
+
+
+@dataclass(slots=True)
+class Checkpoint:
+    """A checkpoint as read back from disk."""
+
+    state: RunState
+    chunks: list[WorkerChunk] = field(default_factory=list)
+    completed: list[range] = field(default_factory=list)
+    flags: np.ndarray | None = None
+    outer_skip: np.ndarray | None = None
+    # Counts spent on `completed` ranges, by `_COUNT_NAMES`.
+    counts: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(_COUNT_NAMES, 0)
+    )
+    # Bytes of intact log records; a resumed writer appends from here.
+    log_bytes: int = 0
+
+    @property
+    def completed_points(self) -> int:
+        """Grid points inside finished ranges (overlaps counted once)."""
+        total = 0
+        reached = 0
+        for done in sorted(self.completed, key=lambda r: r.start):
+            start = max(done.start, reached)
+            if done.stop > start:
+                total += done.stop - start
+                reached = done.stop
+        return total
+
+
+class CheckpointWriter:
+    """Write one run's checkpoint under `folder`.
+
+    Result items are appended to a pickle log as they are drained, so a
+    write never rewrites earlier work. Every `interval` seconds the log is
+    fsynced and the shared skip tables are snapshotted (written to a
+    temporary file and renamed into place). Passing `state` starts a
+    fresh checkpoint; without it the writer continues a loaded one after its
+    last intact record (`log_bytes`).
+    """
+
+    def __init__(
+        self,
+        folder: Path,
+        interval: float,
+        state: RunState | None,
+        log_bytes: int = 0,
+    ):
+        self.folder = folder
+        self.interval = interval
+        folder.mkdir(parents=True, exist_ok=True)
+        log_path = folder / _LOG_FILE
+        if state is not None:
+            (folder / _SNAPSHOT_FILE).unlink(missing_ok=True)
+            _replace_atomically(folder / _STATE_FILE, pickle.dumps(state))
+            log_path.unlink(missing_ok=True)
+        log_path.touch()
+        self._log = log_path.open("r+b")
+        self._log.truncate(log_bytes)
+        self._log.seek(log_bytes)
+        self._flushed_at = time.monotonic()
+
+    def record(self, items: list[ResultItem]) -> None:
+        for item in items:
+            pickle.dump(item, self._log, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def flush(
+        self,
+        skip_tables: tuple[np.ndarray | None, np.ndarray | None],
+        *,
+        force: bool = False,
+    ) -> None:
+        """Persist the log and snapshot the tables if `interval` has passed."""
+        now = time.monotonic()
+        if not force and now - self._flushed_at < self.interval:
+            return
+        self._flushed_at = now
+        self._log.flush()
+        os.fsync(self._log.fileno())
+
+        flags, outer_skip = skip_tables
+        arrays: dict[str, np.ndarray] = {}
+        if flags is not None:
+            arrays["flags"] = flags
+        if outer_skip is not None:
+            arrays["outer_skip"] = outer_skip
+        tmp = self.folder / f"{_SNAPSHOT_FILE}.{os.getpid()}.tmp"
+        with tmp.open("wb") as handle:
+            np.savez(handle, **arrays)
+        tmp.replace(self.folder / _SNAPSHOT_FILE)
+
+    def close(self) -> None:
+        self._log.close()
+
+
+def _replace_atomically(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def load_checkpoint(artifact_dir: Path) -> Checkpoint:
+    """Read the checkpoint in `artifact_dir`.
+
+    A record cut off by a crash mid-write ends the log; everything before it
+    is kept.
+    """
+    folder = artifact_dir / CHECKPOINT_FOLDER
+    state_path = folder / _STATE_FILE
+    if not state_path.is_file():
+        raise FileNotFoundError(f"No checkpoint found in {artifact_dir}.")
+    # Checkpoints are this run's own files, like the model blob workers load.
+    checkpoint = Checkpoint(state=pickle.loads(state_path.read_bytes()))  # noqa: S301
+
+    log_path = folder / _LOG_FILE
+    if log_path.is_file():
+        with log_path.open("rb") as handle:
+            while True:
+                try:
+                    item = pickle.load(handle)  # noqa: S301
+                except (EOFError, pickle.UnpicklingError):
+                    break
+                if isinstance(item, CompletedRange):
+                    checkpoint.completed.append(item.work)
+                    for name, count in zip(_COUNT_NAMES, item.counts, strict=True):
+                        checkpoint.counts[name] += count
+                else:
+                    checkpoint.chunks.append(item)
+                checkpoint.log_bytes = handle.tell()
+
+    snapshot_path = folder / _SNAPSHOT_FILE
+    if snapshot_path.is_file():
+        with np.load(snapshot_path) as snapshot:
+            checkpoint.flags = snapshot.get("flags")
+            checkpoint.outer_skip = snapshot.get("outer_skip")
+    return checkpoint
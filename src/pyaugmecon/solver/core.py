@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import csv
+import asyncio
 import threading
 import time
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncIterator, Iterator, Mapping
 from datetime import UTC, datetime
-from multiprocessing import get_context
 from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
 from queue import SimpleQueue
@@ -15,14 +14,35 @@
 from typing import Any
 
 import cloudpickle
+import numpy as np
 import pyomo.environ as pyo
 from pymoo.config import Config
+from pyomo.core.base import Var
 
 from pyaugmecon import __version__
 from pyaugmecon.config import PyAugmeconConfig
+from pyaugmecon.helper import worker_context
+from pyaugmecon.hypervolume import HypervolumeTracker
 from pyaugmecon.logs import configure_loguru, log_run_header, log_run_summary
-from pyaugmecon.results import PyAugmeconResult, WorkerChunk
-from pyaugmecon.solver.model import Model, check_user_model
+from pyaugmecon.results import (
+    PyAugmeconResult,
+    Solution,
+    SolutionStream,
+    VariableColumns,
+    WorkerChunk,
+    variable_columns,
+)
+from pyaugmecon.solver.artifacts import ArtifactWriter
+from pyaugmecon.solver.checkpoint import (
+    CHECKPOINT_FOLDER,
+    Checkpoint,
+    CheckpointWriter,
+    CompletedRange,
+    RunState,
+    load_checkpoint,
+)
+from pyaugmecon.solver.model import Model, SetupChain, check_user_model
+from pyaugmecon.solver.pool import PoolProcessHandler, WorkerPool
 from pyaugmecon.solver.process import ProcessHandler
 from pyaugmecon.solver.queue import QueueHandler
 from pyaugmecon.solver.worker import (
@@ -32,13 +52,6 @@
 )
 
 
-def _write_csv(path: Path, rows: Sequence[Sequence[object]]) -> None:
-    """Write row-oriented data to a CSV file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="") as handle:
-        csv.writer(handle).writerows(rows)
-
-
 class PyAugmecon:
     """High-level AUGMECON solver wrapper around a Pyomo model."""
 
@@ -48,8 +61,16 @@ def __init__(
         config: PyAugmeconConfig | Mapping[str, Any],
         *,
         log_sink: Any | None = None,
+        pool: WorkerPool | None = None,
     ) -> None:
         config = PyAugmeconConfig.model_validate(config)
+        if pool is not None and config.workers != pool.workers:
+            # `auto` work distribution and flag policy were resolved for
+            # `config.workers`, so it has to describe the pool actually used.
+            raise ValueError(
+                f"`workers={config.workers}` does not match the WorkerPool "
+                f"size ({pool.workers})."
+            )
         if log_sink is not None and not callable(getattr(log_sink, "info", None)):
             raise TypeError("`log_sink` must expose an `.info(message)` method.")
 
@@ -60,6 +81,7 @@ def __init__(
         config.validate_against_model(len(model.obj_list))  # ty: ignore[invalid-argument-type]
 
         self.config = config
+        self.pool = pool
 
         # Microsecond-precise run id so concurrent runs don't clobber each other.
         self.run_id = datetime.now(tz=UTC).strftime("%Y%m%d-%H%M%S-%f")
@@ -81,30 +103,90 @@ def __init__(
 
         self.result: PyAugmeconResult | None = None
         self._model_blob_shm: SharedMemory | None = None
+        self._setup_blob_shm: SharedMemory | None = None
+        self._setup_blob_size = 0
+        # The pool this run's workers come from: `pool`, or one owned by a
+        # `parallel_setup` run for the length of `solve()`.
+        self._active_pool = pool
+        self._resume_from: Checkpoint | None = None
+        self._user_model_blob: bytes | None = None
+        # Set while `iter_solutions` drives the run.
+        self._streaming = False
+        self._artifacts: ArtifactWriter | None = None
+        # `async_artifacts`: the last run's writer, until `wait_for_artifacts`.
+        self._pending_artifacts: ArtifactWriter | None = None
+        # `probe_stride` runs: solves spent on the probe rows.
+        self._probe_solves: int | None = None
+
+    @classmethod
+    def resume(
+        cls,
+        artifact_dir: str | Path,
+        *,
+        log_sink: Any | None = None,
+        pool: WorkerPool | None = None,
+    ) -> PyAugmecon:
+        """Prepare to finish the checkpointed run in `artifact_dir`.
+
+        Rebuilds the run from its stored model, config, payoff table and
+        nadirs, so the epsilon grid is the same. `solve()` then restores the
+        shared skip tables, counters and collected solutions and only
+        dispatches ranges that no worker finished, checkpointing into the
+        same directory. With a `pool`, its size replaces `workers`.
+        """
+        path = Path(artifact_dir).resolve()
+        checkpoint = load_checkpoint(path)
+        config = {
+            **checkpoint.state.config,
+            "artifact_folder": str(path.parent),
+            "artifact_name": path.name,
+        }
+        if pool is not None:
+            config["workers"] = pool.workers
+        solver = cls(
+            cloudpickle.loads(checkpoint.state.model_blob),
+            config,
+            log_sink=log_sink,
+            pool=pool,
+        )
+        solver.model.preset_setup = checkpoint.state.setup
+        solver._resume_from = checkpoint
+        return solver
 
     def _require_result(self) -> PyAugmeconResult:
         if self.result is None:
             raise RuntimeError("Call `solve()` before requesting results.")
         return self.result
 
-    def _find_solutions(self) -> None:
+    def _find_solutions(self) -> Iterator[list[WorkerChunk]]:
         """Dispatch grid work to workers and collect raw solution payloads.
 
         Two paths:
 
-        * `workers > 1`: pickle the model into a SharedMemory block, spawn
-          worker processes, and drain results from a multiprocessing queue.
-          Cleanup of the shared block is unconditional via `finally`.
+        * `workers > 1` (or a `WorkerPool` was given): pickle the model into
+          a SharedMemory block, spawn worker processes (or hand the run to
+          the pool's), and drain their results. Cleanup of the shared block
+          is unconditional via `finally`.
         * `workers == 1`: skip multiprocessing entirely and run the worker
           loop in the main process against the live Pyomo model. Avoids the
           spawn + pickle + IPC overhead that otherwise dominates small
-          problems.
+          problems. Checkpointed and streaming runs still use a worker
+          process so the parent can write checkpoints or hand out solutions
+          while it solves.
+
+        Yields each batch of worker chunks as it is collected.
         """
         self.model.progress.set_message("Solving")
-        if self.config.workers <= 1:
+        if (
+            self._active_pool is None
+            and self.config.workers <= 1
+            and self.config.checkpoint_interval is None
+            and not self._streaming
+        ):
             self._find_solutions_inprocess()
+            yield list(self._worker_chunks)
             return
-        self._find_solutions_multiprocess()
+        yield from self._find_solutions_multiprocess()
 
     def _find_solutions_inprocess(self) -> None:
         """Run the solver loop in the main process for `workers == 1`.
@@ -149,6 +231,10 @@ def _find_solutions_inprocess(self) -> None:
             solved_counter=self.model.models_solved,
             infeasible_counter=self.model.infeasibilities,
             skip_buffers=skip_buffers,
+            cache_hit_counter=self.model.cache_hits,
+            cache_miss_counter=self.model.cache_misses,
+            point_ring=None,
+            first_solve=self.model.first_grid_solve,
             live_model=self.model.model,
         )
 
@@ -162,8 +248,19 @@ def _find_solutions_inprocess(self) -> None:
             )
             raise RuntimeError(message)
 
-    def _find_solutions_multiprocess(self) -> None:
-        """Spawn worker processes and gather their solutions."""
+    def _find_solutions_multiprocess(self) -> Iterator[list[WorkerChunk]]:
+        """Run workers in other processes and gather their solutions.
+
+        Closing the generator early stops the workers.
+        """
+        resume = self._resume_from
+        if resume is not None and resume.state.grid_sizes_inner != tuple(
+            self.model.grid_sizes_inner
+        ):
+            raise RuntimeError(
+                f"Checkpoint grid {resume.state.grid_sizes_inner} does not match "
+                f"the rebuilt grid {tuple(self.model.grid_sizes_inner)}."
+            )
         model_blob = cloudpickle.dumps(self.model.model)
 
         self._model_blob_shm = SharedMemory(create=True, size=len(model_blob))
@@ -171,44 +268,185 @@ def _find_solutions_multiprocess(self) -> None:
         assert shm_buf is not None
         shm_buf[: len(model_blob)] = model_blob
 
-        ctx = get_context("spawn")
         self.queues = QueueHandler(
             range(self.model.grid_point_count),
             self.model.grid_point_count,
             self.config,
             tuple(self.model.grid_sizes_inner),
+            completed=() if resume is None else resume.completed,
         )
-        self.queues.split_work(ctx)
-
-        self.procs = ProcessHandler(
-            self.config,
-            self.model,
-            self.queues,
-            WorkerSpec.from_model(
-                self.model, self._model_blob_shm.name, len(model_blob)
-            ),
-            logfile=self.logfile,
+        spec = WorkerSpec.from_model(
+            self.model, self._model_blob_shm.name, len(model_blob)
         )
+        if self._active_pool is None:
+            ctx = worker_context(self.config.start_method)
+            self.queues.split_work(ctx)
+            # Bare points go through shared rings; variables still need
+            # pickling. Rings are sized per run, so pooled runs use the queue,
+            # as do checkpointed runs, whose range markers follow the chunks.
+            if (
+                self.config.result_buffer_size
+                and not self.config.store_decision_variables
+                and self.config.checkpoint_interval is None
+            ):
+                self.queues.open_point_rings(ctx, self.model.n_obj)
+            self.procs = ProcessHandler(
+                self.config, self.model, self.queues, spec, logfile=self.logfile
+            )
+        else:
+            self.queues.split_work(self._active_pool.ctx, pool=self._active_pool)
+            self.procs = PoolProcessHandler(
+                self._active_pool,
+                self.config,
+                self.model,
+                self.queues,
+                spec,
+                logfile=self.logfile,
+            )
 
         self._worker_chunks = []
+        if resume is not None:
+            self._restore_checkpoint(resume)
+            yield list(resume.chunks)
+        writer = self._open_checkpoint()
+        # Points and solves restored from a checkpoint are not this run's.
+        swept_base = self.model.progress.counter.value()
+        solved_base = self.model.models_solved.value()
         try:
             self.procs.start()
-            # Cooperative wait loop: drain results periodically so the result
-            # queue doesn't grow unbounded while workers are still running.
+            # `join` returns on worker activity (or a short timeout); drain
+            # results each time so they don't pile up while workers run.
             while not self.procs.join():
+                probing = self.queues.probing
+                self.queues.feed(
+                    self.model.progress.counter.value() - swept_base,
+                    self.model.sweep_ns.value(),
+                )
+                if probing and not self.queues.probing:
+                    self._record_probe(solved_base)
                 self.model.progress.refresh()
-                self._worker_chunks.extend(self.queues.get_result())
+                if chunks := self._drain_results(writer):
+                    yield chunks
 
             # Final drain after all workers exited cleanly.
             self.model.progress.refresh()
-            self._worker_chunks.extend(self.queues.get_result())
+            if chunks := self._drain_results(writer):
+                yield chunks
+        except GeneratorExit:
+            self.procs.terminate_early()
+            raise
         finally:
+            if writer is not None:
+                # Keep what stopped or failed runs finished for `resume`.
+                self._drain_results(writer)
+                writer.flush(self.procs.skip_tables(), force=True)
+                writer.close()
             self.procs.close()
             self._model_blob_shm.close()
             self._model_blob_shm.unlink()
             self._model_blob_shm = None
 
-    def _build_result(self, runtime_seconds: float) -> None:
+    def _record_probe(self, solved_base: int) -> None:
+        """Note the solves spent on the probe rows."""
+        self._probe_solves = self.model.models_solved.value() - solved_base
+
+    def _restore_checkpoint(self, checkpoint: Checkpoint) -> None:
+        """Carry a checkpoint's solutions, counters and skip tables over."""
+        self._worker_chunks.extend(checkpoint.chunks)
+        self.procs.restore_skip = (checkpoint.flags, checkpoint.outer_skip)
+        for name, count in checkpoint.counts.items():
+            getattr(self.model, name).add(count)
+        self.model.progress.counter.add(checkpoint.completed_points)
+
+    def _open_checkpoint(self) -> CheckpointWriter | None:
+        interval = self.config.checkpoint_interval
+        if interval is None:
+            return None
+        folder = Path(self.artifact_dir) / CHECKPOINT_FOLDER
+        if self._resume_from is not None:
+            return CheckpointWriter(
+                folder, interval, None, log_bytes=self._resume_from.log_bytes
+            )
+        assert self._user_model_blob is not None
+        state = RunState(
+            config=self.config.model_dump(),
+            model_blob=self._user_model_blob,
+            setup=self.model.setup_entry(),
+            grid_sizes_inner=tuple(self.model.grid_sizes_inner),
+        )
+        return CheckpointWriter(folder, interval, state)
+
+    def _drain_results(self, writer: CheckpointWriter | None) -> list[WorkerChunk]:
+        """Collect and return queued results; log them first when checkpointing.
+
+        Checkpointing workers also send a `CompletedRange` per finished job;
+        those only go to the checkpoint.
+        """
+        items = self.queues.get_result()
+        if writer is not None:
+            writer.record(items)
+            writer.flush(self.procs.skip_tables())
+        chunks = [item for item in items if not isinstance(item, CompletedRange)]
+        self._worker_chunks.extend(chunks)
+        return chunks
+
+    def _start_parallel_setup(self) -> None:
+        """Route setup solves to pool workers when `parallel_setup` is on.
+
+        Without a `pool`, multi-worker runs start their own for this solve;
+        its workers then run the grid as well.
+        """
+        if not self.config.parallel_setup:
+            return
+        if self._active_pool is None and self.config.workers > 1:
+            self._active_pool = WorkerPool(
+                self.config.workers, start_method=self.config.start_method
+            )
+        if self._active_pool is not None:
+            self.model.setup_runner = self._run_setup_chains
+
+    def _run_setup_chains(self, chains: list[SetupChain]) -> list[list[float]]:
+        """`Model.setup_runner`: solve chains on the active pool's workers.
+
+        The model is pickled once, on the first batch, and reused for the
+        rest; setup doesn't change it between batches.
+        """
+        assert self._active_pool is not None
+        if self._setup_blob_shm is None:
+            blob = cloudpickle.dumps(self.model.model)
+            self._setup_blob_shm = SharedMemory(create=True, size=len(blob))
+            shm_buf = self._setup_blob_shm.buf
+            assert shm_buf is not None
+            shm_buf[: len(blob)] = blob
+            self._setup_blob_size = len(blob)
+
+        def advance(values: list[float]) -> None:
+            for _ in values:
+                self.model.progress.increment()
+
+        return self._active_pool.run_setup(
+            self.config,
+            self._setup_blob_shm.name,
+            self._setup_blob_size,
+            chains,
+            on_values=advance,
+        )
+
+    def _finish_parallel_setup(self) -> None:
+        self.model.setup_runner = None
+        if self._setup_blob_shm is not None:
+            self._setup_blob_shm.close()
+            self._setup_blob_shm.unlink()
+            self._setup_blob_shm = None
+
+    def _first_solve_seconds(self, started_ns: int) -> float | None:
+        """Seconds from `solve()` start to the first grid solve, if any ran."""
+        first_ns = self.model.first_grid_solve.value()
+        if not first_ns:
+            return None
+        return round(max(0, first_ns - started_ns) / 1e9, 2)
+
+    def _build_result(self, runtime_seconds: float, started_ns: int) -> None:
         visited = max(
             0, self.model.progress.counter.value() - self.model.setup_solve_count
         )
@@ -223,15 +461,51 @@ def _build_result(self, runtime_seconds: float) -> None:
             grid_point_count=self.model.grid_point_count,
             decision_variables_stored=self.config.store_decision_variables,
             round_decimals=self.config.round_decimals,
+            variable_columns=self._variable_columns(),
+            cache_hits=self.model.cache_hits.value(),
+            cache_misses=self.model.cache_misses.value(),
+            first_solve_seconds=self._first_solve_seconds(started_ns),
+            setup_cache_hit=self.model.setup_cache_hit,
+            probe_solves=self._probe_solves,
+        )
+
+    def _variable_columns(self) -> VariableColumns | None:
+        """Column layout for columnar variable capture, or None when unused.
+
+        Workers load copies of this model, so `component_map` yields the same
+        active `Var` components in the same order on both sides.
+        """
+        if not (
+            self.config.store_decision_variables
+            and self.config.variable_storage == "columnar"
+        ):
+            return None
+        return variable_columns(
+            self.model.model.component_map(ctype=Var, active=True).values()
         )
 
-    def _output_tables(self) -> None:
-        """Write the epsilon grid, payoff table, and solutions to CSV files."""
-        result = self._require_result()
-        out = Path(self.artifact_dir)
-        _write_csv(out / "epsilon_grid.csv", self.model.epsilon_grid.tolist())
-        _write_csv(out / "payoff_table.csv", result.payoff_table.tolist())
-        _write_csv(out / "solutions.csv", [list(point) for point in result.points])
+    def _open_artifacts(self) -> ArtifactWriter | None:
+        """Start writing artifact tables, beginning with the grid and payoffs."""
+        if not self.config.artifact_formats:
+            return None
+        writer = ArtifactWriter(
+            Path(self.artifact_dir),
+            self.config.artifact_formats,
+            sign=tuple(self.model.obj_goal),
+            round_decimals=self.config.round_decimals,
+        )
+        writer.write_grid(
+            {
+                obj_idx + 1: levels
+                for obj_idx, levels in zip(
+                    self.model.constrained_order_inner,
+                    self.model.epsilon_grid,
+                    strict=True,
+                )
+            }
+        )
+        writer.write_payoff(np.asarray(self.model.payoff) * self.model.obj_goal)
+        return writer
 
     def solve(self) -> PyAugmeconResult:
         """Solve the multi-objective problem and return a structured result.
@@ -245,25 +519,131 @@ def solve(self) -> PyAugmeconResult:
           5. Convert to augmented epsilon-constraint form (adds slack vars,
              epsilon param, augmented primary objective).
           6. Dispatch the grid to workers, then build the structured result.
-          7. Optionally write CSV artifacts.
+          7. Optionally write artifact tables (see `artifact_formats`). With
+             `async_artifacts`, the final tables are still being written when
+             this returns; `wait_for_artifacts()` waits for them.
 
         The progress bar is closed in `finally` so a partial run still leaves
         the terminal in a sane state.
         """
+        for _ in self._run():
+            pass
+        return self._require_result()
+
+    def wait_for_artifacts(self) -> None:
+        """Wait until the last run's artifact tables are on disk.
+
+        Only needed with `async_artifacts=True`, where `solve()` returns while
+        the final tables are still being written. Raises the first write
+        error, if any.
+        """
+        writer, self._pending_artifacts = self._pending_artifacts, None
+        if writer is not None:
+            writer.close()
+
+    def hypervolume_tracker(self) -> HypervolumeTracker:
+        """A running hypervolume with the reference `result.hypervolume()` uses.
+
+        Needs the payoff table, so call it once `iter_solutions` has yielded
+        a solution (or after `solve()`).
+        """
+        payoff = getattr(self.model, "payoff", None)
+        if payoff is None or not np.all(np.isfinite(np.diag(payoff))):
+            raise RuntimeError("The payoff table is not built yet.")
+        return HypervolumeTracker(np.diag(payoff) * np.array(self.model.obj_goal))
+
+    def iter_solutions(self, *, nondominated: bool = False) -> Iterator[Solution]:
+        """Solve, yielding solutions as workers report them.
+
+        Solutions are rounded, de-duplicated and in the user's min/max frame,
+        like `result.solutions`, but come in arrival order and may include
+        points that later turn out dominated. `nondominated=True` drops points
+        dominated by one seen earlier. Always uses worker processes, even
+        with `workers=1`. Stopping early stops the workers; once exhausted,
+        `result` holds what `solve()` would have returned.
+        """
+        for batch in self._solution_batches(nondominated):
+            yield from batch
+
+    async def aiter_solutions(
+        self, *, nondominated: bool = False
+    ) -> AsyncIterator[Solution]:
+        """`iter_solutions` for asyncio code.
+
+        The run is driven from a worker thread, so the event loop stays free
+        while it waits for results.
+        """
+        batches = self._solution_batches(nondominated)
+        try:
+            while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                for solution in batch:
+                    yield solution
+        finally:
+            await asyncio.to_thread(batches.close)
+
+    def _solution_batches(self, nondominated: bool) -> Iterator[list[Solution]]:
+        stream: SolutionStream | None = None
+        self._streaming = True
+        try:
+            for chunks in self._run():
+                if stream is None:
+                    stream = SolutionStream(
+                        sign=tuple(self.model.obj_goal),
+                        round_decimals=self.config.round_decimals,
+                        variable_columns=self._variable_columns(),
+                        nondominated=nondominated,
+                    )
+                if solutions := stream.push(chunks):
+                    yield solutions
+        finally:
+            self._streaming = False
+
+    def _run(self) -> Iterator[list[WorkerChunk]]:
+        """The `solve()` pipeline, yielding worker chunks as they arrive."""
         started_at = time.perf_counter()
+        # Wall clock, to compare with stamps taken in worker processes.
+        started_ns = time.time_ns()
         try:
             self.result = None
+            self._probe_solves = None
+            if self._pending_artifacts is not None:
+                # This run writes to the same folder; let the last one finish.
+                self._pending_artifacts.close(check=False)
+                self._pending_artifacts = None
+            if (
+                self.config.checkpoint_interval is not None
+                and self._resume_from is None
+            ):
+                # Keep the untouched model so `resume` can rebuild the grid.
+                self._user_model_blob = cloudpickle.dumps(self.model.model)
+            self._start_parallel_setup()
             self.model.deactivate_all_objectives()
             self.model.min_to_max()
             self.model.construct_payoff()
             self.model.find_obj_range()
+            self._finish_parallel_setup()
             self.model.convert_prob()
 
-            self._find_solutions()
-            self._build_result(round(time.perf_counter() - started_at, 2))
-            if self.config.write_csv:
-                self._output_tables()
+            self._artifacts = self._open_artifacts()
+            for chunks in self._find_solutions():
+                if self._artifacts is not None:
+                    self._artifacts.stream(chunks)
+                yield chunks
+            self._build_result(round(time.perf_counter() - started_at, 2), started_ns)
+            if self._artifacts is not None:
+                self._artifacts.write_result(self._require_result())
+                if self.config.async_artifacts:
+                    self._artifacts.finish()
+                    self._pending_artifacts, self._artifacts = self._artifacts, None
+                else:
+                    self._artifacts.close()
             log_run_summary(self._require_result())
-            return self._require_result()
         finally:
+            if self._artifacts is not None:
+                self._artifacts.close(check=False)
+                self._artifacts = None
+            self._finish_parallel_setup()
+            if self._active_pool is not None and self._active_pool is not self.pool:
+                self._active_pool.shutdown()
+                self._active_pool = self.pool
             self.model.progress.close()
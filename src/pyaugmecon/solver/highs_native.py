@@ -0,0 +1,256 @@
+"""Direct HiGHS engine for the epsilon sweep (`solver_name="highspy_native"`).
+
+The grid sweep only changes the right-hand side of the epsilon constraints
+between solves. Going through Pyomo for every grid point pays for change
+detection, result objects, and `load_vars()` each time; this engine extracts
+the augmented model into matrix form once per worker, keeps one
+`highspy.Highs` instance alive, and only rewrites those row bounds.
+
+Setup solves (payoff table, nadirs) still go through the HiGHS Pyomo family;
+see `select_solver`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+import pyomo.environ as pyo
+from pyomo.core.base import Var
+from pyomo.repn import generate_standard_repn
+
+from pyaugmecon.solver.adapter import (
+    HIGHS_NATIVE_ENGINE,
+    SOLUTION_BEARING_TERMINATIONS,
+    SolveResult,
+    normalize_outcome,
+)
+
+# HiGHS model statuses mapped onto the Pyomo terminations `normalize_outcome`
+# already understands. Anything missing falls through to `SolveOutcome.ERROR`.
+_STATUS_TO_TERMINATION: dict[str, pyo.TerminationCondition] = {
+    "kOptimal": pyo.TerminationCondition.optimal,
+    "kInfeasible": pyo.TerminationCondition.infeasible,
+    "kUnbounded": pyo.TerminationCondition.unbounded,
+    "kUnboundedOrInfeasible": pyo.TerminationCondition.infeasibleOrUnbounded,
+    "kTimeLimit": pyo.TerminationCondition.maxTimeLimit,
+    "kIterationLimit": pyo.TerminationCondition.maxIterations,
+    "kSolutionLimit": pyo.TerminationCondition.maxIterations,
+    "kInterrupt": pyo.TerminationCondition.userInterrupt,
+    "kHighsInterrupt": pyo.TerminationCondition.userInterrupt,
+}
+
+
+def _import_highspy() -> Any:
+    try:
+        import highspy  # noqa: PLC0415
+    except ImportError as exc:
+        raise RuntimeError(
+            f"`solver_name='{HIGHS_NATIVE_ENGINE}'` requires the `highspy` "
+            "package. Install it with `pip install pyaugmecon[highs]`."
+        ) from exc
+    return highspy
+
+
+def _linear_terms(expr: Any, context: str) -> tuple[list[Any], list[float], float]:
+    """Return `(vars, coefs, constant)` for a linear Pyomo expression."""
+    repn = generate_standard_repn(expr, quadratic=False)
+    if not repn.is_linear():
+        raise ValueError(
+            f"`solver_name='{HIGHS_NATIVE_ENGINE}'` only supports linear models; "
+            f"{context} is nonlinear."
+        )
+    coefs = [float(coef) for coef in repn.linear_coefs]
+    return list(repn.linear_vars), coefs, float(repn.constant)
+
+
+class HighsNativeSweep:
+    """Matrix-form copy of an augmented model held in one `highspy.Highs`.
+
+    Built from the worker's Pyomo model after `Model.convert_prob` and after
+    the primary objective has been activated. Epsilon rows are the
+    `_pyaugmecon_constraint_list` entries, in `constrained_order_inner`.
+    """
+
+    def __init__(
+        self,
+        model: pyo.ConcreteModel,
+        constrained_order_inner: Sequence[int],
+        solver_options: Mapping[str, object],
+    ) -> None:
+        highspy = _import_highspy()
+
+        self._col_by_var: dict[int, int] = {}
+        self._col_vars: list[Any] = []
+
+        row_lower: list[float] = []
+        row_upper: list[float] = []
+        row_starts: list[int] = []
+        row_index: list[int] = []
+        row_value: list[float] = []
+
+        def add_row(
+            variables: list[Any], coefs: list[float], lower: float, upper: float
+        ) -> None:
+            row_starts.append(len(row_index))
+            row_index.extend(self._column(var) for var in variables)
+            row_value.extend(coefs)
+            row_lower.append(lower)
+            row_upper.append(upper)
+
+        epsilon_list = model._pyaugmecon_constraint_list
+        skipped = {id(con) for con in epsilon_list.values()}  # ty: ignore[unresolved-attribute]
+        for con in model.component_data_objects(pyo.Constraint, active=True):
+            if id(con) in skipped:
+                continue
+            variables, coefs, constant = _linear_terms(con.body, con.name)
+            lower = -np.inf if con.lb is None else float(con.lb) - constant
+            upper = np.inf if con.ub is None else float(con.ub) - constant
+            add_row(variables, coefs, lower, upper)
+
+        # Epsilon rows: f_i(x) - slack_i in [eps_i, eps_i]. Their bounds are
+        # rewritten before every solve, so start them unbounded.
+        obj_list = model.obj_list
+        slack_var = model._pyaugmecon_slack
+        self._epsilon_rows = np.arange(
+            len(row_lower),
+            len(row_lower) + len(constrained_order_inner),
+            dtype=np.int32,
+        )
+        self._epsilon_offsets = np.zeros(len(constrained_order_inner))
+        for pos, objective_idx in enumerate(constrained_order_inner):
+            component_idx = objective_idx + 1
+            variables, coefs, constant = _linear_terms(
+                obj_list[component_idx].expr - slack_var[component_idx],  # ty: ignore[not-subscriptable]
+                f"objective {component_idx}",
+            )
+            self._epsilon_offsets[pos] = constant
+            add_row(variables, coefs, -np.inf, np.inf)
+
+        # Objective values are reported for every objective, not just the
+        # active one, so keep one dense coefficient row per objective.
+        objective_terms = [
+            _linear_terms(obj_list[obj_idx + 1].expr, f"objective {obj_idx + 1}")  # ty: ignore[not-subscriptable]
+            for obj_idx in range(len(obj_list))  # ty: ignore[invalid-argument-type]
+        ]
+        for variables, _, _ in objective_terms:
+            for var in variables:
+                self._column(var)
+        slack_cols = [
+            self._column(slack_var[objective_idx + 1])  # ty: ignore[not-subscriptable]
+            for objective_idx in constrained_order_inner
+        ]
+
+        n_col = len(self._col_vars)
+        self._objective_matrix = np.zeros((len(objective_terms), n_col))
+        self._objective_constants = np.zeros(len(objective_terms))
+        for row, (variables, coefs, constant) in enumerate(objective_terms):
+            for var, coef in zip(variables, coefs, strict=True):
+                self._objective_matrix[row, self._col_by_var[id(var)]] += coef
+            self._objective_constants[row] = constant
+        self._slack_cols = np.asarray(slack_cols, dtype=np.intp)
+
+        highs = highspy.Highs()
+        highs.silent()
+        for key, option in solver_options.items():
+            highs.setOptionValue(key, option)
+
+        col_lower = np.array(
+            [-np.inf if v.lb is None else float(v.lb) for v in self._col_vars]
+        )
+        col_upper = np.array(
+            [np.inf if v.ub is None else float(v.ub) for v in self._col_vars]
+        )
+        highs.addVars(n_col, col_lower, col_upper)
+        integer_cols = np.array(
+            [col for col, v in enumerate(self._col_vars) if v.is_integer()],
+            dtype=np.int32,
+        )
+        if integer_cols.size:
+            highs.changeColsIntegrality(
+                integer_cols.size,
+                integer_cols,
+                np.full(integer_cols.size, highspy.HighsVarType.kInteger),
+            )
+
+        # The active objective is the augmented primary objective (maximize).
+        active = next(model.component_data_objects(pyo.Objective, active=True))
+        obj_vars, obj_coefs, obj_constant = _linear_terms(active.expr, active.name)
+        cost = np.zeros(n_col)
+        for var, coef in zip(obj_vars, obj_coefs, strict=True):
+            cost[self._col_by_var[id(var)]] += coef
+        highs.changeColsCost(n_col, np.arange(n_col, dtype=np.int32), cost)
+        highs.changeObjectiveOffset(obj_constant)
+        highs.changeObjectiveSense(
+            highspy.ObjSense.kMaximize
+            if active.sense == pyo.maximize
+            else highspy.ObjSense.kMinimize
+        )
+
+        highs.addRows(
+            len(row_lower),
+            np.asarray(row_lower),
+            np.asarray(row_upper),
+            len(row_index),
+            np.asarray(row_starts, dtype=np.int32),
+            np.asarray(row_index, dtype=np.int32),
+            np.asarray(row_value),
+        )
+        self._highs = highs
+        self._col_values = np.zeros(n_col)
+
+    def _column(self, var: Any) -> int:
+        """Column index for `var`, registering it on first sight."""
+        col = self._col_by_var.get(id(var))
+        if col is None:
+            col = len(self._col_vars)
+            self._col_by_var[id(var)] = col
+            self._col_vars.append(var)
+        return col
+
+    def solve(self, epsilon_values: Sequence[float]) -> SolveResult:
+        """Pin the epsilon rows to `epsilon_values` and solve once."""
+        rhs = np.asarray(epsilon_values, dtype=float) - self._epsilon_offsets
+        self._highs.changeRowsBounds(rhs.size, self._epsilon_rows, rhs, rhs)
+        self._highs.run()
+
+        status = self._highs.getModelStatus()
+        term = _STATUS_TO_TERMINATION.get(status.name, pyo.TerminationCondition.unknown)
+        has_solution = term in SOLUTION_BEARING_TERMINATIONS
+        if has_solution:
+            self._col_values = np.asarray(self._highs.getSolution().col_value)
+        return SolveResult(
+            outcome=normalize_outcome(pyo.SolverStatus.ok, term),
+            pyomo_status=pyo.SolverStatus.ok
+            if has_solution
+            else pyo.SolverStatus.warning,
+            pyomo_termination=term,
+            has_solution=has_solution,
+            backend=HIGHS_NATIVE_ENGINE,
+        )
+
+    def slack_values(self) -> list[float]:
+        """Slack values of the last solution, in `constrained_order_inner`."""
+        return self._col_values[self._slack_cols].tolist()
+
+    def objective_values(self) -> list[float]:
+        """Values of every `obj_list` objective at the last solution."""
+        return (
+            self._objective_matrix @ self._col_values + self._objective_constants
+        ).tolist()
+
+    def load_vars(self, variables: Iterable[Var]) -> None:
+        """Copy the last solution into `variables` for decision-variable capture.
+
+        Variables the solver never saw (absent from every active row and
+        objective) are left untouched, matching Pyomo's `load_vars()`.
+        """
+        for component in variables:
+            for var in component.values():
+                col = self._col_by_var.get(id(var))
+                if col is not None and not var.fixed:
+                    var.set_value(float(self._col_values[col]), skip_validation=True)
+
+    def release(self) -> None:
+        self._highs.clear()
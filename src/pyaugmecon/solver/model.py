@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass
 from math import prod
+from pathlib import Path
 from typing import Any
 
 import numpy as np
@@ -19,13 +21,20 @@
 )
 
 from pyaugmecon.config import PyAugmeconConfig
-from pyaugmecon.helper import Counter, ProgressBar
+from pyaugmecon.helper import Counter, FirstMark, ProgressBar, worker_context
 from pyaugmecon.solver.adapter import (
     SolveOutcome,
     release_solver,
     select_solver,
     solve_once,
 )
+from pyaugmecon.solver.setup_cache import (
+    SetupEntry,
+    load_setup_entry,
+    model_fingerprint,
+    setup_cache_path,
+    store_setup_entry,
+)
 
 # Component names PyAugmecon attaches to the user's Pyomo model. Reserved so
 # `check_user_model` can reject conflicts up front rather than overwriting
@@ -65,6 +74,136 @@ def check_user_model(user_model: pyo.ConcreteModel) -> None:
 )
 
 
+def reuses_setup_solver(backend: str) -> bool:
+    """Whether one solver instance can serve several setup solves.
+
+    APPSI and persistent backends can't be safely reused across objective
+    activations during setup; those get a fresh solver per solve.
+    """
+    return not (backend.startswith("appsi_") or backend.endswith("_persistent"))
+
+
+@dataclass(frozen=True, slots=True)
+class SetupChain:
+    """Setup solves that must run in order on the unconverted model.
+
+    `locks` are `(objective, value)` equalities added first. Each objective
+    in `objectives` is then optimized and locked to its optimum before the
+    next one. A payoff row is one chain; the diagonal entries and the
+    safe-nadir minimizations (`minimize=True`) are one-solve chains.
+    """
+
+    objectives: tuple[int, ...]
+    locks: tuple[tuple[int, float], ...] = ()
+    minimize: bool = False
+    row: int | None = None
+
+    def context(self, objective_idx: int) -> str:
+        if self.minimize:
+            return f"Auto-safe nadir bound for objective {objective_idx + 1}"
+        row = objective_idx if self.row is None else self.row
+        return f"Payoff construction for objective pair ({row}, {objective_idx})"
+
+
+# Runs a batch of independent chains and returns their values in order.
+type SetupRunner = Callable[[list[SetupChain]], list[list[float]]]
+
+
+def solve_setup_objective(
+    model: pyo.ConcreteModel,
+    config: PyAugmeconConfig,
+    objective_idx: int,
+    reusable: tuple[Any, str] | None,
+    context: str,
+    on_solve: Callable[[SolveOutcome], None] | None = None,
+) -> float:
+    """Activate `objective_idx`, solve, and return the optimal value.
+
+    The try/finally guarantees the model is left with all objectives
+    deactivated so the next caller can activate exactly one.
+    """
+    objective = model.obj_list[objective_idx + 1]  # ty: ignore[not-subscriptable]
+    objective.activate()
+    try:
+        if reusable is None:
+            solver, selection = select_solver(config)
+            try:
+                _, solve_result = solve_once(
+                    model,
+                    solver,
+                    selection.resolved_backend,
+                    warmstart=config.solve_warmstart,
+                )
+            finally:
+                release_solver(solver, selection.resolved_backend)
+        else:
+            _, solve_result = solve_once(
+                model, *reusable, warmstart=config.solve_warmstart
+            )
+        outcome = solve_result.outcome
+        if on_solve is not None:
+            on_solve(outcome)
+        if outcome != SolveOutcome.OPTIMAL:
+            raise RuntimeError(f"{context} failed (outcome={outcome}).")
+        value = objective()
+        if value is None:
+            # Pyomo returns None when no incumbent is loaded; treat as a
+            # solver-side bug rather than propagating a NaN.
+            raise RuntimeError(f"{context} returned no value.")
+        return float(value)
+    finally:
+        objective.deactivate()
+
+
+def run_setup_chain(
+    model: pyo.ConcreteModel,
+    config: PyAugmeconConfig,
+    chain: SetupChain,
+    reusable: tuple[Any, str] | None,
+    on_solve: Callable[[SolveOutcome], None] | None = None,
+) -> list[float]:
+    """Solve one `SetupChain` on `model` and return one value per objective.
+
+    Shared by the serial setup and `WorkerPool` workers so both produce the
+    same payoff table. Leaves the payoff constraint list empty and every
+    objective sense and variable value as it found them. Each chain thus
+    warm-starts from the same values whichever worker or order runs it, and
+    solver round-off can't differ between the two paths.
+    """
+    payoff_cl = model._pyaugmecon_payoff_constraint_list
+    objectives = model.obj_list
+    start_values = [(var, var.value) for var in model.component_data_objects(Var)]
+    values: list[float] = []
+    try:
+        for objective_idx, value in chain.locks:
+            payoff_cl.add(expr=objectives[objective_idx + 1].expr == value)  # ty: ignore[not-subscriptable]
+        for objective_idx in chain.objectives:
+            objective = objectives[objective_idx + 1]  # ty: ignore[not-subscriptable]
+            original_sense = objective.sense
+            if chain.minimize:
+                objective.sense = minimize
+            try:
+                value = solve_setup_objective(
+                    model,
+                    config,
+                    objective_idx,
+                    reusable,
+                    chain.context(objective_idx),
+                    on_solve,
+                )
+            finally:
+                # Restore maximization so later passes see the original sense.
+                objective.sense = original_sense
+            values.append(value)
+            payoff_cl.add(expr=objective.expr == value)
+    finally:
+        # This chain's equalities would over-constrain the next one.
+        payoff_cl.clear()
+        for var, value in start_values:
+            var.set_value(value, skip_validation=True)
+    return values
+
+
 class Model:
     def __init__(self, model: pyo.ConcreteModel, config: PyAugmeconConfig):
         self.model = model
@@ -76,9 +215,16 @@ def __init__(self, model: pyo.ConcreteModel, config: PyAugmeconConfig):
         self.iter_obj = range(self.n_obj)
         self.constrained_objectives = list(range(1, self.n_obj))
 
-        # Shared-memory counters that workers update during a run.
-        self.models_solved = Counter()
-        self.infeasibilities = Counter()
+        # Shared-memory counters that workers update during a run, created
+        # in the workers' context so their locks can be inherited.
+        ctx = worker_context(config.start_method)
+        self.models_solved = Counter(ctx=ctx)
+        self.infeasibilities = Counter(ctx=ctx)
+        self.cache_hits = Counter(ctx=ctx)
+        self.cache_misses = Counter(ctx=ctx)
+        # Nanoseconds workers spent sweeping grid jobs; sizes dynamic jobs.
+        self.sweep_ns = Counter(ctx=ctx, typecode="q")
+        self.first_grid_solve = FirstMark(ctx)
 
         # Per-objective grid attributes; populated by `find_obj_range`.
         self.nadir_by_obj: dict[int, float] = {}
@@ -98,19 +244,29 @@ def __init__(self, model: pyo.ConcreteModel, config: PyAugmeconConfig):
         # auto-computes nadirs. Explicit nadirs and the payoff strategy
         # both reuse the payoff table and add no setup solves.
         constrained_count = len(self.constrained_objectives)
-        needs_safe_nadir_solves = (
+        self.needs_safe_nadir_solves = (
             config.nadir_points is None and config.nadir_strategy == "safe"
         )
         self.setup_solve_count = self.n_obj**2 + (
-            constrained_count if needs_safe_nadir_solves else 0
+            constrained_count if self.needs_safe_nadir_solves else 0
         )
 
+        # Set by `PyAugmecon` to solve setup chains on pool workers; None
+        # solves them here, one after another.
+        self.setup_runner: SetupRunner | None = None
+        self._safe_nadirs: dict[int, float] | None = None
+        # With `setup_cache`: whether the payoff table came from disk.
+        self.setup_cache_hit: bool | None = None
+        self._setup_cache_path: Path | None = None
+        # Setup results a resumed run takes from its checkpoint.
+        self.preset_setup: SetupEntry | None = None
+
         # Best-effort progress-bar total. Refined in `find_obj_range` once
         # the actual grid sizes are known.
         points = config.get_points_per_objective(constrained_count)
         self.to_solve = self.setup_solve_count + (int(prod(points)) if points else 0)
         self.progress = ProgressBar(
-            Counter(),
+            Counter(ctx=ctx),
             self.to_solve,
             enabled=config.progress_bar,
         )
@@ -133,7 +289,7 @@ def _make_reusable_solver(self) -> tuple[Any, str] | None:
         """
         solver, selection = select_solver(self.config)
         backend = selection.resolved_backend
-        if backend.startswith("appsi_") or backend.endswith("_persistent"):
+        if not reuses_setup_solver(backend):
             release_solver(solver, backend)
             return None
         return (solver, backend)
@@ -182,32 +338,25 @@ def min_to_max(self) -> None:
                 objective.sense = maximize
                 objective.expr = -objective.expr
 
-    def _solve_objective(
-        self, objective_idx: int, reusable: tuple[Any, str] | None, context: str
-    ) -> float:
-        """Activate `objective_idx`, solve, and return the optimal value.
+    def _record_setup_solve(self, outcome: SolveOutcome) -> None:
+        self.outcome = outcome
+        self.progress.increment()
 
-        The try/finally guarantees the model is left with all objectives
-        deactivated so the next caller can activate exactly one.
-        """
-        objective = self.obj(objective_idx)
-        objective.activate()
-        try:
-            if reusable is None:
-                self.solve()
-            else:
-                self._solve_with(*reusable)
-            self.progress.increment()
-            if self.outcome != SolveOutcome.OPTIMAL:
-                raise RuntimeError(f"{context} failed (outcome={self.outcome}).")
-            value = objective()
-            if value is None:
-                # Pyomo returns None when no incumbent is loaded; treat as a
-                # solver-side bug rather than propagating a NaN.
-                raise RuntimeError(f"{context} returned no value.")
-            return float(value)
-        finally:
-            objective.deactivate()
+    def _run_setup(self, chains: list[SetupChain]) -> list[list[float]]:
+        """Solve independent setup chains, on pool workers when available."""
+        if self.setup_runner is not None:
+            return self.setup_runner(chains)
+        with self._reusable_solver() as reusable:
+            return [
+                run_setup_chain(
+                    self.model,
+                    self.config,
+                    chain,
+                    reusable,
+                    on_solve=self._record_setup_solve,
+                )
+                for chain in chains
+            ]
 
     def construct_payoff(self) -> None:
         """Build the lexicographic payoff matrix.
@@ -216,41 +365,102 @@ def construct_payoff(self) -> None:
           1. Solve max f_i(x) on its own and record `payoff[i, i]`.
           2. Lock `f_i(x) == payoff[i, i]` and lex-optimize each `f_j` (j != i),
              recording `payoff[i, j]` and locking each result in turn.
-          3. Clear the transient constraint list before moving to row `i+1`.
 
         The diagonal pass (step 1) is split out so all diagonal entries are
-        filled before any equality constraint is added.
+        filled before any equality constraint is added. After it, the rows
+        are independent chains. With a `setup_runner`, the safe-nadir
+        minimizations join the diagonal batch since they need no payoff value.
+
+        With `setup_cache`, a stored table (and safe nadirs) for a model with
+        the same fingerprint replaces all of these solves.
         """
         self.progress.set_message("Setup")
 
-        with self._reusable_solver() as reusable:
-            self.payoff = np.full((self.n_obj, self.n_obj), np.inf)
-            payoff_cl = ConstraintList()
-            self.model._pyaugmecon_payoff_constraint_list = payoff_cl
-
-            # Pass 1: diagonal.
-            for i in self.iter_obj:
-                self.payoff[i, i] = self._solve_objective(
-                    i, reusable, f"Payoff construction for objective pair ({i}, {i})"
-                )
+        self._safe_nadirs = None
+        if self.preset_setup is not None:
+            self._apply_setup_entry(self.preset_setup)
+        if self.preset_setup is not None or self._load_setup_cache():
+            self.model._pyaugmecon_payoff_constraint_list = ConstraintList()
+            return
+
+        self.payoff = np.full((self.n_obj, self.n_obj), np.inf)
+        self.model._pyaugmecon_payoff_constraint_list = ConstraintList()
+
+        # Pass 1: diagonal (plus safe-nadir bounds when solved in parallel).
+        nadir_chains = (
+            [
+                SetupChain((objective_idx,), minimize=True)
+                for objective_idx in self.constrained_objectives
+            ]
+            if self.setup_runner is not None and self.needs_safe_nadir_solves
+            else []
+        )
+        values = self._run_setup(
+            [SetupChain((i,)) for i in self.iter_obj] + nadir_chains
+        )
+        for i in self.iter_obj:
+            self.payoff[i, i] = values[i][0]
+        if nadir_chains:
+            self._safe_nadirs = {
+                chain.objectives[0]: bound[0]
+                for chain, bound in zip(nadir_chains, values[self.n_obj :], strict=True)
+            }
 
-            # Pass 2: per row `i`, lock f_i and lex-optimize the others.
-            for i in self.iter_obj:
-                payoff_cl.add(expr=self.obj(i).expr == self.payoff[i, i])  # ty: ignore[missing-argument]
+        # Pass 2: per row `i`, lock f_i and lex-optimize the others.
+        others = {i: tuple(j for j in self.iter_obj if j != i) for i in self.iter_obj}
+        rows = self._run_setup(
+            [
+                SetupChain(others[i], locks=((i, self.payoff[i, i]),), row=i)
+                for i in self.iter_obj
+            ]
+        )
+        for i, row_values in zip(self.iter_obj, rows, strict=True):
+            self.payoff[i, list(others[i])] = row_values
+        self._store_setup_cache()
 
-                for j in self.iter_obj:
-                    if i == j:
-                        continue
-                    self.payoff[i, j] = self._solve_objective(
-                        j,
-                        reusable,
-                        f"Payoff construction for objective pair ({i}, {j})",
-                    )
-                    payoff_cl.add(expr=self.obj(j).expr == self.payoff[i, j])  # ty: ignore[missing-argument]
+    def _load_setup_cache(self) -> bool:
+        """Take the payoff table (and safe nadirs) from `setup_cache` if stored.
 
-                # Reset before the next row; this row's equalities would
-                # over-constrain the next.
-                payoff_cl.clear()
+        Fingerprinted before PyAugmecon adds components, so the key only
+        covers the user's model. Skipped solves still advance the progress
+        counter, which counts setup solves ahead of grid points.
+        """
+        if not self.config.setup_cache:
+            return False
+        self._setup_cache_path = setup_cache_path(
+            self.config, model_fingerprint(self.model, self.config)
+        )
+        entry = load_setup_entry(self._setup_cache_path)
+        self.setup_cache_hit = (
+            entry is not None
+            and entry.obj_goal == self.obj_goal
+            and entry.payoff.shape == (self.n_obj, self.n_obj)
+        )
+        if not self.setup_cache_hit:
+            return False
+        assert entry is not None
+        log.debug(f"Loaded payoff table from {self._setup_cache_path}")
+        self._apply_setup_entry(entry)
+        return True
+
+    def _apply_setup_entry(self, entry: SetupEntry) -> None:
+        """Use stored setup results instead of solving for them."""
+        self.payoff = np.array(entry.payoff, dtype=float)
+        skipped = self.n_obj**2
+        if self.needs_safe_nadir_solves and entry.safe_nadirs is not None:
+            self._safe_nadirs = dict(entry.safe_nadirs)
+            skipped += len(self.constrained_objectives)
+        self.progress.counter.add(skipped)
+        self.progress.refresh()
+
+    def setup_entry(self) -> SetupEntry:
+        """This run's setup results, as stored by caches and checkpoints."""
+        return SetupEntry(self.payoff, list(self.obj_goal), self._safe_nadirs)
+
+    def _store_setup_cache(self) -> None:
+        if self._setup_cache_path is None:
+            return
+        store_setup_entry(self._setup_cache_path, self.setup_entry())
 
     def _compute_auto_safe_nadirs(self) -> dict[int, float]:
         """Compute "safe" nadir lower bounds by minimizing each constrained objective.
@@ -258,37 +468,38 @@ def _compute_auto_safe_nadirs(self) -> dict[int, float]:
         After `min_to_max` every objective is in maximization form, so the true
         nadir of `f_j` over the Pareto front is bounded below by the
         unconstrained min of `f_j`. We flip each constrained objective's sense
-        to `minimize` to get that bound, then restore it.
+        to `minimize` to get that bound, then restore it. Bounds already solved
+        alongside the payoff diagonal are reused.
 
         These bounds never cut off Pareto-optimal points; looser bounds only
         cost extra (infeasible) grid solves, never correctness.
         """
         log.debug("Computing auto-safe nadir bounds")
-        bounds: dict[int, float] = {}
-
-        with self._reusable_solver() as reusable:
+        bounds = self._safe_nadirs
+        if bounds is None:
             self.deactivate_all_objectives()
-            for objective_idx in self.constrained_objectives:
-                objective = self.obj(objective_idx)
-                original_sense = objective.sense
-                objective.sense = minimize
-                try:
-                    bound = self._solve_objective(
-                        objective_idx,
-                        reusable,
-                        f"Auto-safe nadir bound for objective {objective_idx + 1}",
-                    )
-                finally:
-                    # Restore maximization so later passes see the original sense.
-                    objective.sense = original_sense
-
-                if not np.isfinite(bound):
-                    raise RuntimeError(
-                        f"Auto-safe nadir for objective {objective_idx + 1} is non-finite: {bound}."
-                    )
-                bounds[objective_idx] = bound
-
-        return bounds
+            values = self._run_setup(
+                [
+                    SetupChain((objective_idx,), minimize=True)
+                    for objective_idx in self.constrained_objectives
+                ]
+            )
+            bounds = {
+                objective_idx: bound[0]
+                for objective_idx, bound in zip(
+                    self.constrained_objectives, values, strict=True
+                )
+            }
+
+        for objective_idx, bound in bounds.items():
+            if not np.isfinite(bound):
+                raise RuntimeError(
+                    f"Auto-safe nadir for objective {objective_idx + 1} is non-finite: {bound}."
+                )
+        if self._safe_nadirs is None:
+            self._safe_nadirs = bounds
+            self._store_setup_cache()
+        return dict(bounds)
 
     def _compute_payoff_nadirs(self) -> dict[int, float]:
         """Compute nadir lower bounds from the payoff table column minima.
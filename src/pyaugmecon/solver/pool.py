@@ -0,0 +1,615 @@
+"""Long-lived worker processes reused across `PyAugmecon.solve` runs."""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from multiprocessing import Queue, cpu_count, get_all_start_methods
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.sharedctypes import typecode_to_type
+from multiprocessing.synchronize import Event as MpEvent
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+import pyomo.environ as pyo
+from loguru import logger as log
+
+from pyaugmecon.config import PyAugmeconConfig, StartMethod
+from pyaugmecon.helper import worker_context
+from pyaugmecon.solver.adapter import release_solver
+from pyaugmecon.solver.model import (
+    Model,
+    SetupChain,
+    reuses_setup_solver,
+    run_setup_chain,
+)
+from pyaugmecon.solver.process import _MAX_WAIT_SECONDS, ProcessHandler
+from pyaugmecon.solver.queue import QueueHandler, StealBoard, Wakeup
+from pyaugmecon.solver.worker import (
+    SharedUIntArray,
+    SkipBuffers,
+    SolverCache,
+    WorkerSpec,
+    load_model_blob,
+    select_cached_solver,
+    solver_worker_main,
+)
+
+# Per-worker slots: the five counters in `solver_worker_main` order, the
+# worker's sweep time, then its first grid-solve stamp.
+_COUNT_SLOTS = 6
+_SLOTS_PER_WORKER = _COUNT_SLOTS + 1
+
+# How long `terminate_early` lets busy pool workers finish their current solve
+# before the pool is shut down to reclaim them.
+_STOP_GRACE_SECONDS = 5.0
+
+
+class _SlotCounter:
+    """`Counter` stand-in backed by one pool worker's slot in a shared array.
+
+    Every slot has a single writer (its worker), so updates need no lock; the
+    parent only reads and turns slot totals into deltas for the run's
+    `Model` counters.
+    """
+
+    __slots__ = ("_counts", "_index")
+
+    def __init__(self, counts: Any, index: int) -> None:
+        self._counts = counts
+        self._index = index
+
+    def add(self, amount: int = 1) -> None:
+        self._counts[self._index] += amount
+
+    def value(self) -> int:
+        return self._counts[self._index]
+
+
+class _SlotMark(_SlotCounter):
+    """`FirstMark` stand-in: a worker's first stamp in its own slot."""
+
+    __slots__ = ()
+
+    def mark(self, at_ns: int | None = None) -> None:
+        if not self._counts[self._index]:
+            self._counts[self._index] = time.time_ns() if at_ns is None else at_ns
+
+
+@dataclass(frozen=True, slots=True)
+class _SkipTable:
+    """SharedMemory-backed skip table, attached by name in pool workers."""
+
+    name: str
+    cells: int
+    typecode: str
+
+
+@dataclass(frozen=True, slots=True)
+class _PoolRun:
+    """Everything a pool worker needs for one solve run."""
+
+    config: PyAugmeconConfig
+    logfile: str
+    spec: WorkerSpec
+    flag_table: _SkipTable | None
+    flag_shape: tuple[int, ...]
+    flag_is_shared: bool
+    outer_skip_table: _SkipTable | None
+    outer_skip_shape: tuple[int, ...] | None
+    shared_jobs: bool
+    work_stealing: bool
+
+
+@dataclass(frozen=True, slots=True)
+class _SetupTask:
+    """One payoff/nadir `SetupChain` for a pool worker.
+
+    `model_shm_name` holds the pickled model before epsilon conversion;
+    workers keep the last one they loaded, so a run's chains share it.
+    """
+
+    config: PyAugmeconConfig
+    model_shm_name: str
+    model_shm_size: int
+    index: int
+    chain: SetupChain
+
+
+def _attach_table(
+    table: _SkipTable | None, handles: list[SharedMemory]
+) -> SharedUIntArray | None:
+    if table is None:
+        return None
+    shm = SharedMemory(name=table.name)
+    handles.append(shm)
+    ctype = typecode_to_type[table.typecode]
+    return (ctype * table.cells).from_buffer(shm.buf)  # ty: ignore[invalid-argument-type]
+
+
+def _report_error(error_q: Queue, worker_id: int, backend: str) -> None:
+    """Put the exception being handled on `error_q` for the parent to raise."""
+    error_q.put(
+        {
+            "worker_id": worker_id,
+            "backend": backend,
+            "traceback": traceback.format_exc(),
+        }
+    )
+
+
+def _run_pool_job(
+    worker_id: int,
+    run: _PoolRun,
+    job_q: Queue,
+    result_q: Queue,
+    error_q: Queue,
+    stop_event: MpEvent,
+    counters: tuple[_SlotCounter, ...],
+    solver_cache: SolverCache,
+    steal_board: StealBoard,
+    wakeup: Wakeup | None,
+) -> None:
+    handles: list[SharedMemory] = []
+    in_worker = False
+    try:
+        skip_buffers = SkipBuffers(
+            flag_buffer=_attach_table(run.flag_table, handles),
+            flag_shape=run.flag_shape,
+            flag_is_shared=run.flag_is_shared,
+            outer_skip_buffer=_attach_table(run.outer_skip_table, handles),
+            outer_skip_shape=run.outer_skip_shape,
+        )
+        (
+            visited,
+            solved,
+            infeasible,
+            cache_hits,
+            cache_misses,
+            busy,
+            first_solve,
+        ) = counters
+        in_worker = True
+        solver_worker_main(
+            worker_id,
+            run.config,
+            run.logfile,
+            run.spec,
+            job_q,
+            result_q,
+            error_q,
+            stop_event,
+            visited,  # ty: ignore[invalid-argument-type]
+            solved,  # ty: ignore[invalid-argument-type]
+            infeasible,  # ty: ignore[invalid-argument-type]
+            skip_buffers,
+            cache_hits,  # ty: ignore[invalid-argument-type]
+            cache_misses,  # ty: ignore[invalid-argument-type]
+            None,
+            first_solve,  # ty: ignore[invalid-argument-type]
+            solver_cache=solver_cache,
+            steal_board=steal_board if run.work_stealing else None,
+            busy_counter=busy,  # ty: ignore[invalid-argument-type]
+            wakeup=wakeup,
+        )
+    except Exception:
+        # `solver_worker_main` reports its own failures; anything raised while
+        # attaching the run is reported here. Either way the worker stays up
+        # for the next run.
+        if not in_worker:
+            _report_error(error_q, worker_id, "unresolved")
+    finally:
+        skip_buffers = None
+        for shm in handles:
+            with contextlib.suppress(BufferError):
+                shm.close()
+
+
+def _run_setup_task(
+    worker_id: int,
+    task: _SetupTask,
+    error_q: Queue,
+    setup_models: dict[str, pyo.ConcreteModel],
+    solver_cache: SolverCache,
+) -> list[float] | None:
+    """Solve one setup chain; report failures on `error_q` and return None."""
+    backend = "unresolved"
+    try:
+        model = setup_models.get(task.model_shm_name)
+        if model is None:
+            setup_models.clear()
+            model = load_model_blob(task.model_shm_name, task.model_shm_size)
+            setup_models[task.model_shm_name] = model
+        solver, backend = select_cached_solver(task.config, solver_cache)
+        reusable = (solver, backend) if reuses_setup_solver(backend) else None
+        return run_setup_chain(model, task.config, task.chain, reusable)
+    except Exception:
+        _report_error(error_q, worker_id, backend)
+        return None
+
+
+def pool_worker_main(
+    worker_id: int,
+    control_q: Queue,
+    done_q: Queue,
+    shared_job_q: Queue,
+    own_job_q: Queue,
+    result_q: Queue,
+    error_q: Queue,
+    stop_event: MpEvent,
+    counts: Any,
+    steal_board: StealBoard,
+    wakeup: Wakeup,
+) -> None:
+    """Pool worker loop: solve `_SetupTask` chains and `_PoolRun` grids.
+
+    Solvers selected in one run stay in `solver_cache` for later runs with
+    the same solver settings and are only released at pool shutdown.
+    """
+    base = worker_id * _SLOTS_PER_WORKER
+    counters = (
+        *(_SlotCounter(counts, base + slot) for slot in range(_COUNT_SLOTS)),
+        _SlotMark(counts, base + _COUNT_SLOTS),
+    )
+    solver_cache: SolverCache = {}
+    setup_models: dict[str, pyo.ConcreteModel] = {}
+    try:
+        while (run := control_q.get()) is not None:
+            if isinstance(run, _SetupTask):
+                values = _run_setup_task(
+                    worker_id, run, error_q, setup_models, solver_cache
+                )
+                done_q.put((worker_id, run.index, values))
+                wakeup.notify()
+                continue
+            setup_models.clear()
+            _run_pool_job(
+                worker_id,
+                run,
+                shared_job_q if run.shared_jobs else own_job_q,
+                result_q,
+                error_q,
+                stop_event,
+                counters,
+                solver_cache,
+                steal_board,
+                wakeup,
+            )
+            done_q.put(worker_id)
+            wakeup.notify()
+    finally:
+        for solver, backend in solver_cache.values():
+            with contextlib.suppress(Exception):
+                release_solver(solver, backend)
+
+
+class WorkerPool:
+    """Worker processes kept alive across several `PyAugmecon.solve` runs.
+
+    A plain multi-worker run spawns fresh processes, which re-import Pyomo in
+    every child and select (for Gurobi: license) a solver again. A pool pays
+    that once; each run only ships its model blob, `WorkerSpec`, and skip
+    tables. Runs on one pool must not overlap. `start_method` works as in
+    `PyAugmeconConfig`; the pool's choice applies to all its runs.
+
+        with WorkerPool(8) as pool:
+            for model in scenarios:
+                PyAugmecon(model, config, pool=pool).solve()
+    """
+
+    def __init__(
+        self, workers: int | None = None, *, start_method: StartMethod = "spawn"
+    ) -> None:
+        self.workers = cpu_count() if workers is None else int(workers)
+        if self.workers < 1:
+            raise ValueError("`workers` must be >= 1.")
+        if start_method not in get_all_start_methods():
+            raise ValueError(
+                f"`start_method='{start_method}'` is not available on this platform."
+            )
+
+        ctx = worker_context(start_method)
+        self.ctx = ctx
+        self.shared_job_q: Queue = ctx.Queue()
+        self.job_q_by_worker: list[Queue] = [ctx.Queue() for _ in range(self.workers)]
+        self.result_q: Queue = ctx.Queue()
+        self.error_q: Queue = ctx.Queue()
+        self.done_q: Queue = ctx.Queue()
+        self.stop_event = ctx.Event()
+        self.counts = ctx.Array("q", self.workers * _SLOTS_PER_WORKER, lock=False)
+        self.steal_board = StealBoard(ctx, self.workers)
+        self.wakeup = Wakeup(ctx)
+        self._control_qs: list[Queue] = [ctx.Queue() for _ in range(self.workers)]
+        self._busy = False
+        self.closed = False
+
+        self.procs: list[BaseProcess] = [
+            ctx.Process(
+                target=pool_worker_main,
+                name=f"pyaugmecon-pool-worker-{worker_id}",
+                args=(
+                    worker_id,
+                    self._control_qs[worker_id],
+                    self.done_q,
+                    self.shared_job_q,
+                    self.job_q_by_worker[worker_id],
+                    self.result_q,
+                    self.error_q,
+                    self.stop_event,
+                    self.counts,
+                    self.steal_board,
+                    self.wakeup,
+                ),
+                daemon=True,
+            )
+            for worker_id in range(self.workers)
+        ]
+        for proc in self.procs:
+            proc.start()
+
+    def __enter__(self) -> WorkerPool:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop all pool workers, releasing their solvers. Idempotent."""
+        if self.closed:
+            return
+        self.closed = True
+        self.stop_event.set()
+        for control_q in self._control_qs:
+            control_q.put(None)
+        deadline = time.perf_counter() + timeout
+        for proc in self.procs:
+            proc.join(timeout=max(0.0, deadline - time.perf_counter()))
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(timeout=0.2)
+
+    def _acquire(self) -> None:
+        if self.closed:
+            raise RuntimeError("WorkerPool has been shut down.")
+        if self._busy:
+            raise RuntimeError("WorkerPool is already running another solve.")
+        if any(proc.exitcode is not None for proc in self.procs):
+            self.shutdown()
+            raise RuntimeError("A WorkerPool process has exited; create a new pool.")
+        self._busy = True
+
+    def _release(self) -> None:
+        self._busy = False
+
+    def _submit(self, run: _PoolRun, worker_count: int) -> None:
+        for control_q in self._control_qs[:worker_count]:
+            control_q.put(run)
+
+    def run_setup(
+        self,
+        config: PyAugmeconConfig,
+        model_shm_name: str,
+        model_shm_size: int,
+        chains: list[SetupChain],
+        on_values: Callable[[list[float]], None] | None = None,
+    ) -> list[list[float]]:
+        """Solve independent setup chains on idle workers; values in chain order.
+
+        Each worker takes one chain at a time, so long rows don't hold up
+        short ones. After a failure no new chains are handed out; the ones
+        still running are waited for so their output can't leak into the
+        next run.
+        """
+        self._acquire()
+        try:
+            pending = deque(enumerate(chains))
+            idle = list(range(self.workers))
+            running = 0
+            results: list[list[float] | None] = [None] * len(chains)
+            errors: list[dict[str, Any]] = []
+            while running or (pending and not errors):
+                while pending and idle and not errors:
+                    index, chain = pending.popleft()
+                    self._control_qs[idle.pop()].put(
+                        _SetupTask(config, model_shm_name, model_shm_size, index, chain)
+                    )
+                    running += 1
+                wait(
+                    [self.wakeup.reader, *(proc.sentinel for proc in self.procs)],
+                    timeout=_MAX_WAIT_SECONDS,
+                )
+                self.wakeup.clear()
+                if any(proc.exitcode is not None for proc in self.procs):
+                    self.shutdown(timeout=0.0)
+                    raise RuntimeError("A WorkerPool process exited unexpectedly.")
+                for worker_id, index, values in QueueHandler._drain_queue(self.done_q):
+                    idle.append(worker_id)
+                    running -= 1
+                    results[index] = values
+                    if values is None:
+                        errors.append(self.error_q.get())
+                    elif on_values is not None:
+                        on_values(values)
+            if errors:
+                raise RuntimeError(
+                    "\n\n".join(
+                        f"Worker {e['worker_id']} failed (backend={e['backend']}):\n{e['traceback']}"
+                        for e in errors
+                    )
+                )
+            return [values for values in results if values is not None]
+        finally:
+            self._release()
+
+
+class PoolProcessHandler(ProcessHandler):
+    """`ProcessHandler` that hands one run to a `WorkerPool` instead of spawning.
+
+    Completion is a `done_q` message per participating worker rather than a
+    process exit, and the pool's per-worker count slots are folded into the
+    run's `Model` counters as they change.
+    """
+
+    def __init__(
+        self,
+        pool: WorkerPool,
+        config: PyAugmeconConfig,
+        model: Model,
+        queues: QueueHandler,
+        worker_spec: WorkerSpec,
+        *,
+        logfile: str,
+    ):
+        super().__init__(config, model, queues, worker_spec, logfile=logfile)
+        self.pool = pool
+        self.ctx = pool.ctx
+        self.stop_event = pool.stop_event
+        self.wakeup = pool.wakeup
+        self.procs = pool.procs
+        self._pending: set[int] = set()
+        self._tables: dict[int, _SkipTable] = {}
+        self._table_shms: list[SharedMemory] = []
+        self._seen_counts = np.zeros(_COUNT_SLOTS, dtype=np.int64)
+        self._acquired = False
+
+    def _allocate_skip_table(self, cells: int, typecode: str) -> SharedUIntArray:
+        """Zeroed table in a named SharedMemory block.
+
+        Pool workers were spawned before this run, so they attach by name
+        instead of inheriting a ctypes array.
+        """
+        ctype = typecode_to_type[typecode]
+        shm = SharedMemory(create=True, size=max(1, cells) * ctypes.sizeof(ctype))
+        self._table_shms.append(shm)
+        table = (ctype * cells).from_buffer(shm.buf)  # ty: ignore[invalid-argument-type]
+        ctypes.memset(table, 0, ctypes.sizeof(table))
+        self._tables[id(table)] = _SkipTable(shm.name, cells, typecode)
+        return table
+
+    def start(self) -> None:
+        """Send this run to the first `worker_count` pool workers."""
+        self.pool._acquire()
+        self._acquired = True
+        self._started_at = time.perf_counter()
+        self.stop_event.clear()
+        np.ctypeslib.as_array(self.pool.counts).fill(0)
+        self.pool.steal_board.reset()
+        self._skip_buffers = buffers = self._build_skip_buffers()
+
+        def table(buffer: SharedUIntArray | None) -> _SkipTable | None:
+            return None if buffer is None else self._tables[id(buffer)]
+
+        run = _PoolRun(
+            config=self.config,
+            logfile=self.logfile,
+            spec=self.worker_spec,
+            flag_table=table(buffers.flag_buffer),
+            flag_shape=buffers.flag_shape,
+            flag_is_shared=buffers.flag_is_shared,
+            outer_skip_table=table(buffers.outer_skip_buffer),
+            outer_skip_shape=buffers.outer_skip_shape,
+            shared_jobs=self.queues.shared_job_q is not None,
+            work_stealing=self.queues.steal_board is not None,
+        )
+        self._pending = set(range(self.queues.worker_count))
+        self.pool._submit(run, self.queues.worker_count)
+
+    def join(self) -> bool:
+        """Wait for pool activity; return True once every worker finished the run."""
+        wait_seconds = self._wait_seconds()
+        wait(
+            [self.wakeup.reader, *(proc.sentinel for proc in self.procs)],
+            timeout=wait_seconds,
+        )
+        self.wakeup.clear()
+        self._sync_counts()
+        self._collect_done()
+        self._raise_worker_errors()
+
+        if any(proc.exitcode is not None for proc in self.procs):
+            self.terminate_early()
+            raise RuntimeError("A WorkerPool process exited unexpectedly.")
+
+        return not self._pending
+
+    def _collect_done(self) -> None:
+        if self._pending:
+            self._pending.difference_update(QueueHandler._drain_queue(self.pool.done_q))
+
+    def _sync_counts(self) -> None:
+        """Add the pool's new per-run counts to the `Model` counters."""
+        slots = np.ctypeslib.as_array(self.pool.counts).reshape(
+            self.pool.workers, _SLOTS_PER_WORKER
+        )
+        stamps = slots[:, _COUNT_SLOTS]
+        if stamps.any():
+            self.model.first_grid_solve.mark(int(stamps[stamps > 0].min()))
+        totals = slots[:, :_COUNT_SLOTS].sum(axis=0)
+        delta = totals - self._seen_counts
+        self._seen_counts = totals
+        counters = (
+            self.model.progress.counter,
+            self.model.models_solved,
+            self.model.infeasibilities,
+            self.model.cache_hits,
+            self.model.cache_misses,
+            self.model.sweep_ns,
+        )
+        for counter, amount in zip(counters, delta.tolist(), strict=True):
+            counter.add(amount)
+
+    def terminate_early(self) -> None:
+        """Stop the run; shut the pool down if workers don't stop in time."""
+        self.stop_event.set()
+        deadline = time.perf_counter() + _STOP_GRACE_SECONDS
+        while self._pending and time.perf_counter() < deadline:
+            if any(proc.exitcode is not None for proc in self.procs):
+                break
+            wait(
+                [self.wakeup.reader],
+                timeout=max(0.0, deadline - time.perf_counter()),
+            )
+            self.wakeup.clear()
+            self._collect_done()
+        if self._pending:
+            log.info("WorkerPool did not stop in time; shutting it down.")
+            self.pool.shutdown(timeout=0.0)
+
+    def close(self) -> None:
+        """Leave the pool ready for the next run and free this run's tables."""
+        if not self._acquired:
+            return
+        if self._pending and not self.pool.closed:
+            self.terminate_early()
+        self._sync_counts()
+        if self.stop_event.is_set() and not self.pool.closed:
+            # Jobs (and end markers) left behind by a stopped run would leak
+            # into the next one.
+            for q in (self.pool.shared_job_q, *self.pool.job_q_by_worker):
+                QueueHandler._drain_queue(q)
+            for q in (self.pool.result_q, self.pool.error_q, self.pool.done_q):
+                QueueHandler._drain_queue(q)
+            self.wakeup.clear()
+            self.stop_event.clear()
+        self._skip_buffers = None
+        self._tables.clear()
+        for shm in self._table_shms:
+            with contextlib.suppress(BufferError):
+                shm.close()
+            shm.unlink()
+        self._table_shms = []
+        self._acquired = False
+        self.pool._release()
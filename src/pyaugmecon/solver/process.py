@@ -4,16 +4,28 @@
 
 import time
 from math import prod
-from multiprocessing import get_context
+from multiprocessing.connection import wait
 from multiprocessing.process import BaseProcess
 
 import numpy as np
 from loguru import logger as log
 
 from pyaugmecon.config import PyAugmeconConfig
+from pyaugmecon.helper import worker_context
 from pyaugmecon.solver.model import Model
-from pyaugmecon.solver.queue import QueueHandler
-from pyaugmecon.solver.worker import SkipBuffers, WorkerSpec, solver_worker_main
+from pyaugmecon.solver.queue import QueueHandler, Wakeup
+from pyaugmecon.solver.worker import (
+    FlagTable,
+    SharedUIntArray,
+    SkipBuffers,
+    WorkerSpec,
+    skip_typecode,
+    solver_worker_main,
+)
+
+# Upper bound for one `join` wait. Workers signal the `Wakeup` pipe after
+# each job; this only bounds the delay when a signal beats its queue item.
+_MAX_WAIT_SECONDS = 0.25
 
 
 class ProcessHandler:
@@ -34,11 +46,15 @@ def __init__(
         self.worker_spec = worker_spec
         self.logfile = logfile
 
-        self.ctx = get_context("spawn")
+        self.ctx = worker_context(config.start_method)
         self.stop_event = self.ctx.Event()
+        self.wakeup = Wakeup(self.ctx)
         self.procs: list[BaseProcess] = []
         self._skip_buffers: SkipBuffers | None = None
         self._started_at: float = 0.0
+        # Flat flag / outer-skip tables from a checkpoint, copied into the
+        # shared tables when they are allocated.
+        self.restore_skip: tuple[np.ndarray | None, np.ndarray | None] = (None, None)
 
     def start(self) -> None:
         """Start worker processes."""
@@ -62,7 +78,16 @@ def start(self) -> None:
                     self.model.models_solved,
                     self.model.infeasibilities,
                     self._skip_buffers,
+                    self.model.cache_hits,
+                    self.model.cache_misses,
+                    self.queues.point_ring_for_worker(worker_id),
+                    self.model.first_grid_solve,
                 ),
+                kwargs={
+                    "steal_board": self.queues.steal_board,
+                    "busy_counter": self.model.sweep_ns,
+                    "wakeup": self.wakeup,
+                },
             )
             for worker_id in range(self.queues.worker_count)
         ]
@@ -70,18 +95,42 @@ def start(self) -> None:
             proc.start()
 
     def join(self) -> bool:
-        """Poll workers; return True once all have exited cleanly."""
+        """Wait for worker activity; return True once all have exited cleanly.
+
+        Blocks on the worker sentinels and the `Wakeup` pipe, so it
+        returns as soon as a worker exits, fails, or sends results, and
+        otherwise after `_MAX_WAIT_SECONDS` or at `process_timeout`.
+        """
+        wait_seconds = self._wait_seconds()
+        running = [proc.sentinel for proc in self.procs if proc.exitcode is None]
+        if running:
+            wait([*running, self.wakeup.reader], timeout=wait_seconds)
+        # Taken before results and errors are drained, so none is missed.
+        self.wakeup.clear()
+
+        # Workers report exceptions via error_q; check that before exit codes
+        # so we surface the real traceback rather than just a nonzero status.
+        self._raise_worker_errors()
+
+        if any(p.exitcode not in (None, 0) for p in self.procs):
+            self.terminate_early()
+            raise RuntimeError("At least one worker exited unexpectedly.")
+
+        return all(p.exitcode is not None for p in self.procs)
+
+    def _wait_seconds(self) -> float:
+        """Longest wait allowed now; stop workers once `process_timeout` passed."""
         timeout = self.config.process_timeout
-        if timeout is not None and time.perf_counter() - self._started_at > timeout:
+        if timeout is None:
+            return _MAX_WAIT_SECONDS
+        remaining = timeout - (time.perf_counter() - self._started_at)
+        if remaining < 0:
             log.info("Timed out.")
             self.terminate_early()
             raise TimeoutError(f"Process timeout reached after {timeout} seconds.")
+        return min(_MAX_WAIT_SECONDS, remaining)
 
-        for proc in self.procs:
-            proc.join(timeout=0.1)
-
-        # Workers report exceptions via error_q; check that before exit codes
-        # so we surface the real traceback rather than just a nonzero status.
+    def _raise_worker_errors(self) -> None:
         errors = self.queues.get_error()
         if errors:
             self.terminate_early()
@@ -92,12 +141,6 @@ def join(self) -> bool:
             )
             raise RuntimeError(message)
 
-        if any(p.exitcode not in (None, 0) for p in self.procs):
-            self.terminate_early()
-            raise RuntimeError("At least one worker exited unexpectedly.")
-
-        return all(p.exitcode is not None for p in self.procs)
-
     def terminate_early(self) -> None:
         """Stop all workers. Signal cooperatively, then SIGTERM stragglers."""
         self.stop_event.set()
@@ -110,25 +153,55 @@ def terminate_early(self) -> None:
     def close(self) -> None:
         self._skip_buffers = None
 
+    def skip_tables(self) -> tuple[np.ndarray | None, np.ndarray | None]:
+        """Flat copies of the shared flag and outer-skip tables, if in use."""
+        buffers = self._skip_buffers
+        if buffers is None:
+            return None, None
+        return tuple(  # ty: ignore[invalid-return-type]
+            None if buffer is None else np.ctypeslib.as_array(buffer).copy()
+            for buffer in (buffers.flag_buffer, buffers.outer_skip_buffer)
+        )
+
+    def _restore_table(
+        self, buffer: SharedUIntArray | None, saved: np.ndarray | None
+    ) -> None:
+        if buffer is None or saved is None:
+            return
+        table = np.ctypeslib.as_array(buffer)
+        # Checkpoints from another table layout are ignored, not reinterpreted.
+        if table.shape == saved.shape and table.dtype == saved.dtype:
+            table[:] = saved
+
+    def _allocate_skip_table(self, cells: int, typecode: str) -> SharedUIntArray:
+        """Zeroed shared table that spawned workers inherit."""
+        return self.ctx.Array(typecode, cells, lock=False)
+
     def _build_skip_buffers(self) -> SkipBuffers:
         """Allocate the AUGMECON-R skip tables for the active run.
 
         Two independent stores share one struct because they always travel
         together to workers:
 
-        * Flag table (`config.flag`): per-cell skip counts. Shared mode uses a
-          `lock=False` ctypes array; updates are advisory and monotone (workers
-          only ratchet a cell upward via `np.maximum`), so a missed update
-          under a race only causes a re-solve, not a wrong answer.
+        * Flag table (`config.flag`): skippable inner runs per outer cell (see
+          `FlagTable`), so its size follows the outer grid rather than every
+          grid point. Shared mode uses a `lock=False` ctypes array; updates
+          are advisory and monotone, so a missed update under a race only
+          causes a re-solve, not a wrong answer.
         * Outer-grid skip table (`work_distribution='outer_grid'`): per
           slower-changing-objective combination, the first inner index known
           to be infeasible. Same race-tolerance argument as flags.
+
+        Cells only hold inner indices, so both tables use the narrowest
+        unsigned type that fits the inner grid size.
         """
         flag_shape = tuple(self.model.grid_sizes_inner)
         flag_buffer = None
         flag_is_shared = False
         if self.config.flag and self.config.flag_policy == "shared":
-            flag_buffer = self.ctx.Array("I", self.model.grid_point_count, lock=False)
+            flag_buffer = self._allocate_skip_table(
+                FlagTable.size(flag_shape), FlagTable.typecode(flag_shape)
+            )
             flag_is_shared = True
 
         outer_skip_buffer = None
@@ -140,7 +213,9 @@ def _build_skip_buffers(self) -> SkipBuffers:
             outer_skip_shape = tuple(self.model.grid_sizes_inner[1:])
             outer_cells = int(prod(outer_skip_shape))
             if outer_cells > 0:
-                outer_skip_buffer = self.ctx.Array("I", outer_cells, lock=False)
+                outer_skip_buffer = self._allocate_skip_table(
+                    outer_cells, skip_typecode(self.model.grid_sizes_inner[0])
+                )
                 view = np.ctypeslib.as_array(outer_skip_buffer).reshape(
                     outer_skip_shape, order="F"
                 )
@@ -148,6 +223,8 @@ def _build_skip_buffers(self) -> SkipBuffers:
             else:
                 outer_skip_shape = None
 
+        self._restore_table(flag_buffer, self.restore_skip[0])
+        self._restore_table(outer_skip_buffer, self.restore_skip[1])
         return SkipBuffers(
             flag_buffer=flag_buffer,
             flag_shape=flag_shape,
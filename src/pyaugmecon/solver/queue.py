@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import queue
+import time
+from collections.abc import Sequence
 from math import prod
 from multiprocessing import Queue
-from typing import TypedDict
+from typing import TYPE_CHECKING, Any, Protocol, TypedDict
+
+import numpy as np
 
 from pyaugmecon.config import PyAugmeconConfig
 from pyaugmecon.results import WorkerChunk
 
+if TYPE_CHECKING:
+    from pyaugmecon.solver.pool import WorkerPool
+
 
 class WorkerError(TypedDict):
     worker_id: int
@@ -17,8 +24,225 @@ class WorkerError(TypedDict):
     traceback: str
 
 
+class _StopFlag(Protocol):
+    def is_set(self) -> bool: ...
+
+
+class Wakeup:
+    """A pipe workers signal after handing the parent results or errors.
+
+    The parent waits on `reader` next to the worker sentinels and calls
+    `clear` before draining. `notify` only writes while no signal is pending,
+    so the pipe holds about one message per worker and a parent busy
+    elsewhere never leaves workers blocked on it.
+
+    `multiprocessing.Queue.put` hands items to a feeder thread, so a signal
+    can arrive just before its item is readable. `QueueHandler._drain_queue`
+    waits briefly on its first read for that reason, and callers still wait
+    with a timeout.
+    """
+
+    def __init__(self, ctx: Any) -> None:
+        self.reader, self._writer = ctx.Pipe(duplex=False)
+        self._pending = ctx.RawValue("b", 0)
+
+    def notify(self) -> None:
+        if not self._pending.value:
+            self._pending.value = 1
+            self._writer.send_bytes(b"")
+
+    def clear(self) -> None:
+        """Take pending signals; call before draining what they announce."""
+        self._pending.value = 0
+        while self.reader.poll():
+            self.reader.recv_bytes()
+
+
+class PointRing:
+    """Bounded single-producer, single-consumer ring of objective points.
+
+    Rows live in a `lock=False` shared float64 array; the two cursors count
+    rows ever written and read, and only move under their `Value` locks, so
+    the parent sees a row only after the worker has finished writing it. The
+    worker blocks while the ring is full, which bounds parent memory and
+    pushes back on workers when the parent falls behind; it signals the
+    `Wakeup` while it waits, so the parent drains the ring right away.
+    """
+
+    def __init__(self, ctx: Any, capacity: int, n_obj: int) -> None:
+        self.capacity = capacity
+        self.n_obj = n_obj
+        self._buffer = ctx.Array("d", capacity * n_obj, lock=False)
+        self._written = ctx.Value("Q", 0)
+        self._read = ctx.Value("Q", 0)
+
+    def _rows(self) -> np.ndarray:
+        return np.ctypeslib.as_array(self._buffer).reshape(self.capacity, self.n_obj)
+
+    def write(
+        self,
+        points: np.ndarray,
+        stop_event: _StopFlag,
+        wakeup: Wakeup | None = None,
+    ) -> bool:
+        """Append `points`, waiting for free space; False if stopped first."""
+        rows = self._rows()
+        written = self._written.value
+        offset = 0
+        while offset < len(points):
+            free = self.capacity - (written - self._read.value)
+            if not free:
+                if stop_event.is_set():
+                    return False
+                if wakeup is not None:
+                    wakeup.notify()
+                time.sleep(0.001)
+                continue
+            count = min(free, len(points) - offset)
+            start = written % self.capacity
+            head = min(count, self.capacity - start)
+            rows[start : start + head] = points[offset : offset + head]
+            rows[: count - head] = points[offset + head : offset + count]
+            written += count
+            offset += count
+            with self._written.get_lock():
+                self._written.value = written
+        return True
+
+    def read(self) -> np.ndarray:
+        """Copy out every point written since the last read."""
+        written = self._written.value
+        read = self._read.value
+        positions = np.arange(read, written) % self.capacity
+        points = self._rows()[positions]
+        with self._read.get_lock():
+            self._read.value = written
+        return points
+
+
+class StealBoard:
+    """Shared `(position, stop)` of the range each worker is sweeping.
+
+    Used by `outer_grid` runs once the job queue is empty: an idle worker
+    cuts the back half off the busiest worker's range and sweeps it itself.
+    Cuts fall on multiples of `unit` (one row of the innermost objective), so
+    both halves keep whole outer-objective combinations. An owner only
+    publishes its position and re-reads its stop at those row boundaries,
+    and a thief never cuts into the row the owner is in, so no point is
+    visited twice or dropped. All slots share one lock; owners take it once
+    per row.
+    """
+
+    def __init__(self, ctx: Any, workers: int) -> None:
+        self.workers = workers
+        self._slots = ctx.Array("q", 2 * workers, lock=False)
+        self._lock = ctx.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            np.ctypeslib.as_array(self._slots).fill(0)
+
+    def claim(self, worker_id: int, work: range) -> None:
+        """Publish a range `worker_id` took from the job queue."""
+        with self._lock:
+            self._slots[2 * worker_id] = work.start
+            self._slots[2 * worker_id + 1] = work.stop
+
+    def sync(self, worker_id: int, position: int) -> int:
+        """Publish the owner's row-aligned `position`; return its current stop."""
+        with self._lock:
+            self._slots[2 * worker_id] = position
+            return self._slots[2 * worker_id + 1]
+
+    def finish(self, worker_id: int) -> int:
+        """Clear the owner's slot; return the stop its range ended at."""
+        with self._lock:
+            stop = self._slots[2 * worker_id + 1]
+            self._slots[2 * worker_id] = 0
+            self._slots[2 * worker_id + 1] = 0
+            return stop
+
+    def steal(self, worker_id: int, unit: int) -> range | None:
+        """Move the back half of the busiest range to `worker_id`, if any.
+
+        Only whole rows after the owner's current row can be taken. The
+        thief's slot is filled before the lock is released, so the stolen
+        range can itself be split by the next idle worker.
+        """
+        slots = self._slots
+        with self._lock:
+            best, best_rows, best_cut = -1, 0, 0
+            for victim in range(self.workers):
+                if victim == worker_id:
+                    continue
+                position, stop = slots[2 * victim], slots[2 * victim + 1]
+                cut = (position // unit + 1) * unit
+                rows = -(-(stop - cut) // unit)
+                if rows > best_rows:
+                    best, best_rows, best_cut = victim, rows, cut
+            if best < 0:
+                return None
+            start = best_cut + (best_rows // 2) * unit
+            stop = slots[2 * best + 1]
+            slots[2 * best + 1] = start
+            slots[2 * worker_id] = start
+            slots[2 * worker_id + 1] = stop
+            return range(start, stop)
+
+
+# Points per job before workers have reported any sweep time.
+_INITIAL_CHUNK = 8
+
+# Jobs per worker kept queued or running ahead of the workers.
+_JOBS_AHEAD = 3
+
+
+class ChunkPlanner:
+    """Size `dynamic` jobs from the cost per grid point workers report.
+
+    Workers add the time they spend sweeping each job and the points it
+    covered, solved or skipped. Between two `observe` calls that gives the
+    cost of one visited point: the solve latency times the share of points
+    that are not skipped. Jobs aim at `target_seconds` of one worker's time.
+    Near the end of the sweep no job takes more than `1 / (2 * workers)` of
+    the points left, so workers finish close together. Until the first
+    measurement, jobs hold `initial` points.
+    """
+
+    def __init__(self, target_seconds: float, workers: int, initial: int) -> None:
+        self.target_seconds = target_seconds
+        self.workers = workers
+        self.initial = initial
+        self.point_seconds: float | None = None
+        self._seen = (0, 0)
+
+    def observe(self, swept: int, busy_ns: int) -> None:
+        """Fold in totals of points swept and nanoseconds spent this run."""
+        points = swept - self._seen[0]
+        if points <= 0 or busy_ns <= self._seen[1]:
+            return
+        # Only the latest window counts: skips grow as flags fill in, so
+        # points get cheaper over the sweep.
+        self.point_seconds = (busy_ns - self._seen[1]) / 1e9 / points
+        self._seen = (swept, busy_ns)
+
+    def target(self) -> int:
+        """Points one worker sweeps in about `target_seconds`."""
+        if self.point_seconds is None:
+            return self.initial
+        return max(1, int(self.target_seconds / self.point_seconds))
+
+    def size(self, remaining: int) -> int:
+        """Points in the next job when `remaining` points are left."""
+        return max(1, min(self.target(), remaining // (2 * self.workers)))
+
+
 class QueueHandler:
-    """Split a flat grid range into worker jobs."""
+    """Split a flat grid range into worker jobs.
+
+    `completed` lists ranges a resumed run already finished; jobs are built
+    for the whole grid as usual and then cut around them.
+    """
 
     def __init__(
         self,
@@ -26,11 +250,15 @@ def __init__(
         work_size: int,
         config: PyAugmeconConfig,
         grid_sizes_inner: tuple[int, ...] | None = None,
+        completed: Sequence[range] = (),
     ):
         self.work = work
         self.work_size = int(work_size)
         self.config = config
         self.grid_sizes_inner = grid_sizes_inner
+        self.completed = sorted(
+            (int(r.start), int(r.stop)) for r in completed if len(r)
+        )
 
         self.worker_count = 0
 
@@ -38,6 +266,18 @@ def __init__(
         self.job_q_by_worker: list[Queue] | None = None
         self.result_q: Queue | None = None
         self.error_q: Queue | None = None
+        self.point_rings: list[PointRing] | None = None
+        self.steal_board: StealBoard | None = None
+        # Adaptive `dynamic` runs: jobs are cut by `feed` as workers report.
+        self.chunk_planner: ChunkPlanner | None = None
+        self._cursor = int(work.start) if isinstance(work, range) else 0
+        self._chunk_unit = 1
+        self._dispensed = 0
+        # `probe_stride` runs: the coarse rows queued first, and the rest of
+        # the grid, held back until workers have swept `probe_points`.
+        self.probe_rows: list[range] = []
+        self.probe_points = 0
+        self._held: list[range] | None = None
 
     @staticmethod
     def _partition_counts(total: int, buckets: int) -> list[int]:
@@ -61,12 +301,14 @@ def _outer_alignment(self) -> tuple[int, int] | None:
         return outer_size, self.work_size // outer_size
 
     def _dynamic_chunk_size(self) -> int:
-        """Pick a small job size for dynamic scheduling.
-
-        Aim for ~8 jobs per worker so fast workers can pick up additional
-        chunks. On large grids (>=128 points per worker), floor the chunk at
-        8 to keep per-read queue overhead from dominating the solve time.
-        Cap at 8192 as a safety net for pathological grid sizes.
+        """Pick a small job size for dynamic scheduling split up front.
+
+        Used without `chunk_target_seconds`, for single-worker runs, and to
+        cap the first adaptive jobs. Aim for ~8 jobs per worker so fast
+        workers can pick up additional chunks. On large grids (>=128 points
+        per worker), floor the chunk at 8 to keep per-read queue overhead
+        from dominating the solve time. Cap at 8192 as a safety net for
+        pathological grid sizes.
         """
         if self.work_size <= self.worker_count:
             return 1
@@ -182,35 +424,196 @@ def _build_fixed_ranges(self) -> list[range | None]:
             cursor += count
         return ranges
 
-    def split_work(self, ctx) -> None:
-        """Create shared queues and enqueue work for the selected distribution."""
+    def _probe_rows(self) -> list[range]:
+        """Inner rows whose outer levels are all multiples of `probe_stride`.
+
+        Each row is one full sweep of the innermost objective, so early exit
+        finds the row's infeasibility frontier exactly, and the outer-skip
+        table carries it to every harder combination of outer levels.
+        """
+        inner, *outer = self.grid_sizes_inner  # ty: ignore[not-iterable]
+        stride = self.config.probe_stride
+        levels = np.meshgrid(
+            *(np.arange(0, size, stride) for size in outer), indexing="ij"
+        )
+        rows = np.ravel_multi_index(
+            tuple(axis.ravel() for axis in levels), outer, order="F"
+        )
+        return [range(row * inner, (row + 1) * inner) for row in np.sort(rows).tolist()]
+
+    def _without_completed(self, ranges: list[range]) -> list[range]:
+        """Cut the `completed` ranges out of `ranges`, keeping their order."""
+        return self._without(ranges, self.completed)
+
+    @staticmethod
+    def _without(ranges: list[range], holes: Sequence[tuple[int, int]]) -> list[range]:
+        """Cut sorted, disjoint `(start, stop)` holes out of `ranges`."""
+        if not holes:
+            return ranges
+        remaining: list[range] = []
+        for r in ranges:
+            start = int(r.start)
+            for done_start, done_stop in holes:
+                if done_stop <= start:
+                    continue
+                if done_start >= r.stop:
+                    break
+                if done_start > start:
+                    remaining.append(range(start, done_start))
+                start = max(start, done_stop)
+            if start < r.stop:
+                remaining.append(range(start, int(r.stop)))
+        return remaining
+
+    def split_work(self, ctx, pool: WorkerPool | None = None) -> None:
+        """Create shared queues and enqueue work for the selected distribution.
+
+        With a `pool`, reuse its long-lived queues (its workers were spawned
+        with them) and size the run by the pool instead of `config.workers`.
+        """
         if self.work_size <= 0:
             raise ValueError("No work to split. Check objective count and exact grid.")
 
-        self.worker_count = min(self.config.workers, self.work_size)
-        self.result_q = ctx.Queue()
-        self.error_q = ctx.Queue()
+        workers = self.config.workers if pool is None else pool.workers
+        self.worker_count = min(workers, self.work_size)
+        self.result_q = ctx.Queue() if pool is None else pool.result_q
+        self.error_q = ctx.Queue() if pool is None else pool.error_q
 
         if self.config.work_distribution == "fixed":
-            self.job_q_by_worker = [ctx.Queue() for _ in range(self.worker_count)]
+            self.job_q_by_worker = (
+                [ctx.Queue() for _ in range(self.worker_count)]
+                if pool is None
+                else pool.job_q_by_worker[: self.worker_count]
+            )
             for worker_q, r in zip(
                 self.job_q_by_worker, self._build_fixed_ranges(), strict=False
             ):
-                if r is not None:
-                    worker_q.put(r)
+                for piece in self._without_completed([] if r is None else [r]):
+                    worker_q.put(piece)
                 worker_q.put(None)
             return
 
+        if (
+            self.config.work_distribution == "dynamic"
+            and self.config.chunk_target_seconds is not None
+            and self.worker_count > 1
+        ):
+            self.shared_job_q = ctx.Queue() if pool is None else pool.shared_job_q
+            self._start_adaptive()
+            return
+
         if self.config.work_distribution == "outer_grid":
             ranges = self._build_outer_grid_ranges()
+            if self.config.work_stealing and self.worker_count > 1:
+                self.steal_board = (
+                    StealBoard(ctx, self.worker_count)
+                    if pool is None
+                    else pool.steal_board
+                )
         else:
             ranges = self._build_dynamic_ranges()
+        ranges = self._without_completed(ranges)
 
-        self.shared_job_q = ctx.Queue()
+        self.shared_job_q = ctx.Queue() if pool is None else pool.shared_job_q
+        if (
+            self.config.work_distribution == "outer_grid"
+            and self.config.probe_stride is not None
+            and self.worker_count > 1
+            and len(self.grid_sizes_inner) > 1  # ty: ignore[invalid-argument-type]
+        ):
+            self.probe_rows = self._without_completed(self._probe_rows())
+        if self.probe_rows:
+            # `feed` queues the rest once the probe rows are swept, so their
+            # infeasibility frontiers are in the skip table by then.
+            self.probe_points = sum(len(r) for r in self.probe_rows)
+            self._held = self._without(
+                ranges, [(int(r.start), int(r.stop)) for r in self.probe_rows]
+            )
+            ranges = self.probe_rows
         for r in ranges:
             self.shared_job_q.put(r)
+        if self._held is None:
+            for _ in range(self.worker_count):
+                self.shared_job_q.put(None)
+
+    @property
+    def probing(self) -> bool:
+        """True while the grid is held back behind the probe rows."""
+        return self._held is not None
+
+    def _start_adaptive(self) -> None:
+        """Set up `feed` and queue the first, `_INITIAL_CHUNK`-sized jobs.
+
+        Jobs keep whole outer-objective levels when `_build_dynamic_ranges`
+        would, i.e. with >=4 outer levels per worker.
+        """
+        if not isinstance(self.work, range) or self.work.step != 1:
+            raise ValueError(
+                "`chunk_target_seconds` expects one continuous range of work; "
+                "set it to None to split other work up front."
+            )
+        alignment = self._outer_alignment()
+        if alignment is not None and alignment[0] >= self.worker_count * 4:
+            self._chunk_unit = alignment[1]
+        self.chunk_planner = ChunkPlanner(
+            self.config.chunk_target_seconds,  # ty: ignore[invalid-argument-type]
+            self.worker_count,
+            initial=min(self._dynamic_chunk_size(), _INITIAL_CHUNK),
+        )
+        self.feed(0, 0)
+
+    def feed(self, swept: int, busy_ns: int) -> None:
+        """Queue jobs that wait on worker progress; no-op for other runs.
+
+        `swept` and `busy_ns` are the points workers finished this run and
+        the time they spent on them. A probing run queues the held-back grid
+        once `swept` covers the probe rows. Adaptive `dynamic` jobs are cut
+        until about `_JOBS_AHEAD` jobs per worker are queued or running.
+        Once the grid is handed out, the end markers follow.
+        """
+        if self._held is not None:
+            if swept >= self.probe_points and self.shared_job_q is not None:
+                for r in self._held:
+                    self.shared_job_q.put(r)
+                for _ in range(self.worker_count):
+                    self.shared_job_q.put(None)
+                self._held = None
+            return
+        planner = self.chunk_planner
+        if planner is None or self.shared_job_q is None:
+            return
+        planner.observe(swept, busy_ns)
+        stop = int(self.work.stop)
+        unit = self._chunk_unit
+        # Shrinking jobs near the end does not shrink the lookahead, so the
+        # last small jobs are queued together.
+        ahead = _JOBS_AHEAD * self.worker_count * max(unit, planner.target())
+        while self._cursor < stop:
+            if self._dispensed - swept >= ahead:
+                return
+            chunk = max(unit, round(planner.size(stop - self._cursor) / unit) * unit)
+            job = range(self._cursor, min(self._cursor + chunk, stop))
+            for piece in self._without_completed([job]):
+                self.shared_job_q.put(piece)
+                self._dispensed += len(piece)
+            self._cursor = int(job.stop)
         for _ in range(self.worker_count):
             self.shared_job_q.put(None)
+        self.chunk_planner = None
+
+    def open_point_rings(self, ctx: Any, n_obj: int) -> None:
+        """Give each worker a shared `PointRing` for variable-free results.
+
+        Call after `split_work`. Workers with a ring ship objective points
+        through it instead of pickling `Solution` lists onto `result_q`.
+        """
+        self.point_rings = [
+            PointRing(ctx, self.config.result_buffer_size, n_obj)
+            for _ in range(self.worker_count)
+        ]
+
+    def point_ring_for_worker(self, worker_id: int) -> PointRing | None:
+        return None if self.point_rings is None else self.point_rings[worker_id]
 
     def job_q_for_worker(self, worker_id: int) -> Queue:
         if self.shared_job_q is not None:
@@ -238,8 +641,19 @@ def _drain_queue(q: Queue | None) -> list:
                 return items
 
     def get_result(self) -> list[WorkerChunk]:
-        """Drain all currently available results from the shared result queue."""
-        return self._drain_queue(self.result_q)
+        """Drain all currently available results.
+
+        With point rings open nothing is sent on `result_q`, so read the
+        rings directly and skip the queue's first-read wait.
+        """
+        if self.point_rings is None:
+            return self._drain_queue(self.result_q)
+        chunks: list[WorkerChunk] = []
+        for ring in self.point_rings:
+            points = ring.read()
+            if len(points):
+                chunks.append(points)
+        return chunks
 
     def get_error(self) -> list[WorkerError]:
         """Drain all currently available worker error payloads."""
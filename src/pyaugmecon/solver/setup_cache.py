@@ -0,0 +1,116 @@
+"""On-disk cache of payoff tables and safe nadirs, keyed by model structure."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pyomo.environ as pyo
+from pyomo.core.base import Constraint, Objective, Var
+from pyomo.core.expr import expression_to_string
+
+from pyaugmecon.config import PyAugmeconConfig
+
+SETUP_CACHE_FOLDER = "setup_cache"
+
+
+def _bound(value: object) -> float | None:
+    return None if value is None else float(pyo.value(value))
+
+
+def model_fingerprint(model: pyo.ConcreteModel, config: PyAugmeconConfig) -> str:
+    """SHA-256 over everything the payoff table and safe nadirs depend on.
+
+    Covers variables (bounds, domain, fixed values), active constraints, and
+    objective senses and expressions, plus the solver settings. Mutable
+    parameters are hashed by value (`compute_values=True`), so changing data
+    changes the key. Components are visited in name order.
+    """
+    digest = hashlib.sha256()
+
+    def feed(*parts: object) -> None:
+        digest.update(repr(parts).encode())
+        digest.update(b"\n")
+
+    feed(
+        "solver",
+        config.solver_name,
+        config.solver_io,
+        sorted(config.solver_options.items()),
+    )
+    for var in model.component_data_objects(Var, sort=True):
+        feed(
+            "var",
+            var.name,
+            str(var.domain),
+            var.lb,
+            var.ub,
+            var.fixed,
+            var.value if var.fixed else None,
+        )
+    for con in model.component_data_objects(Constraint, active=True, sort=True):
+        feed(
+            "con",
+            con.name,
+            expression_to_string(con.body, compute_values=True),
+            _bound(con.lower),
+            _bound(con.upper),
+        )
+    for obj in model.component_data_objects(Objective, sort=True):
+        feed(
+            "obj",
+            obj.name,
+            int(obj.sense),
+            expression_to_string(obj.expr, compute_values=True),
+        )
+    return digest.hexdigest()
+
+
+@dataclass(slots=True)
+class SetupEntry:
+    """Cached setup results, in the internal maximization frame."""
+
+    payoff: np.ndarray
+    obj_goal: list[int]
+    safe_nadirs: dict[int, float] | None = None
+
+
+def setup_cache_path(config: PyAugmeconConfig, fingerprint: str) -> Path:
+    return (
+        Path.cwd() / config.artifact_folder / SETUP_CACHE_FOLDER / f"{fingerprint}.json"
+    )
+
+
+def load_setup_entry(path: Path) -> SetupEntry | None:
+    """Read a cache entry; missing or unreadable files count as a miss."""
+    try:
+        data = json.loads(path.read_text())
+        safe_nadirs = data.get("safe_nadirs")
+        return SetupEntry(
+            payoff=np.array(data["payoff"], dtype=float),
+            obj_goal=[int(goal) for goal in data["obj_goal"]],
+            safe_nadirs=None
+            if safe_nadirs is None
+            else {int(idx): float(bound) for idx, bound in safe_nadirs.items()},
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def store_setup_entry(path: Path, entry: SetupEntry) -> None:
+    """Write `entry` atomically so concurrent runs never read a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "payoff": entry.payoff.tolist(),
+        "obj_goal": entry.obj_goal,
+        "safe_nadirs": None
+        if entry.safe_nadirs is None
+        else {str(idx): bound for idx, bound in entry.safe_nadirs.items()},
+    }
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data))
+    tmp.replace(path)
@@ -2,8 +2,10 @@
 
 import ctypes
 import threading
+import time
 import traceback
 from dataclasses import dataclass
+from math import prod
 from multiprocessing import Queue
 from multiprocessing.shared_memory import SharedMemory
 from multiprocessing.synchronize import Event as MpEvent
@@ -17,15 +19,25 @@
 from pyomo.environ import value as pyo_value
 
 from pyaugmecon.config import PyAugmeconConfig
-from pyaugmecon.helper import Counter
+from pyaugmecon.helper import Counter, FirstMark
 from pyaugmecon.logs import configure_loguru
-from pyaugmecon.results import Solution, WorkerChunk
+from pyaugmecon.results import (
+    ColumnarChunk,
+    Point,
+    Solution,
+    WorkerChunk,
+    round_points,
+)
 from pyaugmecon.solver.adapter import (
+    HIGHS_NATIVE_ENGINE,
     SolveOutcome,
     release_solver,
     select_solver,
     solve_once,
 )
+from pyaugmecon.solver.checkpoint import CompletedRange
+from pyaugmecon.solver.highs_native import HighsNativeSweep
+from pyaugmecon.solver.queue import PointRing, StealBoard, Wakeup
 
 # `solver_worker_main` accepts either `multiprocessing.Event` (real workers)
 # or `threading.Event` (workers=1 in-process fast path); both expose the same
@@ -36,9 +48,27 @@
     from pyaugmecon.solver.model import Model
 
 # `multiprocessing.get_context('spawn').Array('I', n, lock=False)` returns a
-# dynamically-named subclass of `ctypes.Array[c_uint]`. Alias for cross-process
-# buffer typing.
-type SharedUIntArray = "ctypes.Array[ctypes.c_uint]"
+# dynamically-named subclass of `ctypes.Array[c_uint]` (`c_ubyte`, `c_ushort`
+# or `c_ulonglong` for the other typecodes in `_UINT_TYPECODES`). Alias for
+# cross-process buffer typing.
+type SharedUIntArray = "ctypes.Array[Any]"
+
+# Unsigned typecodes, narrowest first; `multiprocessing`, ctypes and numpy
+# read them the same way.
+_UINT_TYPECODES = ("B", "H", "I", "Q")
+
+# Skipped inner-index runs kept per outer cell of the flag table. A run is
+# packed into one word so that a single aligned store publishes both ends.
+FLAG_SLOTS = 8
+
+
+def skip_typecode(largest: int, values_per_cell: int = 1) -> str:
+    """Narrowest unsigned typecode packing `values_per_cell` values up to `largest`."""
+    for typecode in _UINT_TYPECODES:
+        if largest >> (np.dtype(typecode).itemsize * 8 // values_per_cell) == 0:
+            return typecode
+    raise ValueError(f"Skip-table values up to {largest} do not fit in 64 bits.")
+
 
 # Mirror of the same constant in `model.py`. Kept local so the worker hot loop
 # avoids a cross-module attribute lookup per grid point.
@@ -99,15 +129,99 @@ class SkipBuffers:
     outer_skip_shape: tuple[int, ...] | None
 
 
+class FlagTable:
+    """AUGMECON-R flags kept per outer cell instead of per grid point.
+
+    Row `c` of `cells` belongs to the outer cell of flat grid ids
+    `c * inner_size` up to the next row. Column 0 counts the trailing inner
+    indices known to be infeasible (early exit). The other `FLAG_SLOTS` columns
+    each hold one run `[start, stop)` of inner indices that bypass proved
+    redundant, packed as `start | stop << shift` (0: empty slot). Every write
+    records a monotone fact, so a write lost to a race only costs a re-solve.
+    """
+
+    __slots__ = ("_grid", "_mask", "_shift", "cells", "inner_size")
+
+    def __init__(self, table: np.ndarray, grid_sizes: tuple[int, ...]) -> None:
+        self.inner_size = grid_sizes[0]
+        self.cells = table.reshape(-1, FLAG_SLOTS + 1)
+        self._grid = table.reshape((FLAG_SLOTS + 1, *grid_sizes[1:]), order="F")
+        self._shift = table.dtype.itemsize * 4
+        self._mask = (1 << self._shift) - 1
+
+    @staticmethod
+    def size(grid_sizes: tuple[int, ...]) -> int:
+        """Cells of the flat table for a grid of `grid_sizes`."""
+        return (FLAG_SLOTS + 1) * prod(grid_sizes[1:])
+
+    @staticmethod
+    def typecode(grid_sizes: tuple[int, ...]) -> str:
+        """Cell typecode: each half of a cell holds an inner index or count."""
+        return skip_typecode(max(grid_sizes[:1], default=0), values_per_cell=2)
+
+    def skip(self, cell: int, inner_index: int) -> int:
+        """Grid points that can be skipped from `inner_index` in `cell`."""
+        blocked, *runs = self.cells[cell].tolist()
+        remaining = self.inner_size - inner_index
+        if remaining <= blocked:
+            return remaining
+        jump = 0
+        shift = self._shift
+        for word in runs:
+            if word and word & self._mask <= inner_index:
+                jump = max(jump, (word >> shift) - inner_index)
+        return jump
+
+    def block(self, outer_point: tuple[int, ...], inner_index: int) -> None:
+        """Mark `inner_index` onward infeasible here and at harder outer levels."""
+        target = self._grid[(slice(1), *(slice(start, None) for start in outer_point))]
+        np.maximum(target, self.inner_size - inner_index, out=target)
+
+    def cover(self, start: int, stop: int, outer_box: tuple[slice, ...]) -> None:
+        """Record inner indices `[start, stop)` as redundant in `outer_box`.
+
+        The box's first cell is the solved point's own: nothing revisits that
+        point in this run, and a resumed run must re-solve it if its result
+        was lost before the checkpoint, so it is left as it was.
+        """
+        words = self._grid[(slice(1, None), *outer_box)]
+        shift = self._shift
+        starts = words & self._mask
+        stops = words >> shift
+        used = words != 0
+        touching = used & (starts <= stop) & (stops >= start)
+        # A run that touches the new one is widened to their union; otherwise
+        # the new run takes a free slot, or replaces the shortest run.
+        merge = touching.any(axis=0)
+        free = ~used
+        slot = np.where(
+            merge,
+            touching.argmax(axis=0),
+            np.where(
+                free.any(axis=0),
+                free.argmax(axis=0),
+                (stops - starts).argmin(axis=0),
+            ),
+        )
+        old = np.take_along_axis(words, slot[None], axis=0)[0]
+        new_start = np.where(merge, np.minimum(old & self._mask, start), start)
+        new_stop = np.where(merge, np.maximum(old >> shift, stop), stop)
+        new = new_start | (new_stop << shift)
+        write = new != old
+        write.flat[0] = False
+        cells = np.nonzero(write)
+        words[(slot[cells], *cells)] = new[cells]
+
+
 @dataclass(frozen=True, slots=True)
 class SkipContext:
     """Resolved per-worker views over the AUGMECON-R skip tables.
 
-    Both views are always `np.ndarray`; disabled features use a 0-d sentinel
-    so the per-iteration enabled-check stays a single bool.
+    Both are always set; disabled features use a one-cell or 0-d sentinel so
+    the per-iteration enabled-check stays a single bool.
     """
 
-    flag_view: np.ndarray
+    flags: FlagTable
     outer_skip_view: np.ndarray
     uses_outer_skip: bool
 
@@ -115,18 +229,19 @@ class SkipContext:
     def from_buffers(
         cls, config: PyAugmeconConfig, buffers: SkipBuffers
     ) -> SkipContext:
-        # Flag view: shared ctypes buffer, private numpy array, or 0-d sentinel.
-        # Concurrent monotone (max) writes on the shared buffer are safe under
+        # Flags: shared ctypes buffer, private numpy array, or one-cell
+        # sentinel. Concurrent writes on the shared buffer are safe under
         # AUGMECON-R: flags are advisory, so a missed write only causes a
         # re-solve, never a wrong answer.
+        flag_shape = buffers.flag_shape
         if buffers.flag_buffer is not None:
-            flag_view = np.ctypeslib.as_array(buffers.flag_buffer).reshape(
-                buffers.flag_shape, order="F"
-            )
-        elif config.flag and not buffers.flag_is_shared:
-            flag_view = np.zeros(buffers.flag_shape, dtype=np.uint32, order="F")
+            flag_table = np.ctypeslib.as_array(buffers.flag_buffer)
         else:
-            flag_view = np.zeros((), dtype=np.uint32)
+            if not config.flag or buffers.flag_is_shared:
+                flag_shape = flag_shape[:1]
+            flag_table = np.zeros(
+                FlagTable.size(flag_shape), dtype=FlagTable.typecode(flag_shape)
+            )
 
         # Outer-skip view: shared ctypes buffer or 0-d sentinel.
         if buffers.outer_skip_buffer is not None and buffers.outer_skip_shape:
@@ -139,32 +254,36 @@ def from_buffers(
             uses_outer_skip = False
 
         return cls(
-            flag_view=flag_view,
+            flags=FlagTable(flag_table, flag_shape),
             outer_skip_view=outer_skip_view,
             uses_outer_skip=uses_outer_skip,
         )
 
 
-def _load_worker_model(spec: WorkerSpec) -> pyo.ConcreteModel:
-    """Load the pickled Pyomo model out of the shared-memory blob.
+def load_model_blob(shm_name: str, blob_size: int) -> pyo.ConcreteModel:
+    """Load a pickled Pyomo model out of a shared-memory blob.
 
     Slicing the buffer view directly avoids one full memcpy per worker that
     `bytes(view)` would incur for large user models.
     """
-    model_shm = SharedMemory(name=spec.model_shm_name)
+    model_shm = SharedMemory(name=shm_name)
     try:
         shm_view = model_shm.buf
         assert shm_view is not None
-        return cloudpickle.loads(shm_view[: spec.model_shm_size])
+        return cloudpickle.loads(shm_view[:blob_size])
     finally:
         model_shm.close()
 
 
+def _load_worker_model(spec: WorkerSpec) -> pyo.ConcreteModel:
+    return load_model_blob(spec.model_shm_name, spec.model_shm_size)
+
+
 def _decode_point(linear_idx: int, grid_sizes: tuple[int, ...]) -> tuple[int, ...]:
     """Decode a flat job id into per-dimension coordinates.
 
-    Dimension 0 is the innermost loop. The per-grid-point cost is dwarfed by
-    the solve itself.
+    Dimension 0 is the innermost loop. Only used to seed `_VisitPlan`; the hot
+    loop reads coordinates from the plan instead.
     """
     coords = [0] * len(grid_sizes)
     remainder = linear_idx
@@ -173,6 +292,194 @@ def _decode_point(linear_idx: int, grid_sizes: tuple[int, ...]) -> tuple[int, ..
     return tuple(coords)
 
 
+# Largest job (in grid points) whose coordinates are decoded up front. One
+# plan entry is a tuple plus a list slot, roughly 100 bytes for a few
+# dimensions, so a full plan stays around 200 KB even when skips leave most
+# of it unread. Larger jobs use the odometer path instead.
+_VISIT_PLAN_MAX_POINTS = 1 << 11
+
+
+class _VisitPlan:
+    """Per-job lookup from flat grid ids to coordinates.
+
+    Small jobs decode every point in one `np.unravel_index` call (Fortran
+    order, so dimension 0 changes fastest like `_decode_point`). Jobs larger
+    than `_VISIT_PLAN_MAX_POINTS` keep an odometer instead: the worker only
+    moves forward, and most jumps stay inside one inner row, so advancing
+    usually touches coordinate 0 and carries into outer dimensions only at
+    row boundaries.
+    """
+
+    __slots__ = ("_coords", "_grid_sizes", "_linear_idx", "_points", "_start")
+
+    def __init__(self, work: range, grid_sizes: tuple[int, ...]) -> None:
+        self._start = int(work.start)
+        self._grid_sizes = grid_sizes
+        self._points: list[tuple[int, ...]] | None = None
+        self._coords: list[int] = []
+        self._linear_idx = self._start
+
+        if len(work) <= _VISIT_PLAN_MAX_POINTS:
+            axes = np.unravel_index(
+                np.arange(work.start, work.stop, dtype=np.intp), grid_sizes, order="F"
+            )
+            self._points = list(zip(*(axis.tolist() for axis in axes), strict=True))
+        else:
+            self._coords = list(_decode_point(self._start, grid_sizes))
+
+    def point(self, linear_idx: int) -> tuple[int, ...]:
+        """Coordinates of `linear_idx`; ids must be requested in ascending order."""
+        if self._points is not None:
+            return self._points[linear_idx - self._start]
+
+        coords = self._coords
+        sizes = self._grid_sizes
+        carry, coords[0] = divmod(coords[0] + linear_idx - self._linear_idx, sizes[0])
+        d = 1
+        while carry and d < len(sizes):
+            carry, coords[d] = divmod(coords[d] + carry, sizes[d])
+            d += 1
+        self._linear_idx = linear_idx
+        return tuple(coords)
+
+
+class _LocalArchive:
+    """Running non-dominated set of one worker's rounded objective points.
+
+    Keys are rounded with `round_points`, exactly like the parent does, and
+    dominance is weak (>= in every objective) like `undominated_mask`, so a
+    point rejected here can never survive the parent's filter. Used to skip
+    decision-variable capture for points the parent would throw away.
+    """
+
+    __slots__ = ("_keys", "_points")
+
+    def __init__(self, n_obj: int) -> None:
+        self._keys: list[Point] = []
+        self._points = np.empty((0, n_obj))
+
+    def offer(self, key: Point) -> tuple[bool, list[Point]]:
+        """Insert `key` unless a kept point covers it.
+
+        Returns `(entered, evicted)`: whether `key` is new and non-dominated,
+        and the kept keys it dominates (now dropped from the archive).
+        """
+        point = np.asarray(key, dtype=float)
+        if np.any(np.all(self._points >= point, axis=1)):
+            return False, []
+        evicted_mask = np.all(point >= self._points, axis=1)
+        evicted = [k for k, gone in zip(self._keys, evicted_mask, strict=True) if gone]
+        if evicted:
+            keep = ~evicted_mask
+            self._keys = [k for k, kept in zip(self._keys, keep, strict=True) if kept]
+            self._points = self._points[keep]
+        self._keys.append(key)
+        self._points = np.vstack((self._points, point))
+        return True, evicted
+
+
+class _SolutionCache:
+    """Ring buffer of a worker's recent optimal solves for incumbent reuse.
+
+    The augmented objective only differs between grid points by a constant
+    (the slacks are `f_i - eps_i`), so a solution that was optimal at `eps_c`
+    stays optimal at any `eps >= eps_c` where it is still feasible, i.e.
+    where its constrained objectives still reach `eps`. Such grid points are
+    answered from the cache without calling the solver.
+    """
+
+    __slots__ = ("_constrained", "_eps", "_objectives", "_payloads", "_size", "_slot")
+
+    def __init__(self, capacity: int, dim_count: int, n_obj: int) -> None:
+        self._eps = np.empty((capacity, dim_count))
+        self._constrained = np.empty((capacity, dim_count))
+        self._objectives = np.empty((capacity, n_obj))
+        self._payloads: list[Any] = [None] * capacity
+        self._size = 0
+        self._slot = 0
+
+    def lookup(self, eps: np.ndarray) -> int | None:
+        """Slot of a cached solution that is optimal at `eps`, if any."""
+        size = self._size
+        reusable = np.all(self._eps[:size] <= eps, axis=1) & np.all(
+            self._constrained[:size] >= eps, axis=1
+        )
+        slot = int(np.argmax(reusable)) if size else 0
+        return slot if size and reusable[slot] else None
+
+    def entry(self, slot: int) -> tuple[list[float], Any]:
+        """`(objective values, variable payload)` stored in `slot`."""
+        return self._objectives[slot].tolist(), self._payloads[slot]
+
+    def store(
+        self,
+        eps: np.ndarray,
+        constrained: list[float],
+        objective_values: list[float],
+        payload: Any,
+    ) -> None:
+        """Remember one optimal solve, replacing the oldest entry when full."""
+        slot = self._slot
+        self._eps[slot] = eps
+        self._constrained[slot] = constrained
+        self._objectives[slot] = objective_values
+        self._payloads[slot] = payload
+        self._slot = (slot + 1) % len(self._payloads)
+        self._size = min(self._size + 1, len(self._payloads))
+
+
+def _job_chunks(
+    results: list[Solution],
+    rows: np.ndarray,
+    row_of: list[int],
+    columnar: bool,
+) -> list[WorkerChunk]:
+    """Package one job's solutions for the result queue.
+
+    Columnar jobs send captured solutions with their rows first and the
+    uncaptured rest as a plain list after; the parent keeps the first copy
+    of a duplicate point, so captured copies must arrive first.
+    """
+    if not columnar:
+        return [results]
+    captured = [idx for idx, row in enumerate(row_of) if row >= 0]
+    chunks: list[WorkerChunk] = []
+    if captured:
+        chunks.append(
+            ColumnarChunk(
+                [results[idx] for idx in captured],
+                rows[[row_of[idx] for idx in captured]],
+            )
+        )
+    if len(captured) < len(results):
+        chunks.append(
+            [sol for sol, row in zip(results, row_of, strict=True) if row < 0]
+        )
+    return chunks
+
+
+# Solvers a pool worker keeps across runs, keyed by `_solver_cache_key`.
+type SolverCache = dict[tuple[str, str | None, str], tuple[Any, str]]
+
+
+def _solver_cache_key(config: PyAugmeconConfig) -> tuple[str, str | None, str]:
+    options = repr(sorted(config.solver_options.items()))
+    return config.solver_name, config.solver_io, options
+
+
+def select_cached_solver(
+    config: PyAugmeconConfig, cache: SolverCache | None
+) -> tuple[Any, str]:
+    """`(solver, resolved backend)`, reusing a warm solver from `cache`."""
+    key = _solver_cache_key(config)
+    if cache is not None and key in cache:
+        return cache[key]
+    solver, selection = select_solver(config)
+    if cache is not None:
+        cache[key] = (solver, selection.resolved_backend)
+    return solver, selection.resolved_backend
+
+
 def solver_worker_main(
     worker_id: int,
     config: PyAugmeconConfig,
@@ -186,24 +493,43 @@ def solver_worker_main(
     solved_counter: Counter,
     infeasible_counter: Counter,
     skip_buffers: SkipBuffers,
+    cache_hit_counter: Counter,
+    cache_miss_counter: Counter,
+    point_ring: PointRing | None,
+    first_solve: FirstMark,
     *,
     live_model: pyo.ConcreteModel | None = None,
+    solver_cache: SolverCache | None = None,
+    steal_board: StealBoard | None = None,
+    busy_counter: Counter | None = None,
+    wakeup: Wakeup | None = None,
 ) -> None:
     """Worker loop: read grid ranges, solve useful points, skip known dead space.
 
     `live_model`: when set, skip the SharedMemory unpickle and use the model
     directly. Used by the in-process workers=1 fast path.
+    `solver_cache`: when set, reuse (and keep) the solver selected by an
+    earlier run with the same solver settings. Used by `WorkerPool` workers.
+    `steal_board`: when set, publish progress through it and, once the job
+    queue is empty, split other workers' ranges instead of exiting.
+    `busy_counter`: when set, add the nanoseconds spent sweeping each job,
+    which the parent uses to size dynamic jobs.
+    `wakeup`: when set, signalled after each job (results, counters) and
+    after an error, so the parent's wait returns for them.
     """
     if config.process_logging:
         configure_loguru(logfile, config.log_to_console)
 
     backend = "unresolved"
     solver: Any | None = None
+    native: HighsNativeSweep | None = None
 
     try:
         model = live_model if live_model is not None else _load_worker_model(spec)
-        solver, selection = select_solver(config)
-        backend = selection.resolved_backend
+        if config.solver_name == HIGHS_NATIVE_ENGINE:
+            backend = HIGHS_NATIVE_ENGINE
+        else:
+            solver, backend = select_cached_solver(config, solver_cache)
 
         skip = SkipContext.from_buffers(config, skip_buffers)
 
@@ -227,6 +553,13 @@ def solver_worker_main(
             obj_list[obj_idx + 1].deactivate()  # ty: ignore[not-subscriptable]
         obj_list[1].activate()  # ty: ignore[not-subscriptable]
 
+        # The native engine snapshots the augmented model with the primary
+        # objective active; from here on only its epsilon row bounds change.
+        if backend == HIGHS_NATIVE_ENGINE:
+            native = HighsNativeSweep(
+                model, spec.constrained_order_inner, config.solver_options
+            )
+
         component_indices = tuple(
             obj_idx + 1 for obj_idx in spec.constrained_order_inner
         )
@@ -236,10 +569,12 @@ def solver_worker_main(
         grid_sizes = spec.grid_sizes_inner
         epsilon_levels = spec.epsilon_levels_inner
         level_steps = spec.level_steps_inner
-        last_index = tuple(size - 1 for size in grid_sizes)
         inner_dim_size = grid_sizes[0]
-        last_inner = last_index[0]
+        last_inner = inner_dim_size - 1
         dim_count = len(grid_sizes)
+        # Outer slices of the skip tables run to the end of each dimension
+        # (infeasibility) or to a slack-bounded stop clipped to it (bypass).
+        outer_sizes = grid_sizes[1:]
         penalty_coeffs = tuple(
             (10 ** (-dim)) / spec.obj_range_by_obj[objective_idx]
             for dim, objective_idx in enumerate(spec.constrained_order_inner)
@@ -249,32 +584,88 @@ def solver_worker_main(
         bypass_enabled = config.bypass
         early_exit_enabled = config.early_exit
         store_vars = config.store_decision_variables
+        # Columnar capture reads values in a fixed order into one float64 row
+        # per solution instead of building nested dicts.
+        columnar_vars: tuple[Any, ...] = (
+            tuple(v for var in model_vars for v in var.values())
+            if store_vars and config.variable_storage == "columnar"
+            else ()
+        )
+        column_count = len(columnar_vars)
+        archive = (
+            _LocalArchive(n_obj)
+            if store_vars and config.variable_capture == "nondominated"
+            else None
+        )
+        round_decimals = config.round_decimals
+        cache = (
+            _SolutionCache(config.solution_cache_size, dim_count, n_obj)
+            if config.solution_cache_size
+            else None
+        )
+        constrained_order = spec.constrained_order_inner
         warmstart = config.solve_warmstart
         penalty_weight = config.penalty_weight
         objective_tol = config.objective_tolerance
 
-        flag_view = skip.flag_view
+        flags = skip.flags
         outer_skip_view = skip.outer_skip_view
         uses_outer_skip = skip.uses_outer_skip
         outer_skip_shape = outer_skip_view.shape
+        mark_first_solve = True
+        report_ranges = config.checkpoint_interval is not None
+        queue_open = True
 
         while not stop_event.is_set():
-            work = job_queue.get()
+            work = job_queue.get() if queue_open else None
             if work is None:
-                break
+                # Each worker reads exactly one end marker; after it, only
+                # ranges split off other workers are left.
+                queue_open = False
+                if steal_board is None:
+                    break
+                work = steal_board.steal(worker_id, inner_dim_size)
+                if work is None:
+                    break
+            elif steal_board is not None:
+                steal_board.claim(worker_id, work)
 
             visited = 0
             solved = 0
             infeasible = 0
-            results: WorkerChunk = []
+            cache_hits = 0
+            results: list[Solution] = []
+            rows = np.empty((0, column_count))
+            # `row_of[i]` is the `rows` slot holding `results[i]`'s variables
+            # (-1: none). Slots of evicted solutions are reused.
+            row_of: list[int] = []
+            free_rows: list[int] = []
+            used_rows = 0
+            captured_in_job: dict[Point, int] = {}
+            job_started = time.perf_counter_ns()
             current_idx = int(work.start)
             linear_stop = int(work.stop)
+            plan = _VisitPlan(work, grid_sizes)
+            # Every jump below ends at or before the end of the current inner
+            # row, so the worker lands on each row boundary it passes.
+            next_sync = (
+                linear_stop
+                if steal_board is None
+                else (current_idx // inner_dim_size + 1) * inner_dim_size
+            )
 
             while current_idx < linear_stop:
                 if stop_event.is_set():
                     break
 
-                point = _decode_point(current_idx, grid_sizes)
+                if current_idx >= next_sync:
+                    # Another worker may have taken the rows after this one.
+                    linear_stop = steal_board.sync(worker_id, current_idx)  # ty: ignore[possibly-missing-attribute]
+                    if current_idx >= linear_stop:
+                        break
+                    next_sync = current_idx + inner_dim_size
+
+                point = plan.point(current_idx)
                 inner_index = point[0]
                 outer_point = point[1:]
                 visited += 1
@@ -290,23 +681,48 @@ def solver_worker_main(
                         current_idx += jump
                         continue
 
-                # Cell flags store how many inner points can be skipped here.
+                # Flags hold the inner runs known to be skippable in this row.
                 if flag_enabled:
-                    skip_count = int(flag_view[point])
-                    if skip_count:
-                        jump = min(skip_count, last_inner - inner_index + 1)
+                    jump = flags.skip(current_idx // inner_dim_size, inner_index)
+                    if jump:
                         visited += jump - 1
                         current_idx += jump
                         continue
 
-                for dim in range(dim_count):
-                    eps_data[dim].value = epsilon_levels[dim][point[dim]]
-
-                _, solve_result = solve_once(
-                    model, solver, backend, warmstart=warmstart
-                )
-                solved += 1
-                outcome = solve_result.outcome
+                eps_values = [
+                    epsilon_levels[dim][point[dim]] for dim in range(dim_count)
+                ]
+                cached_slot = None
+                if cache is not None:
+                    eps_array = np.array(eps_values)
+                    cached_slot = cache.lookup(eps_array)
+
+                if mark_first_solve and cached_slot is None:
+                    first_solve.mark()
+                    mark_first_solve = False
+
+                if cached_slot is not None:
+                    # A recent incumbent is still optimal here; rebuild the
+                    # slacks against this point's epsilon levels.
+                    cache_hits += 1
+                    objective_values, cached_payload = cache.entry(cached_slot)  # ty: ignore[possibly-missing-attribute]
+                    slack_values = [
+                        objective_values[objective_idx] - eps_values[dim]
+                        for dim, objective_idx in enumerate(constrained_order)
+                    ]
+                    outcome = SolveOutcome.OPTIMAL
+                elif native is None:
+                    for dim in range(dim_count):
+                        eps_data[dim].value = eps_values[dim]
+                    _, solve_result = solve_once(
+                        model, solver, backend, warmstart=warmstart
+                    )
+                    outcome = solve_result.outcome
+                    solved += 1
+                else:
+                    solve_result = native.solve(eps_values)
+                    outcome = solve_result.outcome
+                    solved += 1
 
                 if outcome in _INFEASIBLE_OUTCOMES:
                     infeasible += 1
@@ -315,30 +731,16 @@ def solver_worker_main(
                     if uses_outer_skip and inner_index < int(
                         outer_skip_view[outer_point]
                     ):
-                        slices = tuple(
-                            slice(outer_point[d], outer_skip_shape[d])
-                            for d in range(len(outer_skip_shape))
-                        )
-                        target = outer_skip_view[slices]
-                        np.minimum(target, np.uint32(inner_index), out=target)
+                        target = outer_skip_view[
+                            tuple(map(slice, outer_point, outer_skip_shape))
+                        ]
+                        np.minimum(target, inner_index, out=target)
 
                     if early_exit_enabled:
                         # Outer-skip already covers this case; only write cell
                         # flags when outer-skip is off.
                         if flag_enabled and not uses_outer_skip:
-                            slices_flag = (
-                                slice(inner_index, inner_index + 1),
-                                *tuple(
-                                    slice(point[d], grid_sizes[d])
-                                    for d in range(1, dim_count)
-                                ),
-                            )
-                            flag_target = flag_view[slices_flag]
-                            np.maximum(
-                                flag_target,
-                                last_inner - inner_index + 1,
-                                out=flag_target,
-                            )
+                            flags.block(outer_point, inner_index)
                         jump = last_inner - inner_index
                         visited += jump
                         current_idx += 1 + jump
@@ -355,7 +757,23 @@ def solver_worker_main(
                         f"backend={backend}."
                     )
 
-                slack_values = [float(s.value or 0.0) for s in slack_data]
+                if cached_slot is None:
+                    if native is None:
+                        slack_values = [float(s.value or 0.0) for s in slack_data]
+                        objective_values = [
+                            float(pyo_value(expr)) for expr in objective_exprs
+                        ]
+                    else:
+                        slack_values = native.slack_values()
+                        objective_values = native.objective_values()
+                    # Report plain objectives; subtract the slack penalty from
+                    # f_0 (it's only an AUGMECON tie-breaker).
+                    objective_values[0] -= penalty_weight * sum(
+                        coeff * slack
+                        for coeff, slack in zip(
+                            penalty_coeffs, slack_values, strict=False
+                        )
+                    )
 
                 bypass_jump = 0
                 if bypass_enabled:
@@ -364,33 +782,26 @@ def solver_worker_main(
                         for dim in range(dim_count)
                     ]
                     bypass_jump = min(slack_steps[0], last_inner - inner_index)
-                    if flag_enabled:
+                    if flag_enabled and any(slack_steps[1:]):
                         # Positive slack means the same solution satisfies
                         # nearby harder epsilon levels; flag those points so
                         # later iterations skip the solve.
-                        slices_flag = (
-                            slice(inner_index, inner_index + 1),
-                            *tuple(
-                                slice(
-                                    point[d],
-                                    min(last_index[d], point[d] + slack_steps[d]) + 1,
+                        flags.cover(
+                            inner_index,
+                            min(inner_index + slack_steps[0] + 1, inner_dim_size),
+                            tuple(
+                                slice(start, min(stop, start + steps + 1))
+                                for start, stop, steps in zip(
+                                    outer_point,
+                                    outer_sizes,
+                                    slack_steps[1:],
+                                    strict=True,
                                 )
-                                for d in range(1, dim_count)
                             ),
                         )
-                        flag_target = flag_view[slices_flag]
-                        np.maximum(flag_target, slack_steps[0] + 1, out=flag_target)
-
-                # Report plain objectives; subtract the slack penalty from
-                # f_0 (it's only an AUGMECON tie-breaker).
-                penalty = sum(
-                    coeff * slack
-                    for coeff, slack in zip(penalty_coeffs, slack_values, strict=False)
-                )
-                objective_values: list[float] = [
-                    float(pyo_value(expr)) for expr in objective_exprs
-                ]
-                objective_values[0] -= penalty_weight * penalty
+
+                if cache is not None and cached_slot is None:
+                    raw_objectives = list(objective_values)
 
                 # Snap near-integer noise before keys go through the queue.
                 for i, val in enumerate(objective_values):
@@ -398,28 +809,110 @@ def solver_worker_main(
                     if abs(val - rounded) <= objective_tol:
                         objective_values[i] = float(rounded)
 
-                results.append(
-                    Solution(
-                        point=tuple(objective_values),
-                        variables={
+                capture = store_vars
+                if archive is not None:
+                    # Only points entering this worker's archive can be on
+                    # the final front; release variables of evicted points
+                    # that have not been shipped yet.
+                    key = tuple(round_points(objective_values, round_decimals).tolist())
+                    capture, evicted = archive.offer(key)
+                    for old_key in evicted:
+                        old_idx = captured_in_job.pop(old_key, None)
+                        if old_idx is None:
+                            continue
+                        results[old_idx] = Solution(results[old_idx].point)
+                        if row_of[old_idx] >= 0:
+                            free_rows.append(row_of[old_idx])
+                            row_of[old_idx] = -1
+                    if capture:
+                        captured_in_job[key] = len(results)
+
+                if native is not None and capture and cached_slot is None:
+                    native.load_vars(model_vars)
+                row = -1
+                if columnar_vars and capture:
+                    if free_rows:
+                        row = free_rows.pop()
+                    else:
+                        row = used_rows
+                        used_rows += 1
+                        if row == rows.shape[0]:
+                            rows = np.resize(
+                                rows, (max(8, 2 * rows.shape[0]), column_count)
+                            )
+                    rows[row] = (
+                        [np.nan if v.value is None else v.value for v in columnar_vars]
+                        if cached_slot is None
+                        else cached_payload
+                    )
+                variables = None
+                if capture and not columnar_vars:
+                    variables = (
+                        {
                             var.name: {
                                 k: float(v) for k, v in var.extract_values().items()
                             }
                             for var in model_vars
                         }
-                        if store_vars
-                        else None,
+                        if cached_slot is None
+                        else cached_payload
                     )
+                row_of.append(row)
+                results.append(
+                    Solution(point=tuple(objective_values), variables=variables)
                 )
 
+                if cache is not None and cached_slot is None:
+                    # Only "all" capture ever reuses the payload: a cache hit
+                    # repeats a point the local archive has already seen.
+                    payload = None
+                    if capture and archive is None:
+                        payload = rows[row].copy() if columnar_vars else variables
+                    cache.store(
+                        eps_array,
+                        [raw_objectives[o] for o in constrained_order],
+                        raw_objectives,
+                        payload,
+                    )
+
                 visited += bypass_jump
                 current_idx += 1 + bypass_jump
 
+            if steal_board is not None:
+                linear_stop = steal_board.finish(worker_id)
+            if busy_counter is not None:
+                # Added before `visited`, so the parent never sees points
+                # without the time they took.
+                busy_counter.add(time.perf_counter_ns() - job_started)
             visited_counter.add(visited)
             solved_counter.add(solved)
             infeasible_counter.add(infeasible)
-            if results:
-                result_q.put(results)
+            if cache is not None:
+                cache_hit_counter.add(cache_hits)
+                cache_miss_counter.add(solved)
+            if results and point_ring is not None:
+                points = np.array([sol.point for sol in results], dtype=float)
+                if not point_ring.write(points, stop_event, wakeup):
+                    break
+            elif results:
+                for chunk in _job_chunks(results, rows, row_of, columnar_vars):
+                    result_q.put(chunk)
+            if report_ranges and current_idx >= linear_stop:
+                # Checkpoints count a range as done once this marker, sent
+                # after the range's chunks on the same queue, arrives.
+                result_q.put(
+                    CompletedRange(
+                        range(int(work.start), linear_stop),
+                        (
+                            solved,
+                            infeasible,
+                            cache_hits,
+                            solved if cache is not None else 0,
+                        ),
+                    )
+                )
+            if wakeup is not None:
+                wakeup.notify()
 
         if config.process_logging:
             log.info(f"Process {worker_id} finished")
@@ -435,7 +928,11 @@ def solver_worker_main(
             }
         )
         stop_event.set()
+        if wakeup is not None:
+            wakeup.notify()
         raise
     finally:
-        if solver is not None:
+        if solver is not None and solver_cache is None:
             release_solver(solver, backend)
+        if native is not None:
+            native.release()
@@ -1,9 +1,13 @@
+import asyncio
+import pickle
+from contextlib import nullcontext
 from pathlib import Path
 
 import numpy as np
+import pyomo.environ as pyo
 import pytest
 
-from pyaugmecon import PyAugmecon
+from pyaugmecon import PyAugmecon, WorkerPool
 from tests.support.assertions import array_equal
 from tests.support.factories import make_config
 from tests.support.models import (
@@ -94,6 +98,331 @@ def test_decision_variables_are_plain_mappings(tmp_path):
     assert all(isinstance(values, dict) for values in decision_vars.values())
 
 
+def test_columnar_variable_storage_matches_dict_storage(tmp_path):
+    results = {
+        storage: PyAugmecon(
+            two_objective_model(),
+            make_config(
+                f"two_objective_{storage}_decisions",
+                mode="sampled",
+                sample_points=5,
+                store_decision_variables=True,
+                variable_storage=storage,
+                artifact_folder=str(tmp_path),
+            ),
+        ).solve()
+        for storage in ("dict", "columnar")
+    }
+
+    dict_result, columnar_result = results["dict"], results["columnar"]
+    assert columnar_result.points == dict_result.points
+    for point in dict_result.points:
+        assert columnar_result.variables_for(point) == dict_result.variables_for(point)
+
+
+@pytest.mark.parametrize("storage", ["dict", "columnar"])
+def test_nondominated_capture_keeps_front_variables(tmp_path, storage):
+    results = {
+        capture: PyAugmecon(
+            three_objective_model(),
+            make_config(
+                f"three_objective_{storage}_{capture}_capture",
+                mode="sampled",
+                sample_points=6,
+                store_decision_variables=True,
+                variable_storage=storage,
+                variable_capture=capture,
+                artifact_folder=str(tmp_path),
+            ),
+        ).solve()
+        for capture in ("all", "nondominated")
+    }
+
+    full, pruned = results["all"], results["nondominated"]
+    assert pruned.points == full.points
+    assert pruned.total_points == full.total_points
+    for point in full.points:
+        assert pruned.variables_for(point) == full.variables_for(point)
+
+
+def test_solution_cache_reuses_incumbents_without_changing_front(tmp_path):
+    results = {
+        size: PyAugmecon(
+            two_objective_model(),
+            make_config(
+                f"two_objective_cache_{size}",
+                store_decision_variables=True,
+                solution_cache_size=size,
+                artifact_folder=str(tmp_path),
+            ),
+        ).solve()
+        for size in (0, 16)
+    }
+
+    uncached, cached = results[0], results[16]
+    assert cached.points == uncached.points
+    for point in uncached.points:
+        assert cached.variables_for(point) == uncached.variables_for(point)
+    assert (uncached.cache_hits, uncached.cache_misses) == (0, 0)
+    assert cached.cache_hits > 0
+    assert cached.cache_misses == cached.models_solved
+    assert cached.models_solved + cached.cache_hits == uncached.models_solved
+
+
+def test_worker_pool_is_reused_across_solves():
+    expected = PyAugmecon(two_objective_model(), make_config("unpooled")).solve()
+
+    with WorkerPool(2) as pool:
+        pids = [proc.pid for proc in pool.procs]
+        runs = [
+            PyAugmecon(
+                two_objective_model(),
+                make_config("pooled", workers=2, **distribution),
+                pool=pool,
+            ).solve()
+            for distribution in ({}, {"work_distribution": "fixed"}, {})
+        ]
+        assert [proc.pid for proc in pool.procs] == pids
+        assert all(proc.is_alive() for proc in pool.procs)
+
+        with pytest.raises(ValueError, match="WorkerPool size"):
+            PyAugmecon(two_objective_model(), make_config("pool_size"), pool=pool)
+
+    assert pool.closed
+    for run in runs:
+        assert run.points == expected.points
+        assert run.models_solved > 0
+        assert run.first_solve_seconds is not None
+
+
+@pytest.mark.parametrize("start_method", ["fork", "forkserver"])
+def test_start_method_matches_spawn_front(start_method):
+    expected = PyAugmecon(two_objective_model(), make_config("spawned")).solve()
+    result = PyAugmecon(
+        two_objective_model(),
+        make_config(start_method, workers=2, start_method=start_method),
+    ).solve()
+
+    assert result.points == expected.points
+    assert result.first_solve_seconds is not None
+    assert 0 <= result.first_solve_seconds <= result.runtime_seconds
+
+
+def test_point_rings_match_result_queue_front():
+    config = {"mode": "sampled", "sample_points": 20, "workers": 2}
+    expected = PyAugmecon(
+        three_objective_model(), make_config("queued_results", **config)
+    ).solve()
+    # A small ring makes workers wait for the parent to drain it.
+    result = PyAugmecon(
+        three_objective_model(),
+        make_config("ring_results", result_buffer_size=4, **config),
+    ).solve()
+
+    assert array_equal(result.points, expected.points, 6)
+
+
+def test_adaptive_chunks_match_fixed_size_front():
+    config = {
+        "mode": "sampled",
+        "sample_points": 20,
+        "workers": 2,
+        "work_distribution": "dynamic",
+    }
+    expected = PyAugmecon(
+        three_objective_model(), make_config("fixed_chunks", **config)
+    ).solve()
+    result = PyAugmecon(
+        three_objective_model(),
+        make_config("adaptive_chunks", chunk_target_seconds=0.01, **config),
+    ).solve()
+
+    assert array_equal(result.points, expected.points, 6)
+    assert result.visited_points == expected.visited_points
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+def test_work_stealing_matches_plain_outer_grid_front(pooled):
+    config = {
+        "mode": "sampled",
+        "sample_points": 40,
+        "workers": 2,
+        "work_distribution": "outer_grid",
+    }
+    expected = PyAugmecon(
+        three_objective_model(),
+        make_config("outer_grid_plain", **config),
+    ).solve()
+
+    with WorkerPool(2) if pooled else nullcontext() as pool:
+        result = PyAugmecon(
+            three_objective_model(),
+            make_config("outer_grid_stealing", work_stealing=True, **config),
+            pool=pool,
+        ).solve()
+
+    assert array_equal(result.points, expected.points, 6)
+    assert result.visited_points == expected.visited_points
+
+
+def test_probe_rows_keep_the_outer_grid_front():
+    config = {
+        "mode": "sampled",
+        "sample_points": 20,
+        "workers": 2,
+        "work_distribution": "outer_grid",
+        "flag_policy": "shared",
+    }
+    expected = PyAugmecon(
+        three_objective_model(), make_config("outer_grid_linear", **config)
+    ).solve()
+    result = PyAugmecon(
+        three_objective_model(),
+        make_config("outer_grid_probe", probe_stride=4, **config),
+    ).solve()
+
+    assert array_equal(result.points, expected.points, 6)
+    assert result.visited_points == expected.visited_points
+    assert expected.probe_solves is None
+    assert 0 < result.probe_solves <= result.models_solved
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+def test_parallel_setup_matches_serial_payoff(pooled):
+    config = {"mode": "sampled", "sample_points": 6, "workers": 2}
+    expected = PyAugmecon(
+        three_objective_model(), make_config("serial_setup", **config)
+    ).solve()
+
+    with WorkerPool(2) if pooled else nullcontext() as pool:
+        solver = PyAugmecon(
+            three_objective_model(),
+            make_config("parallel_setup", parallel_setup=True, **config),
+            pool=pool,
+        )
+        result = solver.solve()
+
+    assert solver.model.setup_runner is None
+    assert np.array_equal(result.payoff_table, expected.payoff_table)
+    assert result.points == expected.points
+    assert solver.model.progress.counter.value() >= solver.model.setup_solve_count
+
+
+def test_setup_cache_skips_payoff_and_nadir_solves(tmp_path):
+    def run(name, **overrides):
+        return PyAugmecon(
+            three_objective_model(),
+            make_config(
+                name,
+                mode="sampled",
+                sample_points=6,
+                artifact_folder=str(tmp_path),
+                **overrides,
+            ),
+        ).solve()
+
+    expected = run("uncached")
+    assert expected.setup_cache_hit is None
+
+    first = run("cache_miss", setup_cache=True)
+    second = run("cache_hit", setup_cache=True)
+    assert first.setup_cache_hit is False
+    assert second.setup_cache_hit is True
+    assert len(list((tmp_path / "setup_cache").glob("*.json"))) == 1
+    for result in (first, second):
+        assert np.array_equal(result.payoff_table, expected.payoff_table)
+        assert result.points == expected.points
+        assert result.visited_points == expected.visited_points
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_resume_re_solves_results_lost_after_checkpoint(tmp_path, workers):
+    config = {"mode": "sampled", "sample_points": 8, "workers": workers}
+    expected = PyAugmecon(
+        three_objective_model(), make_config("uncheckpointed", **config)
+    ).solve()
+
+    solver = PyAugmecon(
+        three_objective_model(),
+        make_config(
+            "checkpointed",
+            artifact_folder=str(tmp_path),
+            artifact_name="checkpointed",
+            checkpoint_interval=60.0,
+            **config,
+        ),
+    )
+    assert solver.solve().points == expected.points
+
+    # Keep only the first log record, as if the run died right after it.
+    log_path = tmp_path / "checkpointed" / "checkpoint" / "log.pkl"
+    with log_path.open("rb") as log:
+        pickle.load(log)  # noqa: S301
+        kept = log.tell()
+    log_path.write_bytes(log_path.read_bytes()[:kept])
+
+    resumed = PyAugmecon.resume(tmp_path / "checkpointed")
+    assert resumed.config.workers == workers
+    result = resumed.solve()
+    assert np.array_equal(result.payoff_table, expected.payoff_table)
+    assert result.points == expected.points
+    if workers == 1:
+        # Nothing had finished, so the first run's solves are not carried
+        # over. (Job splits, and so solve counts, vary with more workers.)
+        assert result.models_solved == expected.models_solved
+
+
+def test_iter_solutions_streams_the_final_front():
+    config = make_config(
+        "streamed", mode="sampled", sample_points=8, store_decision_variables=True
+    )
+    solver = PyAugmecon(three_objective_model(), config)
+
+    streamed = list(solver.iter_solutions())
+
+    result = solver.result
+    assert result is not None
+    assert len({s.point for s in streamed}) == len(streamed)
+    assert set(result.points) <= {s.point for s in streamed}
+    for solution in streamed:
+        if solution.point in result.points:
+            assert solution.variables == result.variables_for(solution.point)
+
+    tracker = solver.hypervolume_tracker()
+    tracker.add(np.array([s.point for s in streamed if s.point in result.points]))
+    assert tracker.value == pytest.approx(result.hypervolume())
+
+
+def test_aiter_solutions_streams_nondominated_points():
+    solver = PyAugmecon(
+        three_objective_model(),
+        make_config("streamed_async", mode="sampled", sample_points=8, workers=2),
+    )
+
+    async def collect():
+        return [s.point async for s in solver.aiter_solutions(nondominated=True)]
+
+    streamed = asyncio.run(collect())
+
+    assert solver.result is not None
+    assert len(set(streamed)) == len(streamed)
+    assert set(solver.result.points) <= set(streamed)
+
+
+def test_iter_solutions_stops_workers_when_closed_early():
+    solver = PyAugmecon(
+        three_objective_model(),
+        make_config("streamed_early", mode="sampled", sample_points=8, workers=2),
+    )
+
+    solutions = solver.iter_solutions()
+    next(solutions)
+    solutions.close()
+
+    assert solver.result is None
+    assert all(proc.exitcode is not None for proc in solver.procs.procs)
+
+
 def test_write_csv_writes_csv_artifacts(tmp_path):
     artifact_name = "csv_artifacts"
     solver = PyAugmecon(
@@ -116,6 +445,35 @@ def test_write_csv_writes_csv_artifacts(tmp_path):
     assert (output_dir / "solutions.csv").is_file()
 
 
+def test_artifact_formats_write_npz_tables(tmp_path):
+    solver = PyAugmecon(
+        two_objective_model(),
+        make_config(
+            "npz_artifacts",
+            workers=2,
+            mode="sampled",
+            sample_points=5,
+            artifact_folder=str(tmp_path),
+            artifact_name="npz_artifacts",
+            write_csv=False,
+            artifact_formats=["csv", "npz"],
+            async_artifacts=True,
+            store_decision_variables=True,
+        ),
+    )
+    result = solver.solve()
+    solver.wait_for_artifacts()
+
+    output_dir = Path(tmp_path) / "npz_artifacts"
+    assert not list(output_dir.glob("*.csv"))
+    with np.load(output_dir / "solutions.npz") as solutions:
+        assert np.array_equal(solutions["objective_1"], result.points_array[:, 0])
+    with np.load(output_dir / "found_points.npz") as found:
+        assert len(found["objective_1"]) == result.total_points
+    with np.load(output_dir / "variables.npz") as variables:
+        assert all(len(column) == result.count for column in variables.values())
+
+
 def test_safe_and_payoff_nadir_strategies_find_same_pareto_front():
     """Both auto-nadir strategies must find the extreme (lex-optimal) points.
 
@@ -155,3 +513,31 @@ def test_safe_and_payoff_nadir_strategies_find_same_pareto_front():
         float(payoff.payoff_table[i, i]) for i in range(payoff.payoff_table.shape[0])
     )
     assert safe_diag == pytest.approx(payoff_diag, abs=1e-2)
+
+
+@pytest.mark.parametrize(
+    ("module", "backend"),
+    [
+        ("gurobipy", "gurobi_persistent"),
+        ("cplex", "cplex_persistent"),
+        ("xpress", "xpress_persistent"),
+    ],
+)
+def test_persistent_backend_matches_default_front(three_objective_run, module, backend):
+    pytest.importorskip(module)
+    if not pyo.SolverFactory(backend).available(exception_flag=False):
+        pytest.skip(f"{backend} is not licensed here")
+    solver = PyAugmecon(
+        three_objective_model(),
+        make_config(
+            f"persistent_{backend}",
+            mode="sampled",
+            sample_points=10,
+            solver_name=backend,
+        ),
+    )
+    solver.solve()
+
+    assert array_equal(
+        sorted(solver.result.points), sorted(three_objective_run.result.points), 6
+    )
@@ -150,7 +150,7 @@ def test_solve_once_prepares_persistent_backend_once_per_model(mocker, pyomo_res
     solve_once(model, solver, backend_name="gurobi_persistent", warmstart=True)
 
     solver.set_instance.assert_called_once_with(model)
-    assert solver.update.call_count == 2
+    solver.update.assert_not_called()
     assert solver.solve.call_count == 2
     solver.solve.assert_called_with(model, load_solutions=False, warmstart=True)
 
@@ -166,4 +166,94 @@ def test_solve_once_rebinds_persistent_backend_on_model_change(mocker, pyomo_res
 
     assert solver.set_instance.call_count == 2
     solver.set_instance.assert_has_calls([mocker.call(model), mocker.call(model_b)])
-    assert solver.update.call_count == 2
+    solver.update.assert_not_called()
+
+
+def _epsilon_model():
+    """Minimal model in augmented form: `x + 2 - slack == eps`."""
+    model = pyo.ConcreteModel()
+    model.x = pyo.Var()
+    model._pyaugmecon_os = pyo.Set(ordered=True, initialize=[2])
+    model._pyaugmecon_slack = pyo.Var(model._pyaugmecon_os)
+    model._pyaugmecon_eps = pyo.Param(model._pyaugmecon_os, mutable=True, initialize=5)
+    model._pyaugmecon_constraint_list = pyo.ConstraintList()
+    model._pyaugmecon_constraint_list.add(
+        expr=model.x + 2 - model._pyaugmecon_slack[2] == model._pyaugmecon_eps[2]
+    )
+    return model
+
+
+def test_solve_once_pushes_gurobi_persistent_rhs(mocker, pyomo_result):
+    solver = mocker.MagicMock()
+    solver.solve.return_value = pyomo_result
+    model = _epsilon_model()
+    handle = mocker.MagicMock()
+    solver._pyomo_con_to_solver_con_map = {model._pyaugmecon_constraint_list[1]: handle}
+
+    solve_once(model, solver, backend_name="gurobi_persistent", warmstart=True)
+    model._pyaugmecon_eps[2] = 9
+    solve_once(model, solver, backend_name="gurobi_persistent", warmstart=True)
+
+    assert handle.RHS == 7.0
+    solver.set_instance.assert_called_once_with(model)
+    solver.update.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("backend", "setter"),
+    [
+        ("cplex_persistent", "linear_constraints.set_rhs"),
+        ("xpress_persistent", "chgrhs"),
+    ],
+)
+def test_solve_once_pushes_native_rhs_through_handle(
+    mocker, pyomo_result, backend, setter
+):
+    solver = mocker.MagicMock()
+    solver.solve.return_value = pyomo_result
+    model = _epsilon_model()
+    con = model._pyaugmecon_constraint_list[1]
+    solver._pyomo_con_to_solver_con_map = {con: "c1"}
+
+    solve_once(model, solver, backend_name=backend, warmstart=True)
+    model._pyaugmecon_eps[2] = 9
+    solve_once(model, solver, backend_name=backend, warmstart=True)
+
+    native_setter = solver._solver_model
+    for attr in setter.split("."):
+        native_setter = getattr(native_setter, attr)
+    if backend == "xpress_persistent":
+        native_setter.assert_called_once_with(["c1"], [7.0])
+    else:
+        native_setter.assert_called_once_with("c1", 7.0)
+
+
+def test_solve_once_rebinds_when_native_handle_is_missing(mocker, pyomo_result):
+    solver = mocker.MagicMock()
+    solver.solve.return_value = pyomo_result
+    model = _epsilon_model()
+    solver._pyomo_con_to_solver_con_map = {}
+
+    solve_once(model, solver, backend_name="cplex_persistent", warmstart=True)
+    model._pyaugmecon_eps[2] = 9
+    solve_once(model, solver, backend_name="cplex_persistent", warmstart=True)
+
+    solver._solver_model.linear_constraints.set_rhs.assert_not_called()
+    assert solver.set_instance.call_count == 2
+
+
+def test_solve_once_rebinds_when_the_active_objective_changes(mocker, pyomo_result):
+    solver = mocker.MagicMock()
+    solver.solve.return_value = pyomo_result
+    model = _epsilon_model()
+    model.first = pyo.Objective(expr=model.x)
+    model.second = pyo.Objective(expr=-model.x)
+    model.second.deactivate()
+
+    solve_once(model, solver, backend_name="gurobi_persistent", warmstart=True)
+    model.first.deactivate()
+    model.second.activate()
+    solve_once(model, solver, backend_name="gurobi_persistent", warmstart=True)
+    solve_once(model, solver, backend_name="gurobi_persistent", warmstart=True)
+
+    assert solver.set_instance.call_count == 2
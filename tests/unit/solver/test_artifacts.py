@@ -0,0 +1,71 @@
+import sys
+
+import numpy as np
+import pytest
+
+from pyaugmecon.results import PyAugmeconResult, Solution
+from pyaugmecon.solver.artifacts import ArtifactWriter
+
+
+def _result() -> PyAugmeconResult:
+    return PyAugmeconResult.from_worker_chunks(
+        [
+            [
+                Solution((1.0, 3.0), {"x": {0: 1.0}}),
+                Solution((2.0, 2.0), {"x": {0: 2.0}}),
+                Solution((0.0, 0.0), {"x": {0: 0.0}}),
+            ]
+        ],
+        sign=(1, -1),
+        payoff_table=[[2.0, 2.0], [1.0, 3.0]],
+        runtime_seconds=0.5,
+        models_solved=3,
+        models_infeasible=0,
+        visited_points=3,
+        grid_point_count=3,
+        decision_variables_stored=True,
+        round_decimals=6,
+    )
+
+
+def test_writer_streams_points_and_writes_tables(tmp_path):
+    writer = ArtifactWriter(tmp_path, ["csv", "npz"], sign=(1, -1), round_decimals=6)
+    writer.write_grid({2: np.array([0.0, 1.5, 3.0])})
+    writer.write_payoff(np.array([[2.0, -2.0], [1.0, -3.0]]))
+    writer.stream([np.array([[1.0, 3.0], [1.0000000001, 3.0]])])
+    writer.stream([[Solution((2.0, 2.0))], np.array([[1.0, 3.0]])])
+    writer.write_result(_result())
+    writer.close()
+
+    assert (tmp_path / "epsilon_grid.csv").read_text() == "0.0,1.5,3.0\n"
+    assert (tmp_path / "found_points.csv").read_text() == "1.0,-3.0\n2.0,-2.0\n"
+    assert (tmp_path / "solutions.csv").read_text() == "1.0,-3.0\n2.0,-2.0\n"
+    assert (tmp_path / "variables.csv").read_text() == "x[0]\n1.0\n2.0\n"
+    with np.load(tmp_path / "epsilon_grid.npz") as grid:
+        assert grid["objective"].tolist() == [2, 2, 2]
+        assert grid["epsilon"].tolist() == [0.0, 1.5, 3.0]
+    with np.load(tmp_path / "found_points.npz") as found:
+        assert found["objective_2"].tolist() == [-3.0, -2.0]
+    with np.load(tmp_path / "payoff_table.npz") as payoff:
+        assert payoff["objective_1"].tolist() == [2.0, 1.0]
+
+
+def test_writer_reraises_background_errors(tmp_path):
+    (tmp_path / "solutions.csv").mkdir()
+    writer = ArtifactWriter(tmp_path, ["csv"], sign=(1, 1), round_decimals=6)
+    writer.stream([np.array([[1.0, 2.0]])])
+    writer.write_result(_result())
+    writer.write_payoff(np.eye(2))
+
+    with pytest.raises(IsADirectoryError):
+        writer.close()
+    # Later jobs were skipped, but the stream was still closed.
+    assert not (tmp_path / "payoff_table.csv").exists()
+    assert (tmp_path / "found_points.csv").read_text() == "1.0,2.0\n"
+    writer.close()
+
+
+def test_writer_needs_pyarrow_for_arrow_formats(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(RuntimeError, match="pyarrow"):
+        ArtifactWriter(tmp_path, ["parquet"], sign=(1, 1), round_decimals=6)
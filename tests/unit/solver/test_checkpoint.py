@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from pyaugmecon.results import Solution
+from pyaugmecon.solver.checkpoint import (
+    CHECKPOINT_FOLDER,
+    CheckpointWriter,
+    CompletedRange,
+    RunState,
+    load_checkpoint,
+)
+from pyaugmecon.solver.setup_cache import SetupEntry
+
+COUNTS = {"models_solved": 5, "infeasibilities": 1, "cache_hits": 0, "cache_misses": 0}
+DONE = CompletedRange(range(2), (5, 1, 0, 0))
+
+
+def _state() -> RunState:
+    return RunState(
+        config={"name": "checkpoint"},
+        model_blob=b"model",
+        setup=SetupEntry(np.eye(2), [1, 1]),
+        grid_sizes_inner=(4,),
+    )
+
+
+def test_checkpoint_round_trips_log_and_snapshot(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_checkpoint(tmp_path)
+
+    writer = CheckpointWriter(tmp_path / CHECKPOINT_FOLDER, 60.0, _state())
+    writer.record([[Solution((1.0, 2.0))], DONE])
+    flags = np.array([0, 2, 0, 0], dtype=np.uint32)
+    writer.flush((flags, None))
+    assert not (tmp_path / CHECKPOINT_FOLDER / "snapshot.npz").exists()
+    writer.flush((flags, None), force=True)
+    writer.close()
+
+    checkpoint = load_checkpoint(tmp_path)
+    assert checkpoint.state.grid_sizes_inner == (4,)
+    assert checkpoint.chunks == [[Solution((1.0, 2.0))]]
+    assert checkpoint.completed == [range(2)]
+    assert checkpoint.completed_points == 2
+    assert np.array_equal(checkpoint.flags, flags)
+    assert checkpoint.outer_skip is None
+    assert checkpoint.counts == COUNTS
+
+
+def test_resumed_writer_appends_after_last_intact_record(tmp_path):
+    folder = tmp_path / CHECKPOINT_FOLDER
+    writer = CheckpointWriter(folder, 60.0, _state())
+    writer.record([DONE])
+    writer.flush((None, None), force=True)
+    writer.close()
+    intact = (folder / "log.pkl").stat().st_size
+    with (folder / "log.pkl").open("ab") as log:
+        log.write(b"\x80\x05partial")
+
+    checkpoint = load_checkpoint(tmp_path)
+    assert checkpoint.completed == [range(2)]
+    assert checkpoint.log_bytes == intact
+
+    writer = CheckpointWriter(folder, 60.0, None, log_bytes=checkpoint.log_bytes)
+    writer.record([[Solution((0.0, 3.0))], CompletedRange(range(1, 4), (2, 0, 1, 1))])
+    writer.close()
+
+    resumed = load_checkpoint(tmp_path)
+    assert resumed.completed == [range(2), range(1, 4)]
+    assert resumed.completed_points == 4
+    assert resumed.counts == {
+        "models_solved": 7,
+        "infeasibilities": 1,
+        "cache_hits": 1,
+        "cache_misses": 1,
+    }
+
+
+def test_counts_cover_only_completed_ranges(tmp_path):
+    writer = CheckpointWriter(tmp_path / CHECKPOINT_FOLDER, 60.0, _state())
+    # A chunk whose range never finished: its solves are redone on resume.
+    writer.record([[Solution((1.0, 2.0))]])
+    writer.close()
+
+    checkpoint = load_checkpoint(tmp_path)
+    assert checkpoint.chunks == [[Solution((1.0, 2.0))]]
+    assert checkpoint.completed == []
+    assert set(checkpoint.counts.values()) == {0}
@@ -0,0 +1,74 @@
+import pytest
+
+from pyaugmecon import PyAugmecon
+from pyaugmecon.solver.adapter import HIGHS_NATIVE_ENGINE, SolveOutcome
+from pyaugmecon.solver.highs_native import HighsNativeSweep
+from tests.support.assertions import array_equal
+from tests.support.factories import make_config
+from tests.support.models import three_objective_model, two_objective_model
+
+pytest.importorskip("highspy")
+
+
+def _converted(model_factory, name):
+    solver = PyAugmecon(
+        model_factory(),
+        make_config(name, mode="sampled", sample_points=5),
+    )
+    solver.model.deactivate_all_objectives()
+    solver.model.min_to_max()
+    solver.model.construct_payoff()
+    solver.model.find_obj_range()
+    solver.model.convert_prob()
+    solver.model.obj(0).activate()
+    return solver.model
+
+
+def test_native_sweep_reports_objectives_and_slack():
+    model = _converted(two_objective_model, "native_sweep_values")
+    sweep = HighsNativeSweep(model.model, model.constrained_order_inner, {})
+
+    result = sweep.solve([160.0])
+
+    assert result.outcome == SolveOutcome.OPTIMAL
+    assert result.backend == HIGHS_NATIVE_ENGINE
+    assert sweep.objective_values()[1] == pytest.approx(160.0)
+    assert sweep.slack_values() == pytest.approx([0.0])
+
+
+def test_native_sweep_detects_infeasible_epsilon():
+    model = _converted(two_objective_model, "native_sweep_infeasible")
+    sweep = HighsNativeSweep(model.model, model.constrained_order_inner, {})
+
+    assert sweep.solve([1000.0]).outcome == SolveOutcome.INFEASIBLE
+
+
+def test_native_engine_matches_pyomo_front():
+    config = {"mode": "sampled", "sample_points": 6}
+    pyomo_result = PyAugmecon(
+        three_objective_model(), make_config("native_front_pyomo", **config)
+    ).solve()
+    native_result = PyAugmecon(
+        three_objective_model(),
+        make_config("native_front_native", solver_name=HIGHS_NATIVE_ENGINE, **config),
+    ).solve()
+
+    assert array_equal(native_result.points, pyomo_result.points, 4)
+    assert array_equal(native_result.payoff_table, pyomo_result.payoff_table, 4)
+
+
+def test_native_engine_loads_decision_variables():
+    result = PyAugmecon(
+        two_objective_model(),
+        make_config(
+            "native_decision_vars",
+            mode="sampled",
+            sample_points=4,
+            solver_name=HIGHS_NATIVE_ENGINE,
+            store_decision_variables=True,
+        ),
+    ).solve()
+
+    point = result.points[0]
+    variables = result.variables_for(point)
+    assert variables["x1"][None] == pytest.approx(point[0])
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import numpy as np
+import pyomo.environ as pyo
 from pyomo.core.expr.visitor import identify_variables
 
 from pyaugmecon import PyAugmecon
+from pyaugmecon.solver.model import SetupChain, run_setup_chain
 from tests.support.assertions import array_equal
 from tests.support.factories import make_config
 from tests.support.models import three_objective_model, two_objective_model
@@ -81,3 +83,28 @@ def test_payoff_strategy_skips_extra_setup_solves():
     )
     constrained = safe.model.n_obj - 1
     assert safe.model.to_solve - payoff.model.to_solve == constrained
+
+
+def test_setup_chain_restores_model_state():
+    solver = PyAugmecon(two_objective_model(), make_config("model_setup_chain"))
+    solver.model.deactivate_all_objectives()
+    solver.model.min_to_max()
+    solver.model.construct_payoff()
+    model = solver.model.model
+    model.x1.set_value(None)
+    model.x2.set_value(None)
+
+    with solver.model._reusable_solver() as reusable:
+        row = run_setup_chain(
+            model, solver.config, SetupChain((0,), locks=((1, 184.0),)), reusable
+        )
+        nadir = run_setup_chain(
+            model, solver.config, SetupChain((1,), minimize=True), reusable
+        )
+
+    assert row == [8.0]
+    assert nadir == [0.0]
+    assert len(model._pyaugmecon_payoff_constraint_list) == 0
+    assert model.x1.value is None
+    assert model.x2.value is None
+    assert all(objective.sense == pyo.maximize for objective in model.obj_list.values())
@@ -0,0 +1,17 @@
+import queue
+from unittest.mock import MagicMock
+
+from pyaugmecon.solver.pool import _run_pool_job, _SkipTable
+
+
+def test_pool_job_reports_attach_failures():
+    run = MagicMock()
+    run.flag_table = _SkipTable("pyaugmecon-missing-table", 4, "I")
+    error_q = queue.Queue()
+
+    _run_pool_job(3, run, None, None, error_q, None, (), {}, None, None)
+
+    error = error_q.get_nowait()
+    assert error["worker_id"] == 3
+    assert error["backend"] == "unresolved"
+    assert "FileNotFoundError" in error["traceback"]
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import time
 from multiprocessing import get_context
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from pyaugmecon import PyAugmecon
 from pyaugmecon.solver.model import Model
 from pyaugmecon.solver.process import ProcessHandler
 from pyaugmecon.solver.queue import QueueHandler
-from pyaugmecon.solver.worker import SkipBuffers, WorkerSpec
+from pyaugmecon.solver.worker import FlagTable, SkipBuffers, WorkerSpec, skip_typecode
 from tests.support.factories import make_config
 from tests.support.models import three_objective_model, two_objective_model
 
@@ -92,6 +94,19 @@ def test_raises_on_nonzero_exit_code(self, handler):
         with pytest.raises(RuntimeError, match="exited unexpectedly"):
             handler.join()
 
+    def test_waits_on_sentinels_and_wakeup_pipe(self, handler, monkeypatch):
+        handler.queues.error_q = handler.ctx.Queue()
+        handler._started_at = time.perf_counter()
+        handler.procs = [MagicMock(exitcode=None, sentinel=7), MagicMock(exitcode=0)]
+        waited = MagicMock(return_value=[])
+        monkeypatch.setattr("pyaugmecon.solver.process.wait", waited)
+
+        assert handler.join() is False
+
+        (handles,) = waited.call_args.args
+        assert handles == [7, handler.wakeup.reader]
+        assert waited.call_args.kwargs["timeout"] <= 0.25
+
 
 class TestClose:
     def test_clears_skip_buffers(self, handler):
@@ -109,6 +124,7 @@ def test_shared_flag(self, handler):
         bufs = handler._build_skip_buffers()
 
         assert bufs.flag_buffer is not None
+        assert len(bufs.flag_buffer) == FlagTable.size(bufs.flag_shape)
         assert bufs.flag_is_shared is True
 
     def test_no_flag_buffers_by_default(self, handler):
@@ -136,3 +152,6 @@ def test_outer_grid_three_objectives(self, handler):
         assert bufs.outer_skip_buffer is not None
         assert bufs.outer_skip_shape is not None
         assert len(bufs.outer_skip_shape) >= 1
+        table = np.ctypeslib.as_array(bufs.outer_skip_buffer)
+        assert table.dtype == np.dtype(skip_typecode(model.grid_sizes_inner[0]))
+        assert (table == model.grid_sizes_inner[0]).all()
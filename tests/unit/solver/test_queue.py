@@ -1,8 +1,17 @@
+import threading
 from multiprocessing import get_context
+from multiprocessing.connection import wait
 
+import numpy as np
 import pytest
 
-from pyaugmecon.solver.queue import QueueHandler
+from pyaugmecon.solver.queue import (
+    ChunkPlanner,
+    PointRing,
+    QueueHandler,
+    StealBoard,
+    Wakeup,
+)
 from tests.support.factories import make_config
 
 
@@ -45,6 +54,80 @@ def test_get_result_drains_queue():
     assert queues.get_result() == []
 
 
+def test_wakeup_holds_one_signal_until_cleared():
+    wakeup = Wakeup(get_context("spawn"))
+    assert not wakeup.reader.poll()
+
+    wakeup.notify()
+    wakeup.notify()
+    assert wait([wakeup.reader], timeout=1.0) == [wakeup.reader]
+    wakeup.clear()
+    assert not wakeup.reader.poll()
+
+    wakeup.notify()
+    assert wakeup.reader.poll()
+
+
+def test_point_ring_wraps_and_reads_in_order():
+    ring = PointRing(get_context("spawn"), capacity=4, n_obj=2)
+    stop = threading.Event()
+
+    assert ring.write(np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]), stop)
+    assert ring.read().tolist() == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    assert ring.write(np.array([[7.0, 8.0], [9.0, 10.0]]), stop)
+    assert ring.read().tolist() == [[7.0, 8.0], [9.0, 10.0]]
+    assert ring.read().shape == (0, 2)
+
+
+def test_point_ring_blocks_when_full_until_stopped():
+    ctx = get_context("spawn")
+    ring = PointRing(ctx, capacity=2, n_obj=1)
+    wakeup = Wakeup(ctx)
+    stop = threading.Event()
+    stop.set()
+
+    assert not ring.write(np.array([[1.0], [2.0], [3.0]]), stop, wakeup)
+    assert ring.read().tolist() == [[1.0], [2.0]]
+    assert not wakeup.reader.poll()
+
+
+def test_point_ring_wakes_the_parent_while_full():
+    ctx = get_context("spawn")
+    ring = PointRing(ctx, capacity=2, n_obj=1)
+    wakeup = Wakeup(ctx)
+    stop = threading.Event()
+    writer = threading.Thread(
+        target=ring.write, args=(np.array([[1.0], [2.0], [3.0]]), stop, wakeup)
+    )
+    writer.start()
+
+    # The third row waits for space; the writer signals meanwhile.
+    assert wait([wakeup.reader], timeout=5.0) == [wakeup.reader]
+    wakeup.clear()
+    assert ring.read().tolist() == [[1.0], [2.0]]
+    writer.join(timeout=5.0)
+    assert ring.read().tolist() == [[3.0]]
+
+
+def test_get_result_reads_point_rings_instead_of_queue():
+    config = make_config(
+        "queue_rings", workers=2, work_distribution="dynamic", result_buffer_size=4
+    )
+    queues = QueueHandler(range(2), 2, config)
+    ctx = get_context("spawn")
+    queues.split_work(ctx)
+    queues.open_point_rings(ctx, n_obj=2)
+
+    ring = queues.point_ring_for_worker(1)
+    assert ring is not None
+    ring.write(np.array([[1.0, 2.0]]), threading.Event())
+
+    drained = queues.get_result()
+    assert len(drained) == 1
+    assert drained[0].tolist() == [[1.0, 2.0]]
+    assert queues.get_result() == []
+
+
 def test_split_work_fixed_initializes_worker_queues():
     work = range(12)
     config = make_config("queue_fixed", workers=3, work_distribution="fixed")
@@ -102,6 +185,61 @@ def test_split_work_outer_grid_covers_full_grid_with_aligned_ranges():
     assert cursor == len(work)
 
 
+def test_split_work_outer_grid_opens_steal_board_for_several_workers():
+    work = range(64)
+    stealing = QueueHandler(
+        work,
+        len(work),
+        make_config(
+            "queue_steal",
+            workers=2,
+            work_distribution="outer_grid",
+            work_stealing=True,
+        ),
+        grid_sizes_inner=(4, 4, 4),
+    )
+    plain = QueueHandler(
+        work,
+        len(work),
+        make_config("queue_no_steal", workers=2, work_distribution="outer_grid"),
+        grid_sizes_inner=(4, 4, 4),
+    )
+
+    stealing.split_work(get_context("spawn"))
+    plain.split_work(get_context("spawn"))
+
+    assert stealing.steal_board is not None
+    assert plain.steal_board is None
+
+
+def test_steal_board_splits_after_the_owners_current_row():
+    board = StealBoard(get_context("spawn"), workers=2)
+    board.claim(0, range(8, 48))
+
+    # Owner is somewhere in row [8, 12): rows 12..47 are up for grabs.
+    assert board.steal(1, unit=4) == range(28, 48)
+    assert board.sync(0, 12) == 28
+    assert board.finish(1) == 48
+    assert board.steal(1, unit=4) == range(20, 28)
+    assert board.finish(0) == 20
+    assert board.steal(1, unit=4) is None
+
+
+def test_steal_board_hands_out_every_row_once():
+    unit = 5
+    board = StealBoard(get_context("spawn"), workers=3)
+    board.claim(0, range(100))
+    taken = [board.steal(1, unit), board.steal(2, unit)]
+    owned = {0: range(board.finish(0))}
+    for worker_id, stolen in zip((1, 2), taken, strict=True):
+        assert stolen is not None
+        assert stolen.start % unit == 0
+        owned[worker_id] = range(stolen.start, board.finish(worker_id))
+
+    points = sorted(i for r in owned.values() for i in r)
+    assert points == list(range(100))
+
+
 def test_split_work_outer_grid_requires_linear_range_work():
     work = list(range(64))
     config = make_config(
@@ -111,3 +249,101 @@ def test_split_work_outer_grid_requires_linear_range_work():
 
     with pytest.raises(ValueError, match="one continuous range"):
         queues.split_work(get_context("spawn"))
+
+
+def test_split_work_skips_completed_ranges():
+    work = range(12)
+    config = make_config("queue_resume", workers=2, work_distribution="dynamic")
+    queues = QueueHandler(
+        work, len(work), config, completed=[range(2, 5), range(8, 12)]
+    )
+
+    assert queues._without_completed([range(6), range(6, 12)]) == [
+        range(2),
+        range(5, 6),
+        range(6, 8),
+    ]
+
+    queues.split_work(get_context("spawn"))
+    jobs = []
+    sentinels = 0
+    while sentinels < queues.worker_count:
+        item = queues.shared_job_q.get(timeout=0.5)
+        if item is None:
+            sentinels += 1
+        else:
+            jobs.append(item)
+    assert sorted(i for job in jobs for i in job) == [0, 1, 5, 6, 7]
+
+
+def test_chunk_planner_sizes_jobs_from_reported_cost():
+    planner = ChunkPlanner(0.2, workers=2, initial=8)
+    assert planner.size(10_000) == 8
+
+    # 100 points in 0.1 s of worker time: 1 ms per point.
+    planner.observe(100, 100_000_000)
+    assert planner.size(10_000) == 200
+    # Near the end, jobs shrink to a share of what is left.
+    assert planner.size(300) == 75
+    assert planner.size(1) == 1
+
+    # Points arriving without new time are not counted.
+    planner.observe(150, 100_000_000)
+    assert planner.point_seconds == pytest.approx(1e-3)
+
+
+def test_feed_hands_out_remaining_grid_then_end_markers():
+    work = range(1000)
+    config = make_config(
+        "queue_adaptive",
+        workers=2,
+        work_distribution="dynamic",
+        chunk_target_seconds=0.2,
+    )
+    queues = QueueHandler(work, len(work), config, completed=[range(100, 200)])
+    queues.split_work(get_context("spawn"))
+    assert queues.chunk_planner is not None
+
+    jobs = []
+    sentinels = 0
+    swept = 0
+    while sentinels < queues.worker_count:
+        for item in queues._drain_queue(queues.shared_job_q):
+            if item is None:
+                sentinels += 1
+            else:
+                jobs.append(item)
+                swept += len(item)
+        queues.feed(swept, swept * 1_000_000)
+
+    assert jobs[0] == range(8)
+    assert len(jobs[-1]) < len(jobs[len(jobs) // 2])
+    covered = [i for job in jobs for i in job]
+    assert covered == [i for i in work if not 100 <= i < 200]
+
+
+def test_probe_rows_go_first_and_hold_back_the_rest():
+    work = range(144)
+    config = make_config(
+        "queue_probe", workers=2, work_distribution="outer_grid", probe_stride=3
+    )
+    queues = QueueHandler(work, len(work), config, grid_sizes_inner=(4, 6, 6))
+    queues.split_work(get_context("spawn"))
+
+    # Rows whose outer levels are both in {0, 3}.
+    probes = [range(4), range(12, 16), range(72, 76), range(84, 88)]
+    assert queues.probe_rows == probes
+    assert [queues.shared_job_q.get(timeout=0.5) for _ in probes] == probes
+    assert queues.probing
+
+    queues.feed(15, 0)
+    assert queues.probing
+
+    queues.feed(16, 0)
+    assert not queues.probing
+    rest = []
+    while rest.count(None) < queues.worker_count:
+        rest.append(queues.shared_job_q.get(timeout=0.5))
+    assert rest[-2:] == [None, None]
+    covered = sorted(i for job in [*probes, *rest[:-2]] for i in job)
+    assert covered == list(work)
@@ -0,0 +1,47 @@
+import numpy as np
+import pyomo.environ as pyo
+
+from pyaugmecon.solver.setup_cache import (
+    SetupEntry,
+    load_setup_entry,
+    model_fingerprint,
+    store_setup_entry,
+)
+from tests.support.factories import make_config
+from tests.support.models import two_objective_model
+
+
+def test_fingerprint_tracks_model_data_and_solver_settings():
+    config = make_config("fingerprint")
+    base = model_fingerprint(two_objective_model(), config)
+    assert model_fingerprint(two_objective_model(), config) == base
+
+    tighter = two_objective_model()
+    tighter.x1.setub(10)
+    assert model_fingerprint(tighter, config) != base
+
+    with_param = two_objective_model()
+    with_param.cap = pyo.Param(initialize=40, mutable=True)
+    with_param.con2.set_value(with_param.x2 <= with_param.cap)
+    before = model_fingerprint(with_param, config)
+    with_param.cap.set_value(30)
+    assert model_fingerprint(with_param, config) != before
+
+    options = make_config("fingerprint", solver_options={"threads": 1})
+    assert model_fingerprint(two_objective_model(), options) != base
+
+
+def test_setup_entry_round_trips_and_ignores_broken_files(tmp_path):
+    path = tmp_path / "cache" / "entry.json"
+    assert load_setup_entry(path) is None
+
+    entry = SetupEntry(np.array([[20.0, 160.0], [8.0, 184.0]]), [1, 1], {1: 0.0})
+    store_setup_entry(path, entry)
+    loaded = load_setup_entry(path)
+    assert loaded is not None
+    assert loaded.payoff.tolist() == entry.payoff.tolist()
+    assert loaded.obj_goal == [1, 1]
+    assert loaded.safe_nadirs == {1: 0.0}
+
+    path.write_text("{")
+    assert load_setup_entry(path) is None
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+import pyaugmecon.solver.worker as worker_module
+from pyaugmecon.solver.worker import (
+    FLAG_SLOTS,
+    FlagTable,
+    _decode_point,
+    _LocalArchive,
+    _SolutionCache,
+    _VisitPlan,
+    skip_typecode,
+)
+
+
+@pytest.mark.parametrize("grid_sizes", [(5,), (4, 3), (3, 2, 4)])
+def test_visit_plan_matches_decode_point(grid_sizes):
+    total = 1
+    for size in grid_sizes:
+        total *= size
+    plan = _VisitPlan(range(2, total), grid_sizes)
+
+    assert [plan.point(idx) for idx in range(2, total)] == [
+        _decode_point(idx, grid_sizes) for idx in range(2, total)
+    ]
+
+
+def test_visit_plan_odometer_handles_forward_jumps(mocker):
+    mocker.patch.object(worker_module, "_VISIT_PLAN_MAX_POINTS", 0)
+    grid_sizes = (4, 3, 2)
+    plan = _VisitPlan(range(1, 24), grid_sizes)
+
+    for idx in (1, 2, 4, 9, 10, 16, 23):
+        assert plan.point(idx) == _decode_point(idx, grid_sizes)
+
+
+def test_local_archive_rejects_covered_points_and_evicts_dominated():
+    archive = _LocalArchive(2)
+
+    assert archive.offer((1.0, 1.0)) == (True, [])
+    assert archive.offer((1.0, 1.0)) == (False, [])
+    assert archive.offer((0.5, 1.0)) == (False, [])
+    assert archive.offer((0.0, 2.0)) == (True, [])
+    assert archive.offer((2.0, 1.0)) == (True, [(1.0, 1.0)])
+    assert archive.offer((1.0, 1.0)) == (False, [])
+
+
+def test_solution_cache_reuses_only_feasible_tighter_solves():
+    cache = _SolutionCache(2, dim_count=2, n_obj=3)
+    cache.store(np.array([1.0, 1.0]), [3.0, 2.0], [9.0, 3.0, 2.0], "x")
+
+    assert cache.lookup(np.array([2.0, 2.0])) == 0
+    assert cache.entry(0) == ([9.0, 3.0, 2.0], "x")
+    # Looser than the cached solve: the old optimum may no longer be optimal.
+    assert cache.lookup(np.array([0.0, 2.0])) is None
+    # Tighter, but the cached solution no longer meets it.
+    assert cache.lookup(np.array([2.0, 2.5])) is None
+
+    cache.store(np.array([0.0, 0.0]), [4.0, 4.0], [1.0, 4.0, 4.0], "y")
+    cache.store(np.array([5.0, 5.0]), [5.0, 5.0], [0.0, 5.0, 5.0], "z")
+    assert cache.lookup(np.array([2.0, 2.0])) == 1
+    assert cache.entry(1)[1] == "y"
+
+
+@pytest.mark.parametrize("typecode", ["B", "H", "Q"])
+def test_flag_table_blocks_harder_outer_cells(typecode):
+    grid_sizes = (5, 3, 2)
+    flags = FlagTable(np.zeros(FlagTable.size(grid_sizes), typecode), grid_sizes)
+
+    flags.block((1, 0), 2)
+
+    # Outer cells (1, 0), (2, 0), (1, 1), (2, 1) are flat cells 1, 2, 4, 5.
+    for cell in (1, 2, 4, 5):
+        assert [flags.skip(cell, i) for i in range(5)] == [0, 0, 3, 2, 1]
+    for cell in (0, 3):
+        assert [flags.skip(cell, i) for i in range(5)] == [0] * 5
+
+
+@pytest.mark.parametrize("typecode", ["B", "H", "Q"])
+def test_flag_table_merges_runs_and_leaves_the_solved_cell(typecode):
+    grid_sizes = (10, 2, 2)
+    flags = FlagTable(np.zeros(FlagTable.size(grid_sizes), typecode), grid_sizes)
+    box = (slice(0, 2), slice(0, 1))
+
+    flags.cover(2, 4, box)
+    flags.cover(4, 6, box)
+    flags.cover(8, 9, box)
+
+    assert [flags.skip(1, i) for i in range(10)] == [0, 0, 4, 3, 2, 1, 0, 0, 1, 0]
+    assert [flags.skip(0, i) for i in range(10)] == [0] * 10
+    assert [flags.skip(2, i) for i in range(10)] == [0] * 10
+
+
+def test_flag_table_replaces_the_shortest_run_when_full():
+    grid_sizes = (4 * FLAG_SLOTS + 4, 2)
+    flags = FlagTable(np.zeros(FlagTable.size(grid_sizes), np.uint64), grid_sizes)
+    box = (slice(0, 2),)
+
+    for start in range(FLAG_SLOTS):
+        flags.cover(4 * start, 4 * start + 1 + (start > 0), box)
+    flags.cover(4 * FLAG_SLOTS + 1, 4 * FLAG_SLOTS + 3, box)
+
+    assert flags.skip(1, 0) == 0
+    assert flags.skip(1, 4) == 2
+    assert flags.skip(1, 4 * FLAG_SLOTS + 1) == 2
+
+
+def test_skip_typecode_picks_the_narrowest_fit():
+    assert skip_typecode(255) == "B"
+    assert skip_typecode(256) == "H"
+    assert skip_typecode(70_000) == "I"
+    assert skip_typecode(15, values_per_cell=2) == "B"
+    assert skip_typecode(255, values_per_cell=2) == "H"
+    assert skip_typecode(65_535, values_per_cell=2) == "I"
+    assert skip_typecode(65_536, values_per_cell=2) == "Q"
+    assert FlagTable.typecode((300, 4)) == "I"
@@ -57,6 +57,31 @@ def test_rejects_invalid_flag_policy():
         PyAugmeconConfig(name="opts_test", flag_policy="bad_value")
 
 
+def test_rejects_unavailable_start_method(monkeypatch):
+    monkeypatch.setattr("pyaugmecon.config.get_all_start_methods", lambda: ["spawn"])
+    with pytest.raises(ValueError, match="start_method='fork'"):
+        PyAugmeconConfig(name="opts_test", start_method="fork")
+
+
+def test_rejects_non_positive_checkpoint_interval():
+    with pytest.raises(ValueError, match="checkpoint_interval"):
+        PyAugmeconConfig(name="opts_test", checkpoint_interval=0)
+
+
+def test_rejects_unknown_artifact_format():
+    with pytest.raises(Exception, match="artifact_formats"):
+        PyAugmeconConfig(name="opts_test", artifact_formats=["xlsx"])
+
+
+def test_write_csv_follows_artifact_formats():
+    dropped = PyAugmeconConfig(
+        name="opts_test", write_csv=False, artifact_formats=["csv", "npz", "npz"]
+    )
+    assert dropped.artifact_formats == ["npz"]
+    assert not PyAugmeconConfig(name="opts_test", artifact_formats=["npz"]).write_csv
+    assert PyAugmeconConfig(name="opts_test").write_csv
+
+
 def test_sample_points_rejects_zero():
     with pytest.raises(ValueError, match="sample_points"):
         PyAugmeconConfig(name="opts_test", mode="sampled", sample_points=0)
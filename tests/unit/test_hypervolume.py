@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from pymoo.indicators.hv import HV
+
+from pyaugmecon.hypervolume import (
+    HypervolumeTracker,
+    hypervolume,
+    hypervolume_contribution,
+)
+
+
+@pytest.mark.parametrize("n_obj", [1, 2, 3, 4, 5])
+@pytest.mark.parametrize("kind", ["grid", "cloud", "front"])
+def test_hypervolume_matches_pymoo(n_obj, kind):
+    rng = np.random.default_rng(n_obj)
+    points = rng.random((60, n_obj))
+    ref = np.full(n_obj, 0.9)
+    if kind == "grid":
+        # Ties, duplicates and points on the reference boundary.
+        points = rng.integers(0, 4, (60, n_obj)).astype(float)
+        ref = np.full(n_obj, 3.0)
+    elif kind == "front":
+        points = points / np.linalg.norm(points, axis=1, keepdims=True)
+        ref = np.full(n_obj, 1.1)
+
+    expected = float(HV(ref_point=ref)(points))
+    assert hypervolume(points, ref) == pytest.approx(expected)
+
+
+def test_hypervolume_of_simple_fronts():
+    ref = np.array([4.0, 4.0])
+    assert hypervolume(np.array([[1.0, 3.0], [3.0, 1.0]]), ref) == 5.0
+    assert hypervolume(np.array([[5.0, 0.0]]), ref) == 0.0
+    assert hypervolume(np.empty((0, 2)), ref) == 0.0
+    with pytest.raises(ValueError, match="shape"):
+        hypervolume(np.array([[1.0, 2.0, 3.0]]), ref)
+
+
+@pytest.mark.parametrize("n_obj", [2, 4])
+def test_contribution_and_tracker_agree_with_full_computation(n_obj):
+    rng = np.random.default_rng(3)
+    points = rng.random((80, n_obj))
+    ref = np.ones(n_obj)
+
+    assert hypervolume_contribution(points[0], points[1:], ref) == pytest.approx(
+        hypervolume(points, ref) - hypervolume(points[1:], ref)
+    )
+
+    tracker = HypervolumeTracker(ref)
+    gained = [tracker.add(chunk) for chunk in np.array_split(points, 5)]
+    assert tracker.value == pytest.approx(hypervolume(points, ref))
+    assert sum(gained) == pytest.approx(tracker.value)
+    assert tracker.add(points[:10]) == 0.0
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from pyaugmecon.kdtree import KDTree
+
+
+@pytest.mark.parametrize("n_obj", [1, 2, 4])
+def test_query_matches_brute_force(n_obj):
+    rng = np.random.default_rng(n_obj)
+    # Rounded so the splits see plenty of ties.
+    points = np.round(rng.random((500, n_obj)), 1)
+    tree = KDTree(points, leaf_size=4)
+
+    for target in rng.random((50, n_obj)):
+        distance, row = tree.query(target)
+        dists = np.linalg.norm(points - target, axis=1)
+        assert distance == pytest.approx(dists.min())
+        assert dists[row] == pytest.approx(dists.min())
+
+
+def test_empty_tree_rejects_queries():
+    with pytest.raises(ValueError, match="empty"):
+        KDTree(np.empty((0, 2))).query(np.zeros(2))
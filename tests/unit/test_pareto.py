@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from pyaugmecon.pareto import ParetoArchive, nondominated_mask
+
+
+def brute_force_mask(points: np.ndarray) -> np.ndarray:
+    """Keep a row unless an earlier equal row or a better row exists."""
+    keep = np.ones(len(points), dtype=bool)
+    for j, point in enumerate(points):
+        for i, other in enumerate(points):
+            covers = i != j and np.all(other >= point)
+            if covers and (np.any(other > point) or i < j):
+                keep[j] = False
+                break
+    return keep
+
+
+@pytest.mark.parametrize("n_obj", [1, 2, 3, 4, 5])
+@pytest.mark.parametrize("kind", ["duplicates", "cloud", "front"])
+def test_nondominated_mask_matches_brute_force(n_obj, kind):
+    rng = np.random.default_rng(n_obj)
+    # 150 points puts the 4+ objective case past its direct-filter size.
+    points = rng.random((150, n_obj))
+    if kind == "duplicates":
+        points = rng.integers(0, 4, (150, n_obj)).astype(float)
+    elif kind == "front":
+        points = np.round(points / points.sum(axis=1, keepdims=True), 2)
+
+    assert np.array_equal(nondominated_mask(points), brute_force_mask(points))
+
+
+def test_nondominated_mask_handles_empty_and_rejects_flat_input():
+    assert nondominated_mask(np.empty((0, 3))).shape == (0,)
+    with pytest.raises(ValueError, match="2-D"):
+        nondominated_mask(np.array([1.0, 2.0]))
+
+
+@pytest.mark.parametrize("n_obj", [2, 3, 4])
+def test_archive_matches_one_shot_filter(n_obj):
+    rng = np.random.default_rng(7)
+    points = np.round(rng.random((400, n_obj)), 1)
+    archive = ParetoArchive(n_obj)
+
+    entered = [archive.insert(chunk) for chunk in np.array_split(points, 9)]
+
+    expected = points[nondominated_mask(points)]
+    assert len(archive) == len(expected)
+    assert {tuple(p) for p in archive.points} == {tuple(p) for p in expected}
+    # A point only enters if nothing inserted before it covers it.
+    assert sum(int(mask.sum()) for mask in entered) >= len(expected)
@@ -1,7 +1,11 @@
+import sys
+
+import numpy as np
 import pytest
 
 import pyaugmecon.results as result_module
 from pyaugmecon import PyAugmeconResult, Solution
+from pyaugmecon.results import ColumnarChunk, SolutionStream
 
 
 def test_result_keeps_pareto_points_and_variables():
@@ -82,3 +86,295 @@ def test_result_rejects_decision_variable_lookup_when_disabled():
 
     with pytest.raises(RuntimeError, match="store_decision_variables"):
         result.variables_for((1.0, 2.0))
+
+
+def test_columnar_chunks_rebuild_variables_lazily():
+    result = PyAugmeconResult.from_worker_chunks(
+        [
+            ColumnarChunk(
+                [Solution((1.0, 2.0)), Solution((0.0, 0.0)), Solution((3.0, 1.0))],
+                np.array([[1.0, 2.0], [0.0, 0.0], [3.0, 4.0]]),
+            )
+        ],
+        sign=(1, -1),
+        payoff_table=[[3.0, 1.0], [1.0, 2.0]],
+        runtime_seconds=0.5,
+        models_solved=3,
+        models_infeasible=0,
+        visited_points=3,
+        grid_point_count=3,
+        decision_variables_stored=True,
+        round_decimals=6,
+        variable_columns=(("x", 0), ("x", 1)),
+    )
+
+    assert result.points == ((1.0, -2.0), (3.0, -1.0))
+    assert result.variable_values is not None
+    assert result.variable_values.shape == (2, 2)
+    assert result.solutions[0].variables == {"x": {0: 1.0, 1: 2.0}}
+    assert result.variables_for((3.0, -1.0)) == {"x": {0: 3.0, 1: 4.0}}
+
+
+def test_columnar_rows_without_values_have_no_variables():
+    result = PyAugmeconResult.from_worker_chunks(
+        [
+            ColumnarChunk([Solution((1.0, 2.0))], np.array([[1.0, 2.0]])),
+            np.array([3.0, 1.0]),
+        ],
+        sign=(1, 1),
+        payoff_table=[[3.0, 1.0], [1.0, 2.0]],
+        runtime_seconds=0.5,
+        models_solved=2,
+        models_infeasible=0,
+        visited_points=2,
+        grid_point_count=2,
+        decision_variables_stored=True,
+        round_decimals=6,
+        variable_columns=(("x", 0), ("x", 1)),
+    )
+
+    assert result.solution_for((3.0, 1.0)).variables is None
+    with pytest.raises(RuntimeError, match="No decision variables are stored"):
+        result.variables_for((3.0, 1.0))
+    assert result.variables_for((1.0, 2.0)) == {"x": {0: 1.0, 1: 2.0}}
+
+
+def test_solution_stream_dedupes_and_filters_dominated_points():
+    stream = SolutionStream(sign=(1, -1), round_decimals=3, nondominated=True)
+
+    first = stream.push([np.array([[1.0, 2.0], [1.0001, 2.0]])])
+    assert [s.point for s in first] == [(1.0, -2.0)]
+
+    second = stream.push(
+        [[Solution((0.5, 1.0)), Solution((2.0, 2.0)), Solution((0.0, 5.0))]]
+    )
+    # (0.5, 1.0) is dominated; (1.0, 2.0) was already passed on.
+    assert [s.point for s in second] == [(2.0, -2.0), (0.0, -5.0)]
+    assert stream.push([[Solution((1.0, 1.0))]]) == []
+
+
+def test_solution_stream_expands_columnar_rows():
+    stream = SolutionStream(
+        sign=(1, 1), round_decimals=6, variable_columns=(("x", 0), ("x", 1))
+    )
+    chunk = ColumnarChunk([Solution((1.0, 2.0))], np.array([[3.0, 4.0]]))
+
+    (solution,) = stream.push([chunk])
+    assert solution.variables == {"x": {0: 3.0, 1: 4.0}}
+
+
+def _front_result(**overrides) -> PyAugmeconResult:
+    chunks = overrides.pop(
+        "chunks",
+        [
+            [
+                Solution((float(i), float(100 - i)), {"x": {0: float(i)}})
+                for i in range(100)
+            ]
+        ],
+    )
+    defaults = {
+        "sign": (1, 1),
+        "payoff_table": [[99.0, 1.0], [0.0, 100.0]],
+        "runtime_seconds": 0.5,
+        "models_solved": 100,
+        "models_infeasible": 0,
+        "visited_points": 100,
+        "grid_point_count": 100,
+        "decision_variables_stored": True,
+        "round_decimals": 6,
+    }
+    return PyAugmeconResult.from_worker_chunks(chunks, **(defaults | overrides))
+
+
+def test_point_lookups_use_index_and_tree():
+    result = _front_result()
+
+    assert result.points_array.shape == (100, 2)
+    assert not result.points_array.flags.writeable
+    assert result.solution_for((42.0, 58.0)).variables == {"x": {0: 42.0}}
+    assert result.variables_for([7, 93]) == {"x": {0: 7.0}}
+    with pytest.raises(ValueError, match="not found"):
+        result.solution_for((42.5, 57.5))
+
+    assert result.nearest((42.2, 57.9)).point == (42.0, 58.0)
+    assert result.nearest((42.2, 57.9), tol=0.5).point == (42.0, 58.0)
+    with pytest.raises(ValueError, match="No solution within"):
+        result.nearest((42.5, 60.0), tol=0.5)
+
+
+def test_variable_matrix_fills_missing_values_with_nan():
+    result = _front_result(
+        chunks=[
+            [
+                Solution((1.0, 2.0), {"x": {0: 1.0}}),
+                Solution((2.0, 1.0), {"y": {"a": 3.0}}),
+            ]
+        ]
+    )
+
+    columns, values = result.variable_matrix()
+    assert columns == (("x", 0), ("y", "a"))
+    assert np.array_equal(values, [[1.0, np.nan], [np.nan, 3.0]], equal_nan=True)
+
+
+def test_variables_frame_needs_pandas(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pandas", None)
+    with pytest.raises(RuntimeError, match="pandas"):
+        _front_result().variables_frame()
+
+
+def test_variables_frame_matches_columnar_values():
+    pd = pytest.importorskip("pandas")
+    result = _front_result(
+        chunks=[
+            ColumnarChunk(
+                [Solution((1.0, 2.0)), Solution((2.0, 1.0))],
+                np.array([[1.0, 2.0], [3.0, 4.0]]),
+            )
+        ],
+        variable_columns=(("x", 0), ("x", 1)),
+    )
+
+    frame = result.variables_frame()
+    assert isinstance(frame, pd.DataFrame)
+    assert frame[("x", 1)].tolist() == [2.0, 4.0]
+
+
+def test_result_stores_columns_and_builds_solution_views():
+    result = _front_result()
+
+    assert result.points_array.flags.f_contiguous
+    assert result.variable_records is not None
+    assert result.variable_records[3] == {"x": {0: 3.0}}
+    assert result.solutions[3] == Solution((3.0, 97.0), {"x": {0: 3.0}})
+    assert result.solutions is result.solutions
+    assert result.points is result.points
+
+
+def test_to_npz_writes_points_and_labelled_variables(tmp_path):
+    result = _front_result(
+        chunks=[
+            [
+                Solution((1.0, 2.0), {"x": {(0, "a"): 1.0}, "y": {None: 5.0}}),
+                Solution((2.0, 1.0), {"x": {(0, "a"): 3.0}}),
+            ]
+        ]
+    )
+
+    path = tmp_path / "front.npz"
+    result.to_npz(path)
+    with np.load(path) as data:
+        assert np.array_equal(data["points"], result.points_array)
+        assert np.array_equal(data["payoff_table"], result.payoff_table)
+        assert data["variable_labels"].tolist() == ["x[0,a]", "y"]
+        assert np.array_equal(
+            data["variable_values"], [[1.0, 5.0], [3.0, np.nan]], equal_nan=True
+        )
+
+
+def test_to_arrow_needs_pyarrow(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(RuntimeError, match="pyarrow"):
+        _front_result().to_arrow()
+
+
+def test_to_arrow_and_parquet_share_columns(tmp_path):
+    pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    result = _front_result()
+
+    table = result.to_arrow()
+    assert table.column_names == ["objective_1", "objective_2", "x[0]"]
+    assert table.column("objective_2").to_pylist()[:2] == [100.0, 99.0]
+
+    path = tmp_path / "front.parquet"
+    result.to_parquet(path)
+    assert pq.read_table(path).equals(table)
+
+
+def test_from_worker_chunks_stacks_mixed_chunks():
+    result = _front_result(
+        chunks=[
+            np.array([[1.0, 3.0], [2.0000001, 2.0]]),
+            ColumnarChunk(
+                [Solution((2.0, 2.0)), Solution((3.0, 1.0))],
+                np.array([[5.0, 6.0], [7.0, 8.0]]),
+            ),
+        ],
+        variable_columns=(("x", 0), ("x", 1)),
+    )
+
+    assert result.points == ((1.0, 3.0), (2.0, 2.0), (3.0, 1.0))
+    assert result.total_points == 3
+    # (2.0, 2.0) first arrived as a bare point, so it has no variable row.
+    assert np.array_equal(
+        result.variable_values,
+        [[np.nan, np.nan], [np.nan, np.nan], [7.0, 8.0]],
+        equal_nan=True,
+    )
+    assert result.variable_values.flags.f_contiguous
+    assert result.finalize_seconds >= 0.0
+
+
+def test_from_worker_chunks_without_points():
+    result = _front_result(chunks=[np.empty((0, 2)), []])
+
+    assert result.points_array.shape == (0, 2)
+    assert result.count == result.total_points == 0
+    assert result.variable_records == ()
+    assert result.hypervolume() == 0.0
+
+
+def test_result_accepts_solutions_keyword():
+    result = PyAugmeconResult(
+        solutions=[
+            Solution((1.0, 2.0), {"x": {0: 1.0}}),
+            Solution((3.0, 1.0), {"x": {0: 3.0}}),
+        ],
+        payoff_table=np.array([[3.0, 1.0], [1.0, 2.0]]),
+        runtime_seconds=1.0,
+        models_solved=2,
+        models_infeasible=0,
+        visited_points=2,
+        grid_point_count=2,
+        decision_variables_stored=True,
+        total_points=2,
+    )
+
+    assert result.points == ((1.0, 2.0), (3.0, 1.0))
+    assert result.points_array.flags.f_contiguous
+    assert result.count == 2
+    assert result.variables_for((3.0, 1.0)) == {"x": {0: 3.0}}
+    assert result.solutions[0] == Solution((1.0, 2.0), {"x": {0: 1.0}})
+
+    with pytest.raises(TypeError, match="not both"):
+        PyAugmeconResult(
+            np.zeros((0, 2)),
+            solutions=[],
+            payoff_table=np.eye(2),
+            runtime_seconds=0.0,
+            models_solved=0,
+            models_infeasible=0,
+            visited_points=0,
+            grid_point_count=0,
+            decision_variables_stored=False,
+            total_points=0,
+        )
+
+
+def test_result_accepts_empty_solutions():
+    result = PyAugmeconResult(
+        solutions=(),
+        payoff_table=np.eye(2),
+        runtime_seconds=0.0,
+        models_solved=0,
+        models_infeasible=0,
+        visited_points=0,
+        grid_point_count=0,
+        decision_variables_stored=False,
+        total_points=0,
+    )
+
+    assert result.points_array.shape == (0, 2)
+    assert result.solutions == ()